@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark the SQLite application store at tenant scale: list latency (first page, a page deep
+in the cursor chain, status filter, due follow-ups), counts, and single-application writes.
+
+Usage:
+    uv run python scripts/bench_application_store.py --applications 100000 --tenants 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from proximaai.data.application_store import APPLICATION_FIELDS, SQLiteApplicationStore, new_application_id
+
+STATUSES = ["applied"] * 6 + ["interview"] * 2 + ["offer", "rejected", "withdrawn"]
+
+
+def seed(store: SQLiteApplicationStore, tenants: int, applications: int):
+    rng = random.Random(5)
+    conn = store._connect()
+    with conn:
+        for tenant in range(tenants):
+            conn.executemany(
+                f"INSERT INTO applications (user_id, {', '.join(APPLICATION_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((f"user-{tenant}", f"job_{i:012x}{rng.getrandbits(80):020x}", f"Company{rng.randrange(5000)}",
+                  "Data Scientist", "2025-01-01", rng.choice(STATUSES),
+                  f"2025-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}" if rng.random() < 0.3 else None, "")
+                 for i in range(applications))
+            )
+        conn.execute("INSERT INTO application_status_counts SELECT user_id, status, count(*) FROM applications "
+                     "GROUP BY user_id, status")
+    conn.execute("ANALYZE")
+
+
+async def timed(label: str, repeats: int, call):
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    print(f"{label:>22}: p50={statistics.median(latencies) * 1000:6.2f}ms p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:6.2f}ms")
+
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteApplicationStore(os.path.join(directory, "applications.db"))
+        start = time.perf_counter()
+        seed(store, args.tenants, args.applications)
+        print(f"seeded {args.tenants} x {args.applications} applications in {time.perf_counter() - start:.1f}s")
+
+        cursor = None
+        for _ in range(200):  # walk 200 pages in to time a deep page
+            _, cursor = await store.list("user-0", limit=50, cursor=cursor)
+
+        await timed("list first page", args.repeats, lambda: store.list("user-0", limit=50))
+        await timed("list page 200", args.repeats, lambda: store.list("user-0", limit=50, cursor=cursor))
+        await timed("list status=offer", args.repeats, lambda: store.list("user-0", status="offer", limit=50))
+        await timed("list due_before", args.repeats, lambda: store.list("user-0", due_before="2025-06-30", limit=50))
+        await timed("count status=interview", args.repeats, lambda: store.count("user-0", status="interview"))
+        await timed("count all", args.repeats, lambda: store.count("user-0"))
+        application = {"job_id": "", "company": "Acme", "position": "Actuary", "applied_date": "2025-03-01",
+                       "status": "applied", "follow_up_date": None, "notes": ""}
+        await timed("add", args.repeats, lambda: store.add("user-0", dict(application, job_id=new_application_id())))
+        job_id = (await store.list("user-0", limit=1))[0][0]["job_id"]
+        await timed("update", args.repeats, lambda: store.update("user-0", job_id, notes=f"{time.time()}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applications", type=int, default=100000, help="applications per tenant")
+    parser.add_argument("--tenants", type=int, default=3)
+    parser.add_argument("--repeats", type=int, default=200)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
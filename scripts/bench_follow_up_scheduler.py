@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark the follow-up scheduler at scale on a simulated clock: bulk load time and memory for
+N pending follow-ups, incremental schedule() throughput, and how fast a day's worth of due items
+drains through the batching worker.
+
+Usage:
+    uv run python scripts/bench_follow_up_scheduler.py --follow-ups 1000000
+"""
+
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from proximaai.data.application_store import new_application_id
+from proximaai.data.follow_up_scheduler import FollowUpScheduler, SimulatedClock, due_at
+
+DAY = 86400.0
+
+
+async def run(args):
+    rng = random.Random(1)
+    start_day = date(2025, 3, 1)
+    users = [f"user-{i}" for i in range(args.follow_ups // 100 or 1)]
+    rows = [(rng.choice(users), (start_day + timedelta(days=rng.randrange(args.days))).isoformat(), new_application_id())
+            for _ in range(args.follow_ups)]
+
+    clock = SimulatedClock(start=due_at(start_day.isoformat()) - 1)
+    fired = 0
+
+    async def handler(batch):
+        nonlocal fired
+        fired += len(batch)
+
+    def make_scheduler():
+        return FollowUpScheduler(handler, batch_size=args.batch_size, clock=clock.time, sleep=clock.sleep)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    measured = make_scheduler()
+    measured.load(rows)
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del measured
+
+    scheduler = make_scheduler()
+    started = time.perf_counter()
+    scheduler.load(rows)
+    load_seconds = time.perf_counter() - started
+    print(f"bulk load {len(scheduler):,} follow-ups: {load_seconds:.2f}s, "
+          f"{memory / 1e6:.0f} MB ({memory / len(scheduler):.0f} B/item)")
+
+    started = time.perf_counter()
+    for _ in range(args.incremental):
+        scheduler.schedule(rng.choice(users), new_application_id(), (start_day + timedelta(days=rng.randrange(args.days))).isoformat())
+    print(f"schedule(): {args.incremental / (time.perf_counter() - started):,.0f}/s with {len(scheduler):,} pending")
+
+    async def drain():
+        # the worker yields between batches; keep the loop turning until nothing due is left
+        while scheduler.metrics()["next_due_at"] is not None and scheduler.metrics()["next_due_at"] <= clock.time():
+            await clock.settle()
+
+    scheduler.start()
+    started = time.perf_counter()
+    for day in range(args.days):
+        await clock.advance(DAY if day else 1)
+        await drain()
+    elapsed = time.perf_counter() - started
+    print(f"{args.days} days: fired {fired:,} in {scheduler.batches:,} batches, {elapsed:.2f}s "
+          f"({fired / elapsed:,.0f}/s); metrics {scheduler.metrics()}")
+    await scheduler.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--follow-ups", type=int, default=1000000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--incremental", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark JobAnalyzerTool.analyze_batch throughput (postings/sec) against the per-posting `_run`
+loop, and its scaling with worker processes (speedup and parallel efficiency vs 1 worker).
+Also measures the parent-side serial work (reading postings, pickling chunks, unpickling result
+lines) to give the Amdahl's-law speedup bound on machines with more cores than this one.
+
+Usage:
+    uv run python scripts/bench_job_analyzer_batch.py --postings 20000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import pickle
+import random
+import time
+
+from proximaai.tools.job_search import JobAnalyzerTool, _analyze_chunk, _posting_fields
+from proximaai.tools.skill_taxonomy import SKILL_TAXONOMY
+
+SENTENCES = [
+    "Requirements: {a} and {b}.", "Must have: {a}.", "Preferred: {a}, {b}.", "Nice to have: {b}.",
+    "We value {a} and {b}.", "Compensation: $120,000 - $160,000 plus bonus.", "You will own {a} end to end.",
+    "Our team works with {a} every day.", "Senior candidates with 5+ years of {b} stand out.",
+]
+
+
+def synthetic_postings(count: int, sentences: int = 40, seed: int = 7):
+    rng = random.Random(seed)
+    vocabulary = [keyword for keywords in SKILL_TAXONOMY.values() for keyword in keywords]
+    for i in range(count):
+        body = " ".join(rng.choice(SENTENCES).format(a=rng.choice(vocabulary), b=rng.choice(vocabulary))
+                        for _ in range(sentences))
+        yield {"id": f"posting-{i}", "text": f"Job {i}\n{body}"}
+
+
+def serial_seconds(postings: list[dict], chunk_size: int) -> float:
+    """Time the work analyze_batch keeps in the parent process, excluding the analysis itself."""
+    result = pickle.dumps(_analyze_chunk([_posting_fields(i, p) for i, p in enumerate(postings[:chunk_size])]))
+    start = time.perf_counter()
+    chunk = []
+    for i, posting in enumerate(postings):
+        chunk.append(_posting_fields(i, posting))
+        if len(chunk) == chunk_size:
+            pickle.dumps(chunk)
+            pickle.loads(result)
+            chunk = []
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--chunk-size", type=int, default=256)
+    args = parser.parse_args()
+
+    tool = JobAnalyzerTool()
+    postings = list(synthetic_postings(args.postings))  # generated up front so only the analysis is timed
+    print(f"cpus={os.cpu_count()} postings={args.postings}")
+
+    start = time.perf_counter()
+    for posting in postings:
+        tool._run(posting["text"])
+    baseline = args.postings / (time.perf_counter() - start)
+    print(f"_run loop (indent=2): {baseline:8,.0f} postings/s")
+
+    serial = serial_seconds(postings, args.chunk_size)
+    single = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        output_bytes = sum(len(line) + 1 for line in tool.analyze_batch(
+            postings, max_workers=workers, chunk_size=args.chunk_size))
+        rate = args.postings / (time.perf_counter() - start)
+        single = single or rate
+        print(f"analyze_batch workers={workers:>2}: {rate:8,.0f} postings/s  speedup {rate / single:4.2f}x  "
+              f"efficiency {rate / single / workers:4.0%}  ndjson {output_bytes / args.postings:,.0f} B/posting")
+
+    serial_fraction = serial * single / args.postings
+    print(f"parent-side serial fraction {serial_fraction:.1%}: Amdahl speedup bound "
+          + "  ".join(f"{n} cores {1 / (serial_fraction + (1 - serial_fraction) / n):.1f}x" for n in (4, 8, 16, 32)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental feed ingestion: an initial load of a large JSONL feed, a re-ingest of the
+unchanged feed, and a re-ingest after editing 1% of postings, reposting 0.5% under new ids and
+adding 0.5% new ones. Reports throughput and what each pass wrote.
+
+Usage:
+    uv run python scripts/bench_job_feeds.py --postings 500000
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from bench_job_index import synthetic_postings
+from proximaai.tools.job_feeds import ingest_feeds
+from proximaai.tools.job_index import JobIndex
+
+
+def write_feed(path: str, postings):
+    with open(path, "w") as f:
+        for posting in postings:
+            f.write(json.dumps(posting) + "\n")
+
+
+def timed_ingest(label: str, directory: str, index: JobIndex, count: int):
+    start = time.perf_counter()
+    stats = ingest_feeds(directory, index)
+    seconds = time.perf_counter() - start
+    print(f"{label:>10}: {seconds:6.1f}s ({count / seconds:8,.0f} rows/s)  inserted={stats.inserted} "
+          f"updated={stats.updated} unchanged={stats.unchanged} duplicates={stats.duplicates} "
+          f"near_duplicates={stats.near_duplicates}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=500000)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    postings = list(synthetic_postings(args.postings))
+    with tempfile.TemporaryDirectory() as directory:
+        feeds = os.path.join(directory, "feeds")
+        os.makedirs(feeds)
+        feed = os.path.join(feeds, "board.jsonl")
+        index = JobIndex(os.path.join(directory, "jobs.db"))
+
+        write_feed(feed, postings)
+        timed_ingest("initial", feeds, index, len(postings))
+        timed_ingest("unchanged", feeds, index, len(postings))
+
+        delta = max(1, args.postings // 200)
+        for posting in rng.sample(postings, 2 * delta):
+            posting["description"] += " Updated benefits."
+        reposts = [dict(posting, id=f"{posting['id']}-repost", description=posting["description"] + " Apply today.")
+                   for posting in rng.sample(postings, delta)]
+        new = [dict(posting, id=f"new-{i}") for i, posting in enumerate(synthetic_postings(delta, seed=99))]
+        write_feed(feed, postings + reposts + new)
+        timed_ingest("deltas", feeds, index, len(postings) + 2 * delta)
+
+
+if __name__ == "__main__":
+    main()
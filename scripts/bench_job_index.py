@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local JobIndex: bulk JSONL ingest rate and query latency (p50/p95/p99) at scale for
+the query shapes JobSearchTool issues (title search, title + filters, free text, filter-only, paging).
+
+Usage:
+    uv run python scripts/bench_job_index.py --postings 1000000 --queries 500
+"""
+
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from proximaai.tools.job_index import JobIndex
+
+SENIORITY = ["", "Junior", "Senior", "Staff", "Principal", "Lead"]
+ROLES = ["Software Engineer", "Data Scientist", "Data Engineer", "Product Manager", "Designer", "DevOps Engineer",
+         "Machine Learning Engineer", "Backend Developer", "Frontend Developer", "Security Analyst", "QA Engineer",
+         "Site Reliability Engineer", "Solutions Architect", "Engineering Manager", "Technical Writer",
+         "Actuary", "Claims Adjuster", "Underwriter", "Account Executive", "Recruiter", "Nurse", "Accountant"]
+SPECIALTIES = ["", "Payments", "Platform", "Growth", "Infrastructure", "Mobile", "Analytics", "Pricing", "Search"]
+CITIES = [f"City{i}" for i in range(300)] + ["San Francisco, CA", "New York, NY", "Austin, TX", "Remote"]
+JOB_TYPES = ["full_time", "part_time", "contract", "internship"]
+
+
+def synthetic_postings(count: int, vocab_size: int = 20000, words: int = 80, seed: int = 7):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(vocab_size)]
+    cumulative_weights = list(itertools.accumulate(1 / rank for rank in range(1, vocab_size + 1)))
+    for i in range(count):
+        title = " ".join(part for part in [rng.choice(SENIORITY), rng.choice(ROLES), rng.choice(SPECIALTIES)] if part)
+        yield {
+            "id": f"job-{i}",
+            "title": title,
+            "company": f"Company{rng.randrange(5000)}",
+            "location": rng.choice(CITIES),
+            "description": f"{title} " + " ".join(rng.choices(vocab, cum_weights=cumulative_weights, k=words)),
+            "requirements": [rng.choice(vocab) for _ in range(3)],
+            "job_type": rng.choices(JOB_TYPES, weights=[80, 5, 12, 3])[0],
+            "remote_option": rng.random() < 0.3,
+            "posted_date": f"2025-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}",
+            "source": "bench",
+        }
+
+
+def query_mix(count: int, seed: int = 11) -> list[tuple[str, dict]]:
+    rng = random.Random(seed)
+    shapes = [
+        ("title", lambda: {"title": f"{rng.choice(SENIORITY[1:])} {rng.choice(ROLES)}"}),
+        ("title+filters", lambda: {"title": rng.choice(ROLES), "remote_only": True, "job_type": "full_time"}),
+        ("title+location", lambda: {"title": rng.choice(ROLES), "location": rng.choice(CITIES)}),
+        ("query", lambda: {"query": f"{rng.choice(ROLES).split()[0]} w{rng.randrange(50, 2000)}"}),
+        ("company", lambda: {"company": f"Company{rng.randrange(5000)}"}),
+        ("title page 5", lambda: {"title": rng.choice(ROLES), "offset": 40}),
+    ]
+    return [(name, make()) for name, make in (rng.choice(shapes) for _ in range(count))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=1000000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--db", help="Reuse (or build and keep) the index at this path instead of a temporary one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = JobIndex(args.db or os.path.join(directory, "jobs.db"))
+        if index.count() == 0:
+            feed = os.path.join(directory, "feed.jsonl")
+            with open(feed, "w") as f:
+                for posting in synthetic_postings(args.postings):
+                    f.write(json.dumps(posting) + "\n")
+
+            start = time.perf_counter()
+            index.ingest_jsonl(feed)
+            ingest_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            index.optimize()
+            print(f"ingested {args.postings} postings in {ingest_seconds:.1f}s ({args.postings / ingest_seconds:,.0f}/s), "
+                  f"optimize {time.perf_counter() - start:.1f}s, db {os.path.getsize(index.db_path) / 1e6:.0f} MB")
+
+        queries = query_mix(args.queries)
+        for _, criteria in queries[:50]:
+            index.search(k=args.k, **criteria)  # warm the page cache
+        latencies: dict[str, list[float]] = {}
+        for name, criteria in queries:
+            start = time.perf_counter()
+            index.search(k=args.k, **criteria)
+            latencies.setdefault(name, []).append(time.perf_counter() - start)
+
+        everything = sorted(itertools.chain.from_iterable(latencies.values()))
+        for name, values in sorted(latencies.items()) + [("all", everything)]:
+            values.sort()
+            print(f"{name:>15}: n={len(values):>4} p50={statistics.median(values) * 1000:6.2f}ms "
+                  f"p95={values[int(len(values) * 0.95) - 1] * 1000:6.2f}ms p99={values[int(len(values) * 0.99) - 1] * 1000:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
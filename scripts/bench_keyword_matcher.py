@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark keyword extraction over synthetic job postings: the previous per-keyword substring
+scans (one `in text_lower` per keyword and analysis) against the shared one-pass KeywordMatcher.
+`--extra-skills` grows the taxonomy to show how each approach scales with vocabulary size.
+
+Usage:
+    uv run python scripts/bench_keyword_matcher.py --postings 10000 --extra-skills 0 1000
+"""
+
+import argparse
+import random
+import time
+
+from proximaai.tools.keyword_matcher import KeywordMatcher
+from proximaai.tools.skill_taxonomy import KEYWORD_ALIASES, SKILL_TAXONOMY
+
+FILLER = ("we are looking for an engineer to join our team and build products that customers love "
+          "you will work closely with design and product to ship features every week").split()
+
+
+def synthetic_postings(count: int, words: int = 400, seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    vocabulary = [keyword for keywords in SKILL_TAXONOMY.values() for keyword in keywords]
+    postings = []
+    for _ in range(count):
+        tokens = [rng.choice(vocabulary) if rng.random() < 0.05 else rng.choice(FILLER) for _ in range(words)]
+        postings.append(" ".join(tokens).capitalize() + ".")
+    return postings
+
+
+def extended_taxonomy(extra_skills: int) -> dict[str, list[str]]:
+    taxonomy = {category: list(keywords) for category, keywords in SKILL_TAXONOMY.items()}
+    taxonomy["technical_skills"] += [f"framework{i}" if i % 2 else f"platform {i}" for i in range(extra_skills)]
+    return taxonomy
+
+
+def legacy_extractor(taxonomy: dict[str, list[str]]):
+    """Substring loops as the analyzers ran them: each analysis lowercases and scans per keyword."""
+    def extract(text: str) -> dict[str, list[str]]:
+        found = {}
+        for category, keywords in taxonomy.items():
+            text_lower = text.lower()
+            found[category] = [keyword for keyword in keywords if keyword in text_lower]
+        return found
+    return extract
+
+
+def run(extract, postings: list[str]) -> float:
+    start = time.perf_counter()
+    for text in postings:
+        extract(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--postings", type=int, default=10000)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--extra-skills", type=int, nargs="+", default=[0, 1000])
+    args = parser.parse_args()
+
+    postings = synthetic_postings(args.postings, args.words)
+    megabytes = sum(len(text) for text in postings) / 1e6
+    for extra_skills in args.extra_skills:
+        taxonomy = extended_taxonomy(extra_skills)
+        start = time.perf_counter()
+        matcher = KeywordMatcher(taxonomy, KEYWORD_ALIASES)
+        build_ms = (time.perf_counter() - start) * 1000
+        size = sum(len(keywords) for keywords in taxonomy.values())
+        print(f"taxonomy: {size} keywords (matcher built in {build_ms:.0f}ms)")
+        for name, extract in [("substring", legacy_extractor(taxonomy)), ("matcher", matcher.categorize)]:
+            seconds = run(extract, postings)
+            print(f"  {name:>9}: {seconds:6.2f}s  {args.postings / seconds:8,.0f} postings/s  {megabytes / seconds:6.1f} MB/s")
+
+        hits = sum(len(matcher.find_all(text)) for text in postings[:1000])
+        print(f"  matcher hits with offsets: {hits / min(1000, len(postings)):.1f} per posting")
+
+
+if __name__ == "__main__":
+    main()
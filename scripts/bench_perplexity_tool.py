@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark PerplexityWebSearchTool throughput against a local mock Perplexity server:
+a new httpx.Client per query run on worker threads (previous behaviour, which is what
+BaseTool.ainvoke did with a sync-only `_run`) versus the native pooled `_arun`.
+
+The mock server runs in a subprocess and answers every request after `--latency-ms`. Rate limiting
+is disabled so the numbers show transport overhead only. Plain http:// is used, so connections are
+HTTP/1.1 keep-alive; HTTP/2 is only negotiated over TLS against the real API.
+
+Usage:
+    uv run python scripts/bench_perplexity_tool.py --concurrency 1 10 100 --queries 200
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+
+def mock_app(latency: float) -> Starlette:
+    async def completions(request):
+        await request.json()
+        await asyncio.sleep(latency)
+        return JSONResponse({
+            "choices": [{"message": {"content": "Mock answer about the company."}}],
+            "citations": ["https://example.com/about"],
+        })
+
+    return Starlette(routes=[Route("/chat/completions", completions, methods=["POST"])])
+
+
+def serve(port: int, latency: float) -> None:
+    uvicorn.run(mock_app(latency), host="127.0.0.1", port=port, log_level="warning", backlog=2048)
+
+
+def start_server(latency_ms: float) -> tuple[subprocess.Popen, str]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = subprocess.Popen([sys.executable, __file__, "--serve", str(port), "--latency-ms", str(latency_ms)])
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}/chat/completions"
+
+
+def legacy_search(url: str, query: str) -> str:
+    """The previous `_run`: a fresh client (and connection) per query."""
+    with httpx.Client() as client:
+        response = client.post(url, headers={"Authorization": "Bearer bench"},
+                               json={"model": "sonar-pro", "messages": [{"role": "user", "content": query}]}, timeout=30)
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+
+
+async def run_legacy(url: str, concurrency: int, queries: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await asyncio.to_thread(legacy_search, url, f"query {i}")
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[one(i) for i in range(queries)])
+    return latencies
+
+
+async def run_pooled(concurrency: int, queries: int) -> list[float]:
+    from proximaai.tools.perplexity_search import PerplexityWebSearchTool
+    from proximaai.utils.rate_limit import TokenBucket
+
+    tool = PerplexityWebSearchTool(api_key="bench", rate_limiter=TokenBucket(rate=0))
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            result = await tool._arun(f"query {i}")
+            assert not result.startswith("Error"), result
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[one(i) for i in range(queries)])
+    return latencies
+
+
+def report(label: str, concurrency: int, elapsed: float, latencies: list[float]):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<7} concurrency={concurrency:>3} throughput={len(latencies) / elapsed:8.1f} q/s "
+          f"p50={statistics.median(latencies) * 1000:7.1f}ms p95={p95 * 1000:7.1f}ms")
+
+
+async def bench(args: argparse.Namespace):
+    server, url = start_server(args.latency_ms)
+    # Must be set before the tool module reads it
+    os.environ["PERPLEXITY_API_URL"] = url
+    os.environ.setdefault("PERPLEXITY_MAX_CONNECTIONS", "100")
+    os.environ.setdefault("PERPLEXITY_MAX_KEEPALIVE_CONNECTIONS", "100")
+    try:
+        for concurrency in args.concurrency:
+            start = time.perf_counter()
+            latencies = await run_legacy(url, concurrency, args.queries)
+            report("legacy", concurrency, time.perf_counter() - start, latencies)
+
+            start = time.perf_counter()
+            latencies = await run_pooled(concurrency, args.queries)
+            report("pooled", concurrency, time.perf_counter() - start, latencies)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--serve", type=int, metavar="PORT", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.latency_ms / 1000)
+        return
+
+    asyncio.run(bench(args))
+
+
+if __name__ == "__main__":
+    main()
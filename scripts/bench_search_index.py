@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark the offline SQLiteSearchBackend: bulk indexing rate and query throughput (queries/sec)
+on a synthetic crawled-page corpus, single-threaded and with concurrent reader threads.
+
+Usage:
+    uv run python scripts/bench_search_index.py --docs 100000 --queries 2000 --threads 1 4
+"""
+
+import argparse
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from proximaai.tools.search_backends import SQLiteSearchBackend
+
+COMPANIES = ["geico", "stripe", "acme", "globex", "initech", "umbrella", "hooli", "vandelay", "wonka", "cyberdyne"]
+TOPICS = ["culture", "careers", "benefits", "engineering", "insurance", "payments", "earnings", "layoffs",
+          "hiring", "remote", "python", "kubernetes", "data", "science", "security", "mission", "values"]
+
+
+def synthetic_corpus(docs: int, vocab_size: int = 20000, words_per_doc: int = 300, seed: int = 7):
+    """Pages whose body words follow a Zipf distribution, as in natural-language text."""
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(vocab_size)]
+    cumulative_weights = list(itertools.accumulate(1 / rank for rank in range(1, vocab_size + 1)))
+    for i in range(docs):
+        company = rng.choice(COMPANIES)
+        topic = rng.choice(TOPICS)
+        body = " ".join(rng.choices(vocab, cum_weights=cumulative_weights, k=words_per_doc))
+        yield {
+            "url": f"https://{company}.example.com/{topic}/{i}",
+            "title": f"{company.title()} {topic} page {i}",
+            "body": f"{company} {topic} {body}",
+        }
+
+
+def synthetic_queries(count: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    return [f"{rng.choice(COMPANIES)} {rng.choice(TOPICS)}" + (f" {rng.choice(TOPICS)}" if rng.random() < 0.5 else "")
+            for _ in range(count)]
+
+
+def run_queries(index: SQLiteSearchBackend, queries: list[str], threads: int, k: int) -> tuple[float, list[float]]:
+    def one(query: str) -> float:
+        start = time.perf_counter()
+        index.search(query, k)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(one, queries))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = SQLiteSearchBackend(os.path.join(directory, "bench.db"))
+
+        start = time.perf_counter()
+        index.index_documents(synthetic_corpus(args.docs))
+        index_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        index.optimize()
+        optimize_seconds = time.perf_counter() - start
+        print(f"indexed {args.docs} docs in {index_seconds:.1f}s ({args.docs / index_seconds:,.0f} docs/s), "
+              f"optimize {optimize_seconds:.1f}s, db {os.path.getsize(index.db_path) / 1e6:.0f} MB")
+
+        queries = synthetic_queries(args.queries)
+        run_queries(index, queries[:100], 1, args.k)  # warm the page cache
+        for threads in args.threads:
+            elapsed, latencies = run_queries(index, queries, threads, args.k)
+            latencies.sort()
+            print(f"threads={threads:>2} qps={len(queries) / elapsed:8.1f} "
+                  f"p50={statistics.median(latencies) * 1000:6.2f}ms p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:6.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark buffered (`response.text` + parse_sse_json) versus streaming (MCPCommunication.request)
+parsing of large MCP tool responses, reporting latency and peak Python heap (tracemalloc).
+
+Usage:
+    uv run python scripts/bench_sse_parser.py --sizes 1 5 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+import httpx
+
+from proximaai.mcp.mcp_client import MCPCommunication
+
+CHUNK_SIZE = 64 * 1024
+
+
+def synthetic_sse_body(size_mb: int, progress_events: int = 20) -> bytes:
+    """A parsed-document style result of roughly `size_mb` MB, preceded by progress notifications."""
+    events = [
+        {"jsonrpc": "2.0", "method": "notifications/progress", "params": {"progress": i, "total": progress_events}}
+        for i in range(progress_events)
+    ]
+    text = ("Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20 + "\n") * (size_mb * 1024 * 1024 // 1141)
+    events.append({"jsonrpc": "2.0", "id": 2, "result": {"content": [{"type": "text", "text": text}]}})
+    return "".join(f"event: message\ndata: {json.dumps(event)}\n\n" for event in events).encode("utf-8")
+
+
+class ChunkedStream(httpx.AsyncByteStream):
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def __aiter__(self):
+        for start in range(0, len(self.body), CHUNK_SIZE):
+            yield self.body[start:start + CHUNK_SIZE]
+
+
+def make_client(body: bytes) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, stream=ChunkedStream(body))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def buffered(client: MCPCommunication, data: dict):
+    response = await client.client.post(client.mcp_server_url, json=data)  # type: ignore[union-attr]
+    return MCPCommunication.parse_sse_json(response.text)
+
+
+async def streaming(client: MCPCommunication, data: dict):
+    return await client.request(data=data)
+
+
+async def measure(label: str, fn, body: bytes) -> None:
+    client = MCPCommunication(mcp_server_url="http://mcp.local/parse_document/mcp", client=make_client(body))
+    data = {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {}}
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = await fn(client, data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert result is not None
+    print(f"{label:<10} body={len(body) / 1e6:7.1f}MB time={elapsed * 1000:8.1f}ms peak_heap={peak / 1e6:8.1f}MB")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 5, 20])
+    args = parser.parse_args()
+
+    for size_mb in args.sizes:
+        body = synthetic_sse_body(size_mb)
+        await measure("buffered", buffered, body)
+        await measure("streaming", streaming, body)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
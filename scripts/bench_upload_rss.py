@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark peak RSS of decoding base64 PDF uploads: `base64.b64decode` into a BytesIO
+(previous behaviour) versus chunked decoding into a spooled temp file (proximaai.utils.uploads).
+
+Each measurement runs in a fresh subprocess so ru_maxrss reflects only that decode.
+
+Usage:
+    uv run python scripts/bench_upload_rss.py --sizes 1 5 10 25 50
+"""
+
+import argparse
+import base64
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def child(mode: str, path: str) -> None:
+    import io
+    from proximaai.utils.uploads import spool_base64
+
+    with open(path, "r") as f:
+        file_data = f.read()
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if mode == "bytesio":
+        file_like = io.BytesIO(base64.b64decode(file_data))
+        file_like.getbuffer()
+    else:
+        file_like = spool_base64(file_data, max_bytes=1 << 30)
+    elapsed = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux
+    print(f"{(peak - baseline) / 1024:.1f} {elapsed * 1000:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    for size_mb in args.sizes:
+        with tempfile.NamedTemporaryFile("w", suffix=".b64", delete=False) as f:
+            f.write(base64.b64encode(os.urandom(size_mb * 1024 * 1024)).decode())
+            path = f.name
+        try:
+            for mode in ("bytesio", "spooled"):
+                out = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, path],
+                    check=True, capture_output=True, text=True
+                ).stdout.split()
+                rss_mb, ms = out[-2], out[-1]
+                print(f"{mode:<8} pdf={size_mb:>3}MB peak_rss_delta={float(rss_mb):8.1f}MB time={float(ms):8.1f}ms")
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
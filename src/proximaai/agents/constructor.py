@@ -1,9 +1,13 @@
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.language_models import BaseChatModel
 from pydantic import BaseModel, Field
-from typing import Any, Union, Literal, Optional
+from typing import Any, Callable, Union, Literal, Optional
 
 from proximaai.utils.structured_output import MarkdownResponse
+from proximaai.utils.streaming import astream_structured
+from proximaai.prebuilt.resume_conformance import get_resume_conformance
+from proximaai.prebuilt.prompt_templates import split_prompt
+from proximaai.utils.prompt_cache import cached_system, prompt_caching_enabled
 from jinja2 import Template
 import markdown
 import os
@@ -21,6 +25,8 @@ logger = logging.getLogger(__name__)
 class TextConstructorAgent(BaseModel):
     template: Union[Template, str] = template_str
     model: BaseChatModel
+    skip_conforming: bool = True  # format locally when the markdown already follows the template
+    prompt_caching: bool = Field(default_factory=prompt_caching_enabled)
     model_config: dict = {"arbitrary_types_allowed": True}
 
     def model_post_init(self, __context: Any, **kwargs):
@@ -45,15 +51,35 @@ class TextConstructorAgent(BaseModel):
         # Remove triple backtick code blocks (with or without language)
         return re.sub(r"^```[a-zA-Z]*\\n|\\n```$", "", text.strip(), flags=re.MULTILINE)
 
+    def _format_prompt(self, markdown_like: str) -> list:
+        """Template and instructions as the cached system prefix, the resume markdown as the per-run message."""
+        instructions, resume = split_prompt(self.template, "resume_markdown", markdown_like) #type: ignore
+        return [cached_system(instructions, cache=self.prompt_caching), HumanMessage(content=resume)]
+
+    def _formatted(self, response) -> dict:
+        formatted_md = self.__format_response(value=response.text) #type: ignore
+        return {"formatted_resume_markdown": formatted_md, "current_step": "format_resume_with_template_complete"}
+
+    def _format_locally(self, markdown_like: str) -> Optional[dict]:
+        """Normalized markdown when it already conforms to the template, else None (LLM pass needed)."""
+        if not self.skip_conforming:
+            return None
+        result = get_resume_conformance().check(markdown_like)
+        if not result.conforms:
+            logger.info(f"Markdown diverges from the template ({', '.join(result.divergences)}), formatting with the LLM")
+            return None
+        logger.info(f"Markdown conforms to the template, skipping the LLM format pass (fixed: {', '.join(result.fixes) or 'nothing'})")
+        return {"formatted_resume_markdown": result.markdown, "current_step": "format_resume_with_template_skipped"}
+
     def invoke(self, method: Literal["format", "convert-html"], markdown_like:str) -> dict:
         if method == "format":
+            local = self._format_locally(markdown_like)
+            if local is not None:
+                return local
             # Get reasoning from the model with structured output
-            rendered_prompt = self.template.render(resume_markdown=markdown_like) #type: ignore
             structured_model = self.model.with_structured_output(MarkdownResponse)
-            response = structured_model.invoke(rendered_prompt)
-            formatted_md = self.__format_response(value=response.text) #type: ignore
-
-            return {"formatted_resume_markdown": formatted_md, "current_step": "format_resume_with_template_complete"}
+            response = structured_model.invoke(self._format_prompt(markdown_like))
+            return self._formatted(response)
         else:
             logger.info("🎯 Converting markdown to HTML")
 
@@ -61,3 +87,22 @@ class TextConstructorAgent(BaseModel):
             formatted_md = self.strip_code_block(markdown_like)
             html = markdown.markdown(formatted_md, extensions=['extra'])
             return {"resume_html": html, "current_step": "markdown_to_html_complete"}
+
+    async def ainvoke(self, method: Literal["format", "convert-html"], markdown_like:str,
+                      on_token: Optional[Callable[[str], None]] = None) -> dict:
+        """Async variant of `invoke`. Only `format` calls the model, streaming the markdown to
+        `on_token` when given; HTML conversion is a few milliseconds of local work and runs inline."""
+        if method == "format":
+            local = self._format_locally(markdown_like)
+            if local is not None:
+                if on_token is not None:
+                    on_token(local["formatted_resume_markdown"])
+                return local
+            if on_token is None:
+                structured_model = self.model.with_structured_output(MarkdownResponse)
+                response = await structured_model.ainvoke(self._format_prompt(markdown_like))
+            else:
+                response = await astream_structured(self.model, MarkdownResponse, self._format_prompt(markdown_like),
+                                                    field="text", on_token=on_token)
+            return self._formatted(response)
+        return self.invoke(method, markdown_like)
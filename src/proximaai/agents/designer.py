@@ -3,22 +3,33 @@ from proximaai.utils.structured_output import OrchestratorStateMultiAgent, Tailo
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.language_models import BaseChatModel
 from pydantic import BaseModel, Field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
+from proximaai.utils.streaming import astream_structured
+from proximaai.prebuilt.resume_conformance import get_resume_conformance
+from proximaai.utils.prompt_cache import cached_human, cached_system, prompt_caching_enabled
+
+import hashlib
+import json
 import logging
 logger = logging.getLogger(__name__)
 
+# The formatting template's layout (without its style block), so tailored markdown can skip the LLM format pass
+RESUME_LAYOUT = get_resume_conformance().rules.layout
+
 
 class DesignerAgent(BaseModel):
     query: HumanMessage | str
     model: BaseChatModel
+    resume: Optional[str] = None  # parsed resume, sent ahead of the query so it joins the cached prefix
     system_prompt: Optional[SystemMessage] = None
+    prompt_caching: bool = Field(default_factory=prompt_caching_enabled)
     model_config: dict = {"arbitrary_types_allowed": True}
 
     def model_post_init(self, __context: Any, **kwargs):
         # TODO: Pull prompt from MCP Server
-        self.system_prompt = SystemMessage(
-            content="""
+        self.system_prompt = cached_system(
+            """
             You are a resume optimization assistant. Your job is to rewrite the user's resume in markdown format, tailored for the target company/job.
             As a resume optimization agent your mission is to ensure the resume fits well to the roles description and requirements, maximize the potential
             for the resume to pass the ATS system and reach the hands of a recruiter.
@@ -29,6 +40,8 @@ class DesignerAgent(BaseModel):
             - Add new content only if it increases relevance for the target job/company.
             - For each section (e.g., Experience, Education, Skills, etc.), provide a reasoning object describing what was changed, added, or removed, and why.
             - Always include two leading blank lines after any header (including bolded section headers) and before any markdown list, to ensure correct markdown rendering.
+            - Lay the markdown out like the resume template below, so it can be rendered without a reformatting pass: the name as the only `#` heading, then the contact links block,
+              `##` sections in the template's order (extra sections after its last one), `###` entries under Experience, and the HTML tables and skills list where the template uses them.
             - Return a structured output as a JSON object with two fields:
                 - tailored_resume_markdown: the tailored resume as a markdown string
                 - reasoning: a list of objects, each with section, change, and justification fields, describing the reasoning for each section's changes
@@ -40,9 +53,23 @@ class DesignerAgent(BaseModel):
                 ...
             ]
             }}
-            """
+
+            Resume template:
+            """ + RESUME_LAYOUT,
+            cache=self.prompt_caching
         )
 
+    @property
+    def version(self) -> str:
+        """Fingerprint of the system prompt, output schema and model settings; keys cached results."""
+        fingerprint = json.dumps([
+            str(self.system_prompt.text) if self.system_prompt else "",
+            TailoredResumeWithReasoning.model_json_schema(),
+            type(self.model).__name__,
+            getattr(self.model, "_identifying_params", {}),
+        ], sort_keys=True, default=str)
+        return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=8).hexdigest()
+
     @staticmethod
     def __format_response(value) -> dict[str, str]:
         if isinstance(value, dict):
@@ -54,20 +81,50 @@ class DesignerAgent(BaseModel):
         
         return data
 
-    def invoke(self) -> dict:
-        logger.info("🎯 Tailoring resume markdown for company/job")
-
-        # Instantiate Agent with Structured Output
-        structured_model = self.model.with_structured_output(TailoredResumeWithReasoning)
-        messages = [
+    def _messages(self) -> list:
+        """Stable prefix first (system prompt, then the user's resume), the per-run request last."""
+        if self.resume is None:
+            return [
+                self.system_prompt,
+                self.query,
+            ]
+        query = self.query.content if isinstance(self.query, HumanMessage) else self.query
+        return [
             self.system_prompt,
-            self.query,
+            cached_human(f"# User Parsed Resume\n{self.resume}", str(query), cache=self.prompt_caching),
         ]
-        response = structured_model.invoke(messages)
-        logger.info("✅ Tailored resume markdown and reasoning generated.")
 
+    def _result(self, response) -> dict:
         data = self.__format_response(response)
         return {
             "tailored_resume_markdown": data["tailored_resume_markdown"], 
             "tailor_reasoning": data["reasoning"]
         }
+
+    def invoke(self) -> dict:
+        logger.info("🎯 Tailoring resume markdown for company/job")
+
+        # Instantiate Agent with Structured Output
+        structured_model = self.model.with_structured_output(TailoredResumeWithReasoning)
+        response = structured_model.invoke(self._messages())
+        logger.info("✅ Tailored resume markdown and reasoning generated.")
+
+        return self._result(response)
+
+    async def ainvoke(self, on_token: Optional[Callable[[str], None]] = None) -> dict:
+        """Async variant of `invoke`; awaits the model so graph nodes never block the event loop.
+
+        With `on_token`, the model response is streamed and each new piece of the tailored markdown
+        is passed to it as it is generated; the reasoning is still extracted from the full response.
+        """
+        logger.info("🎯 Tailoring resume markdown for company/job")
+
+        if on_token is None:
+            structured_model = self.model.with_structured_output(TailoredResumeWithReasoning)
+            response = await structured_model.ainvoke(self._messages())
+        else:
+            response = await astream_structured(self.model, TailoredResumeWithReasoning, self._messages(),
+                                                field="tailored_resume_markdown", on_token=on_token)
+        logger.info("✅ Tailored resume markdown and reasoning generated.")
+
+        return self._result(response)
@@ -3,7 +3,7 @@ from typing import Optional, Any
 import json
 import os
 
-from proximaai.mcp.mcp_client import MCPCommunication
+from proximaai.mcp.mcp_client import MCPCommunication, get_session_manager, get_shared_client
 from fastapi import status
 from urllib.parse import urljoin
 import httpx
@@ -16,7 +16,8 @@ class ResumeParsingAgent(BaseModel):
 
     def model_post_init(self, context: Any, /) -> None:
         server_base_url = os.getenv("LANGGRAPH_MCP_BASE_URL", "")
-        self.client = MCPCommunication(
+        # Reuse the initialized MCP session for this server and JWT across graph runs
+        self.client = get_session_manager().get_session(
             mcp_server_url=urljoin(server_base_url, self.tool_name + "/mcp"),
             jwt=self.jwt
         )
@@ -40,13 +41,13 @@ class ResumeParsingAgent(BaseModel):
                 headers={"content-type": "application/json"}
             )
         try:
-            async with httpx.AsyncClient() as client:
-                result = await client.get(
-                    urljoin(base=server_base_url, url=subpath),
-                    headers={
-                        "x-api-key": f"Bearer {self.jwt}"
-                    }
-                    )
+            client = get_shared_client()
+            result = await client.get(
+                urljoin(base=server_base_url, url=subpath),
+                headers={
+                    "x-api-key": f"Bearer {self.jwt}"
+                }
+                )
             return result
         except BaseException as e:
             error_content = json.dumps({"detail": "Server not running"}).encode("utf-8")
@@ -98,7 +98,7 @@ async def on_thread_create(
     return {"owner": ctx.user.identity}
         
 # Assumes you organize information in store like (user_id, resource_type, resource_id)
-# TODO: Currently not passing the store object to the graph state, explicitly creating client per node
+# The graph receives the shared pooled store (proximaai.data.store) through the LangGraph `store` argument
 @auth.on.store()
 async def authorize_store(ctx: Auth.types.AuthContext, value: dict):
     # The "namespace" field for each store item is a tuple you can think of as the directory of an item.
@@ -0,0 +1,411 @@
+"""
+Application Store - Durable, per-user storage behind ApplicationTrackerTool.
+
+Applications are rows keyed by (user_id, job_id) with indexes on (user_id, status) and
+(user_id, follow_up_date), so a tenant's listings and due follow-ups are index range scans
+however many applications they have. Job ids are time-ordered and random (`new_application_id`),
+so they never collide across workers and sort newest-last. Lists are paginated with an opaque
+keyset cursor. Per-status counts are kept in `application_status_counts`, updated in the same
+transaction as each write, so totals do not scan a tenant's applications.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
+import base64
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+from proximaai.data.store import get_pool
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("application_store")
+
+APPLICATION_FIELDS = ["job_id", "company", "position", "applied_date", "status", "follow_up_date", "notes"]
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+Application = Dict[str, Any]
+Page = Tuple[List[Application], Optional[str]]
+FollowUpRow = Tuple[str, str, str]
+
+FOLLOW_UPS_SQL = ("SELECT user_id, follow_up_date, job_id FROM applications WHERE follow_up_date IS NOT NULL{after} "
+                  "ORDER BY user_id, follow_up_date, job_id LIMIT {0}")
+FOLLOW_UPS_AFTER = " AND (user_id, follow_up_date, job_id) > ({0}, {0}, {0})"
+# Only clears a follow-up that was not rescheduled since it fired
+CLEAR_FOLLOW_UP_SQL = "UPDATE applications SET follow_up_date = NULL WHERE user_id = {0} AND follow_up_date = {0} AND job_id = {0}"
+
+# Statuses that end an application; setting one also drops its pending follow-up
+TERMINAL_STATUSES = {"rejected", "withdrawn"}
+
+
+def new_application_id() -> str:
+    """`job_` + 12 hex digits of milliseconds + 80 random bits: unique, and sorts by creation time."""
+    return f"job_{int(time.time() * 1000):012x}{secrets.token_hex(10)}"
+
+
+def encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def page_size(limit: Optional[int]) -> int:
+    return max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+
+
+class ApplicationStore(ABC):
+    """Per-user job application storage.
+
+    `list` returns one page and the cursor for the next (None on the last page). With `status`
+    (or no filter) applications come newest first; with `due_before` they are the applications
+    whose follow-up date is on or before it, soonest first.
+    """
+
+    @abstractmethod
+    async def add(self, user_id: str, application: Application) -> None:
+        ...
+
+    @abstractmethod
+    async def get(self, user_id: str, job_id: str) -> Optional[Application]:
+        ...
+
+    @abstractmethod
+    async def update(self, user_id: str, job_id: str, **changes: Optional[str]) -> Optional[Application]:
+        """Set the given non-empty fields; returns the updated application, or None if missing."""
+        ...
+
+    @abstractmethod
+    async def list(self, user_id: str, status: str = "", due_before: str = "",
+                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+        ...
+
+    @abstractmethod
+    async def count(self, user_id: str, status: str = "", due_before: str = "") -> int:
+        ...
+
+    @abstractmethod
+    async def follow_ups(self, after: Optional[FollowUpRow] = None, limit: int = 10000) -> List[FollowUpRow]:
+        """Every tenant's scheduled follow-ups as (user_id, follow_up_date, job_id), in that order, after `after`."""
+        ...
+
+    @abstractmethod
+    async def clear_follow_ups(self, follow_ups: List[FollowUpRow]) -> None:
+        """Clear fired (user_id, follow_up_date, job_id) follow-ups whose date has not changed since."""
+        ...
+
+
+def _updates(changes: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    updates = {field: value for field, value in changes.items() if value}
+    unknown = set(updates) - set(APPLICATION_FIELDS[1:])
+    if unknown:
+        raise ValueError(f"Unknown application fields: {sorted(unknown)}")
+    if updates.get("status") in TERMINAL_STATUSES:
+        updates["follow_up_date"] = None
+    return updates
+
+
+def _list_query(status: str, due_before: str, cursor: Optional[str], placeholder: str) -> Tuple[str, str, List[Any]]:
+    """WHERE clause (after the user_id condition), ORDER BY and parameters for a keyset page."""
+    conditions, params = [], []
+    if status:
+        conditions.append(f"status = {placeholder}")
+        params.append(status)
+    if due_before:
+        conditions.append(f"follow_up_date IS NOT NULL AND follow_up_date <= {placeholder}")
+        params.append(due_before)
+        if cursor:
+            conditions.append(f"(follow_up_date, job_id) > ({placeholder}, {placeholder})")
+            params += decode_cursor(cursor)
+        return "".join(f" AND {c}" for c in conditions), "follow_up_date, job_id", params
+    if cursor:
+        conditions.append(f"job_id < {placeholder}")
+        params += decode_cursor(cursor)
+    return "".join(f" AND {c}" for c in conditions), "job_id DESC", params
+
+
+def _page(rows: List[Application], limit: int, due_before: str) -> Page:
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([last["follow_up_date"], last["job_id"]] if due_before else [last["job_id"]])
+
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS applications (
+        user_id TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        company TEXT NOT NULL,
+        position TEXT NOT NULL,
+        applied_date TEXT NOT NULL,
+        status TEXT NOT NULL,
+        follow_up_date TEXT,
+        notes TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (user_id, job_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS applications_user_status ON applications (user_id, status, job_id)",
+    "CREATE INDEX IF NOT EXISTS applications_user_follow_up ON applications (user_id, follow_up_date, job_id) "
+    "WHERE follow_up_date IS NOT NULL",
+    """
+    CREATE TABLE IF NOT EXISTS application_status_counts (
+        user_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        n BIGINT NOT NULL,
+        PRIMARY KEY (user_id, status)
+    )
+    """,
+]
+
+COUNT_SQL = ("INSERT INTO application_status_counts (user_id, status, n) VALUES ({0}, {0}, {0}) "
+             "ON CONFLICT (user_id, status) DO UPDATE SET n = application_status_counts.n + excluded.n")
+
+
+def _count_changes(old_status: Optional[str], new_status: Optional[str]) -> List[Tuple[str, int]]:
+    """(status, delta) adjustments to the status counts for a status transition."""
+    if old_status == new_status:
+        return []
+    return [(status, delta) for status, delta in ((old_status, -1), (new_status, 1)) if status is not None]
+
+
+class SQLiteApplicationStore(ApplicationStore):
+    """Applications in a local SQLite file (WAL mode), one connection per thread."""
+
+    def __init__(self, db_path: Union[str, os.PathLike]):
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _add(self, user_id: str, application: Application):
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO applications (user_id, {', '.join(APPLICATION_FIELDS)}) "
+                f"VALUES (?, {', '.join('?' * len(APPLICATION_FIELDS))})",
+                [user_id] + [application.get(field) for field in APPLICATION_FIELDS]
+            )
+            conn.execute(COUNT_SQL.format("?"), (user_id, application["status"], 1))
+
+    def _get(self, user_id: str, job_id: str) -> Optional[Application]:
+        row = self._connect().execute(
+            f"SELECT {', '.join(APPLICATION_FIELDS)} FROM applications WHERE user_id = ? AND job_id = ?",
+            (user_id, job_id)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def _update(self, user_id: str, job_id: str, updates: Dict[str, Optional[str]]) -> Optional[Application]:
+        if not updates:
+            return self._get(user_id, job_id)
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")  # the status read and the write are one transaction
+            old = conn.execute("SELECT status FROM applications WHERE user_id = ? AND job_id = ?",
+                               (user_id, job_id)).fetchone()
+            if old is None:
+                return None
+            row = conn.execute(
+                f"UPDATE applications SET {', '.join(f'{field} = ?' for field in updates)} "
+                f"WHERE user_id = ? AND job_id = ? RETURNING {', '.join(APPLICATION_FIELDS)}",
+                list(updates.values()) + [user_id, job_id]
+            ).fetchone()
+            conn.executemany(COUNT_SQL.format("?"), [(user_id, status, delta)
+                                                     for status, delta in _count_changes(old["status"], row["status"])])
+        return dict(row)
+
+    def _list(self, user_id: str, status: str, due_before: str, limit: int, cursor: Optional[str]) -> Page:
+        where, order, params = _list_query(status, due_before, cursor, "?")
+        rows = self._connect().execute(
+            f"SELECT {', '.join(APPLICATION_FIELDS)} FROM applications WHERE user_id = ?{where} "
+            f"ORDER BY {order} LIMIT ?",
+            [user_id] + params + [limit + 1]
+        ).fetchall()
+        return _page([dict(row) for row in rows], limit, due_before)
+
+    def _count(self, user_id: str, status: str, due_before: str) -> int:
+        if not due_before:
+            return self._connect().execute(
+                "SELECT coalesce(sum(n), 0) FROM application_status_counts WHERE user_id = ?"
+                + (" AND status = ?" if status else ""), [user_id] + ([status] if status else [])
+            ).fetchone()[0]
+        where, _, params = _list_query(status, due_before, None, "?")
+        return self._connect().execute(
+            f"SELECT count(*) FROM applications WHERE user_id = ?{where}", [user_id] + params
+        ).fetchone()[0]
+
+    def _follow_ups(self, after: Optional[FollowUpRow], limit: int) -> List[FollowUpRow]:
+        sql = FOLLOW_UPS_SQL.format("?", after=FOLLOW_UPS_AFTER.format("?") if after else "")
+        return [tuple(row) for row in self._connect().execute(sql, list(after or ()) + [limit])]
+
+    def _clear_follow_ups(self, follow_ups: List[FollowUpRow]):
+        conn = self._connect()
+        with conn:
+            conn.executemany(CLEAR_FOLLOW_UP_SQL.format("?"), follow_ups)
+
+    async def add(self, user_id: str, application: Application) -> None:
+        await asyncio.to_thread(self._add, user_id, application)
+
+    async def get(self, user_id: str, job_id: str) -> Optional[Application]:
+        return await asyncio.to_thread(self._get, user_id, job_id)
+
+    async def update(self, user_id: str, job_id: str, **changes: Optional[str]) -> Optional[Application]:
+        return await asyncio.to_thread(self._update, user_id, job_id, _updates(changes))
+
+    async def list(self, user_id: str, status: str = "", due_before: str = "",
+                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+        return await asyncio.to_thread(self._list, user_id, status, due_before, page_size(limit), cursor)
+
+    async def count(self, user_id: str, status: str = "", due_before: str = "") -> int:
+        return await asyncio.to_thread(self._count, user_id, status, due_before)
+
+    async def follow_ups(self, after: Optional[FollowUpRow] = None, limit: int = 10000) -> List[FollowUpRow]:
+        return await asyncio.to_thread(self._follow_ups, after, limit)
+
+    async def clear_follow_ups(self, follow_ups: List[FollowUpRow]) -> None:
+        await asyncio.to_thread(self._clear_follow_ups, follow_ups)
+
+
+class PostgresApplicationStore(ApplicationStore):
+    """Applications in Postgres, on the shared store's connection pool."""
+
+    def __init__(self):
+        self._setup_done = False
+
+    async def setup(self):
+        if self._setup_done:
+            return
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            for statement in SCHEMA:
+                await conn.execute(statement)
+        self._setup_done = True
+
+    async def _fetch(self, sql: str, params: List[Any]) -> List[Application]:
+        await self.setup()
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            cursor = await conn.execute(sql, params)
+            return [dict(row) for row in await cursor.fetchall()]
+
+    async def add(self, user_id: str, application: Application) -> None:
+        await self.setup()
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"INSERT INTO applications (user_id, {', '.join(APPLICATION_FIELDS)}) "
+                    f"VALUES (%s, {', '.join(['%s'] * len(APPLICATION_FIELDS))})",
+                    [user_id] + [application.get(field) for field in APPLICATION_FIELDS]
+                )
+                await conn.execute(COUNT_SQL.format("%s"), (user_id, application["status"], 1))
+
+    async def get(self, user_id: str, job_id: str) -> Optional[Application]:
+        rows = await self._fetch(
+            f"SELECT {', '.join(APPLICATION_FIELDS)} FROM applications WHERE user_id = %s AND job_id = %s",
+            [user_id, job_id]
+        )
+        return rows[0] if rows else None
+
+    async def update(self, user_id: str, job_id: str, **changes: Optional[str]) -> Optional[Application]:
+        updates = _updates(changes)
+        if not updates:
+            return await self.get(user_id, job_id)
+        await self.setup()
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                # The subquery locks the row and reports its previous status for the counts
+                cursor = await conn.execute(
+                    f"UPDATE applications a SET {', '.join(f'{field} = %s' for field in updates)} "
+                    "FROM (SELECT job_id, status AS old_status FROM applications "
+                    "WHERE user_id = %s AND job_id = %s FOR UPDATE) old "
+                    "WHERE a.user_id = %s AND a.job_id = old.job_id "
+                    f"RETURNING {', '.join(f'a.{field}' for field in APPLICATION_FIELDS)}, old.old_status",
+                    list(updates.values()) + [user_id, job_id, user_id]
+                )
+                row = await cursor.fetchone()
+                if row is None:
+                    return None
+                row = dict(row)
+                for status, delta in _count_changes(row.pop("old_status"), row["status"]):
+                    await conn.execute(COUNT_SQL.format("%s"), (user_id, status, delta))
+        return row
+
+    async def list(self, user_id: str, status: str = "", due_before: str = "",
+                   limit: Optional[int] = None, cursor: Optional[str] = None) -> Page:
+        limit = page_size(limit)
+        where, order, params = _list_query(status, due_before, cursor, "%s")
+        rows = await self._fetch(
+            f"SELECT {', '.join(APPLICATION_FIELDS)} FROM applications WHERE user_id = %s{where} "
+            f"ORDER BY {order} LIMIT %s",
+            [user_id] + params + [limit + 1]
+        )
+        return _page(rows, limit, due_before)
+
+    async def count(self, user_id: str, status: str = "", due_before: str = "") -> int:
+        if not due_before:
+            rows = await self._fetch(
+                "SELECT coalesce(sum(n), 0) AS n FROM application_status_counts WHERE user_id = %s"
+                + (" AND status = %s" if status else ""), [user_id] + ([status] if status else [])
+            )
+            return int(rows[0]["n"])
+        where, _, params = _list_query(status, due_before, None, "%s")
+        rows = await self._fetch(f"SELECT count(*) AS n FROM applications WHERE user_id = %s{where}", [user_id] + params)
+        return rows[0]["n"]
+
+    async def follow_ups(self, after: Optional[FollowUpRow] = None, limit: int = 10000) -> List[FollowUpRow]:
+        sql = FOLLOW_UPS_SQL.format("%s", after=FOLLOW_UPS_AFTER.format("%s") if after else "")
+        rows = await self._fetch(sql, list(after or ()) + [limit])
+        return [(row["user_id"], row["follow_up_date"], row["job_id"]) for row in rows]
+
+    async def clear_follow_ups(self, follow_ups: List[FollowUpRow]) -> None:
+        await self.setup()
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                async with conn.cursor() as cursor:
+                    await cursor.executemany(CLEAR_FOLLOW_UP_SQL.format("%s"), follow_ups)
+
+
+# Global application store instance
+_application_store: Optional[ApplicationStore] = None
+
+
+def get_application_store() -> ApplicationStore:
+    """Get or create the store selected by `APPLICATION_STORE_BACKEND` (sqlite or postgres)."""
+    global _application_store
+
+    if _application_store is None:
+        backend = os.getenv("APPLICATION_STORE_BACKEND", "sqlite").lower()
+        if backend == "postgres":
+            _application_store = PostgresApplicationStore()
+        elif backend == "sqlite":
+            _application_store = SQLiteApplicationStore(os.getenv("APPLICATION_STORE_PATH", ".cache/applications.db"))
+        else:
+            raise ValueError(f"Unknown APPLICATION_STORE_BACKEND: {backend}")
+        logger.info("Application store initialized", backend=backend)
+    return _application_store
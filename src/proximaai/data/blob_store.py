@@ -0,0 +1,265 @@
+"""
+Blob Store - Content-addressed storage for uploaded files, kept out of graph state.
+
+Graph state carries only a `BlobRef` ({digest, size, mime}); nodes read the bytes lazily.
+Digests arrive from clients, so every backend checks them against the SHA-256 hex format before
+touching storage. Blobs are deduplicated across users, but each upload records its owner and
+owner-scoped reads only see blobs that owner uploaded.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import IO, Optional, Union
+import asyncio
+import hashlib
+import mimetypes
+import os
+import re
+import tempfile
+
+import aiofiles
+
+from proximaai.data.store import get_pool
+from proximaai.utils.logger import get_logger
+from proximaai.utils.structured_output import BlobRef
+
+logger = get_logger("blob_store")
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+class BlobNotFound(KeyError):
+    """Raised when a digest is not present in the blob store (or not visible to the owner)."""
+
+
+class InvalidDigest(ValueError):
+    """Raised when a digest is not a lowercase SHA-256 hex string."""
+
+
+def validate_digest(digest: object) -> str:
+    """Return `digest` if it is a SHA-256 hex digest; raise InvalidDigest otherwise."""
+    if not isinstance(digest, str) or _DIGEST.fullmatch(digest) is None:
+        raise InvalidDigest(f"Invalid blob digest: {digest!r:.80}")
+    return digest
+
+
+def owner_key(owner: str) -> str:
+    """Fixed-length, path-safe form of an owner id."""
+    return hashlib.sha256(owner.encode("utf-8")).hexdigest()[:32]
+
+
+def guess_mime(file_name: Optional[str], default: str = "application/pdf") -> str:
+    if not file_name:
+        return default
+    return mimetypes.guess_type(file_name)[0] or default
+
+
+class BlobStore(ABC):
+    """Content-addressed blob storage keyed by the SHA-256 of the content."""
+
+    @abstractmethod
+    async def put(self, data: Union[bytes, IO[bytes]], mime: str = "application/pdf", owner: Optional[str] = None) -> BlobRef:
+        ...
+
+    @abstractmethod
+    async def get(self, digest: str, owner: Optional[str] = None) -> bytes:
+        ...
+
+    @abstractmethod
+    async def size(self, digest: str, owner: Optional[str] = None) -> int:
+        """Stored size in bytes; raises BlobNotFound when missing or not uploaded by `owner`."""
+        ...
+
+    async def exists(self, digest: str, owner: Optional[str] = None) -> bool:
+        try:
+            await self.size(digest, owner=owner)
+        except BlobNotFound:
+            return False
+        return True
+
+
+class FileSystemBlobStore(BlobStore):
+    """Blobs stored as `<root>/<aa>/<bb>/<digest>`, owners as `<root>/owners/<owner>/<digest>`
+    markers; writes are atomic and idempotent."""
+
+    def __init__(self, root: Union[str, os.PathLike]):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest: str) -> Path:
+        validate_digest(digest)
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def _owner_path(self, digest: str, owner: str) -> Path:
+        return self.root / "owners" / owner_key(owner) / validate_digest(digest)
+
+    @staticmethod
+    def _write_tmp(root: Path, data: Union[bytes, IO[bytes]]) -> tuple[str, str, int]:
+        """Copy data to a temp file under root while hashing it."""
+        sha256 = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    sha256.update(data)
+                    out.write(data)
+                    size = len(data)
+                else:
+                    while chunk := data.read(COPY_CHUNK_SIZE):
+                        sha256.update(chunk)
+                        out.write(chunk)
+                        size += len(chunk)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return tmp_path, sha256.hexdigest(), size
+
+    def _put_sync(self, data: Union[bytes, IO[bytes]], owner: Optional[str]) -> tuple[str, int]:
+        tmp_path, digest, size = self._write_tmp(self.root, data)
+        path = self._path(digest)
+        if path.exists():
+            os.remove(tmp_path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, path)
+        if owner is not None:
+            marker = self._owner_path(digest, owner)
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        return digest, size
+
+    async def put(self, data: Union[bytes, IO[bytes]], mime: str = "application/pdf", owner: Optional[str] = None) -> BlobRef:
+        digest, size = await asyncio.to_thread(self._put_sync, data, owner)
+        return BlobRef(digest=digest, size=size, mime=mime)
+
+    def _size_sync(self, digest: str, owner: Optional[str]) -> int:
+        path = self._path(digest)
+        try:
+            if owner is not None and not self._owner_path(digest, owner).exists():
+                raise BlobNotFound(digest)
+            return path.stat().st_size
+        except FileNotFoundError:
+            raise BlobNotFound(digest)
+
+    async def size(self, digest: str, owner: Optional[str] = None) -> int:
+        return await asyncio.to_thread(self._size_sync, digest, owner)
+
+    async def get(self, digest: str, owner: Optional[str] = None) -> bytes:
+        await self.size(digest, owner=owner)
+        try:
+            async with aiofiles.open(self._path(digest), "rb") as f:
+                return await f.read()
+        except FileNotFoundError:
+            raise BlobNotFound(digest)
+
+    def path(self, digest: str) -> Path:
+        """Local path of a blob, for consumers that can stream from disk."""
+        return self._path(digest)
+
+
+class PostgresBlobStore(BlobStore):
+    """Blobs stored as Postgres large objects, indexed by digest, on the shared store's pool."""
+
+    def __init__(self):
+        self._setup_done = False
+
+    async def setup(self):
+        if self._setup_done:
+            return
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            await conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS blobs (
+                    digest TEXT PRIMARY KEY,
+                    oid OID NOT NULL,
+                    size BIGINT NOT NULL,
+                    mime TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+                """
+            )
+            await conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS blob_owners (
+                    digest TEXT NOT NULL REFERENCES blobs (digest),
+                    owner TEXT NOT NULL,
+                    PRIMARY KEY (digest, owner)
+                )
+                """
+            )
+        self._setup_done = True
+
+    async def put(self, data: Union[bytes, IO[bytes]], mime: str = "application/pdf", owner: Optional[str] = None) -> BlobRef:
+        await self.setup()
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = await asyncio.to_thread(data.read)
+        digest = hashlib.sha256(data).hexdigest()
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            async with conn.transaction():
+                cursor = await conn.execute("SELECT size FROM blobs WHERE digest = %s", (digest,))
+                if await cursor.fetchone() is None:
+                    await conn.execute(
+                        "INSERT INTO blobs (digest, oid, size, mime) "
+                        "VALUES (%s, lo_from_bytea(0, %s), %s, %s) ON CONFLICT (digest) DO NOTHING",
+                        (digest, bytes(data), len(data), mime)
+                    )
+                if owner is not None:
+                    await conn.execute(
+                        "INSERT INTO blob_owners (digest, owner) VALUES (%s, %s) ON CONFLICT DO NOTHING",
+                        (digest, owner)
+                    )
+        return BlobRef(digest=digest, size=len(data), mime=mime)
+
+    async def _fetch(self, column: str, digest: str, owner: Optional[str]):
+        validate_digest(digest)
+        await self.setup()
+        pool = await get_pool()
+        async with pool.connection() as conn:
+            if owner is None:
+                cursor = await conn.execute(f"SELECT {column} AS value FROM blobs WHERE digest = %s", (digest,))
+            else:
+                cursor = await conn.execute(
+                    f"SELECT {column} AS value FROM blobs JOIN blob_owners USING (digest) "
+                    "WHERE digest = %s AND owner = %s",
+                    (digest, owner)
+                )
+            row = await cursor.fetchone()
+        if row is None:
+            raise BlobNotFound(digest)
+        return row["value"]
+
+    async def get(self, digest: str, owner: Optional[str] = None) -> bytes:
+        return bytes(await self._fetch("lo_get(oid)", digest, owner))
+
+    async def size(self, digest: str, owner: Optional[str] = None) -> int:
+        return int(await self._fetch("size", digest, owner))
+
+
+# Global blob store instance
+_blob_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Get or create the blob store selected by `BLOB_STORE_BACKEND` (filesystem or postgres).
+
+    The filesystem default `.cache/blobs` is relative to the working directory. The MCP server
+    (which serves `/blobs`) and the LangGraph server must see the same directory, so set
+    `BLOB_STORE_DIR` to an absolute path on a shared filesystem, or use postgres.
+    """
+    global _blob_store
+
+    if _blob_store is None:
+        backend = os.getenv("BLOB_STORE_BACKEND", "filesystem").lower()
+        if backend == "postgres":
+            _blob_store = PostgresBlobStore()
+        elif backend == "filesystem":
+            _blob_store = FileSystemBlobStore(os.getenv("BLOB_STORE_DIR", ".cache/blobs"))
+        else:
+            raise ValueError(f"Unknown BLOB_STORE_BACKEND: {backend}")
+        logger.info("Blob store initialized", backend=backend)
+    return _blob_store
@@ -0,0 +1,230 @@
+"""
+Document Cache - Content-addressed cache of parsed documents with pluggable storage backends.
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+import asyncio
+import hashlib
+import json
+import os
+
+import aiofiles
+
+from proximaai.data.store import get_store
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("document_cache")
+
+# Bump when the parse output format changes so stale entries are not served
+CACHE_VERSION = "v1"
+
+
+def content_digest(data: bytes | bytearray | memoryview) -> str:
+    """SHA-256 of the raw document bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+class DocumentCacheBackend(ABC):
+    """Storage backend for parsed documents keyed by content digest."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        return {}
+
+
+class MemoryLRUBackend(DocumentCacheBackend):
+    """In-process LRU bounded by the total encoded size of cached documents."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[int, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: Any) -> None:
+        size = len(_encode(value))
+        if size > self.max_bytes:
+            return
+        await self.delete(key)
+        self._entries[key] = (size, value)
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, (evicted_size, _) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry[0]
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._entries), "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes, "evictions": self.evictions}
+
+
+class DiskBackend(DocumentCacheBackend):
+    """One JSON file per digest in a directory, evicting least recently used files past `max_bytes`."""
+
+    def __init__(self, directory: str | os.PathLike, max_bytes: int = 2 * 1024 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        # Rebuild the LRU index from the directory, oldest access first
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        self._index: OrderedDict[str, int] = OrderedDict((p.stem, p.stat().st_size) for p in files)
+        self.size_bytes = sum(self._index.values())
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    async def get(self, key: str) -> Optional[Any]:
+        if key not in self._index:
+            return None
+        try:
+            async with aiofiles.open(self._path(key), "rb") as f:
+                value = json.loads(await f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            await self.delete(key)
+            return None
+        self._index.move_to_end(key)
+        await asyncio.to_thread(os.utime, self._path(key))
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        payload = _encode(value)
+        if len(payload) > self.max_bytes:
+            return
+        await self.delete(key)
+        tmp_path = self._path(key).with_suffix(".tmp")
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(payload)
+        await asyncio.to_thread(os.replace, tmp_path, self._path(key))
+        self._index[key] = len(payload)
+        self.size_bytes += len(payload)
+        while self.size_bytes > self.max_bytes:
+            evicted_key = next(iter(self._index))
+            await self.delete(evicted_key)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        size = self._index.pop(key, None)
+        if size is not None:
+            self.size_bytes -= size
+            try:
+                await asyncio.to_thread(os.remove, self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._index), "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes, "evictions": self.evictions}
+
+
+class PostgresBackend(DocumentCacheBackend):
+    """Stores parsed documents in the shared pooled Postgres store; expiry is handled by the store TTL."""
+
+    namespace = ("parsed_documents", CACHE_VERSION)
+
+    def __init__(self, ttl_minutes: Optional[float] = 10080):
+        self.ttl_minutes = ttl_minutes
+
+    async def get(self, key: str) -> Optional[Any]:
+        store = await get_store()
+        item = await store.aget(namespace=self.namespace, key=key, refresh_ttl=True)
+        return item.value["data"] if item else None
+
+    async def set(self, key: str, value: Any) -> None:
+        store = await get_store()
+        await store.aput(namespace=self.namespace, key=key, value={"data": value}, ttl=self.ttl_minutes)
+
+    async def delete(self, key: str) -> None:
+        store = await get_store()
+        await store.adelete(namespace=self.namespace, key=key)
+
+
+class DocumentCache:
+    """Content-addressed parsed-document cache with hit/miss counters."""
+
+    def __init__(self, backend: DocumentCacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def key(digest: str) -> str:
+        return f"{CACHE_VERSION}-{digest}"
+
+    async def get(self, digest: str) -> Optional[Any]:
+        try:
+            value = await self.backend.get(self.key(digest))
+        except Exception as e:
+            # A cache failure must never fail the parse
+            self.errors += 1
+            logger.warning("Document cache read failed", error=str(e))
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, digest: str, value: Any) -> None:
+        try:
+            await self.backend.set(self.key(digest), value)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Document cache write failed", error=str(e))
+
+    def metrics(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            **self.backend.stats(),
+        }
+
+
+def create_document_cache(backend: Optional[str] = None) -> DocumentCache:
+    """Build the cache from `PARSE_CACHE_BACKEND` (memory, disk or postgres)."""
+    backend = (backend or os.getenv("PARSE_CACHE_BACKEND", "memory")).lower()
+    max_bytes = int(os.getenv("PARSE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+    if backend == "disk":
+        return DocumentCache(DiskBackend(os.getenv("PARSE_CACHE_DIR", ".cache/parsed_documents"), max_bytes=max_bytes))
+    elif backend == "postgres":
+        return DocumentCache(PostgresBackend())
+    elif backend == "memory":
+        return DocumentCache(MemoryLRUBackend(max_bytes=max_bytes))
+    else:
+        raise ValueError(f"Unknown PARSE_CACHE_BACKEND: {backend}")
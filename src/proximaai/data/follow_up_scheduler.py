@@ -0,0 +1,275 @@
+"""
+Follow-up Scheduler - Fires application follow-ups when they come due, from one time-ordered heap.
+
+Scheduled follow-ups live in a binary min-heap keyed by due time; a single asyncio worker sleeps
+until the earliest one (or until something earlier is scheduled), then pops everything due and
+hands it to the handler in batches, e.g. to enqueue graph runs or notifications. There are no
+per-item timers or tasks, so a million pending follow-ups cost one heap entry each. On startup
+the store's follow-ups are bulk loaded with a single O(n) heapify; overdue ones fire right away.
+Rescheduling and cancelling are lazy: superseded heap entries are skipped when they surface.
+Once the handler accepts a batch, its follow-up dates are cleared in the store, so a restart does
+not fire them again.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import asyncio
+import heapq
+import time
+
+from proximaai.data.application_store import ApplicationStore
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("follow_up_scheduler")
+
+
+class FollowUp(NamedTuple):
+    due_at: float  # epoch seconds
+    user_id: str
+    job_id: str
+    follow_up_date: str  # as stored, to clear it once fired
+
+
+Handler = Callable[[List[FollowUp]], Awaitable[None]]
+
+
+@lru_cache(maxsize=4096)  # follow-up dates are mostly whole days, so a bulk load repeats few distinct values
+def due_at(follow_up_date: str) -> float:
+    """Epoch seconds for an ISO date (start of that day, UTC) or ISO timestamp (UTC if naive)."""
+    value = datetime.fromisoformat(follow_up_date.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class SimulatedClock:
+    """Manually advanced clock for driving a scheduler in tests and benchmarks.
+
+    Pass `clock=simulated.time, sleep=simulated.sleep`; `await simulated.advance(seconds)` moves
+    time forward, waking sleepers in deadline order and letting the event loop run after each.
+    """
+
+    def __init__(self, start: float = 0.0):
+        self.now = start
+        self._sleepers: List[Tuple[float, int, asyncio.Future]] = []
+        self._sequence = 0
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._sequence += 1
+        heapq.heappush(self._sleepers, (self.now + delay, self._sequence, future))
+        await future
+
+    async def settle(self, rounds: int = 10):
+        """Let ready callbacks and tasks run."""
+        for _ in range(rounds):
+            await asyncio.sleep(0)
+
+    async def advance(self, seconds: float):
+        target = self.now + seconds
+        await self.settle()
+        while self._sleepers and self._sleepers[0][0] <= target:
+            deadline, _, future = heapq.heappop(self._sleepers)
+            self.now = max(self.now, deadline)
+            if not future.done():
+                future.set_result(None)
+            await self.settle()
+        self.now = target
+        await self.settle()
+
+
+class FollowUpScheduler:
+    """Heap-backed follow-up scheduler with a single batching asyncio worker.
+
+    Job ids are globally unique (`new_application_id`), so each job has at most one live
+    follow-up. A failed handler call is logged and its batch retried after `retry_seconds`. With a
+    `store`, fired follow-ups are cleared there after the handler returns.
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        store: Optional[ApplicationStore] = None,
+        batch_size: int = 500,
+        retry_seconds: float = 300.0,
+        max_sleep_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+    ):
+        self.handler = handler
+        self.store = store
+        self.batch_size = batch_size
+        self.retry_seconds = retry_seconds
+        self.max_sleep_seconds = max_sleep_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self._heap: List[FollowUp] = []
+        self._due: Dict[str, float] = {}  # job_id -> due time of its live heap entry
+        self._wakeup = asyncio.Event()
+        self._worker: Optional[asyncio.Task] = None
+        self.fired = 0
+        self.batches = 0
+        self.failures = 0
+        self.stale_skipped = 0
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def schedule(self, user_id: str, job_id: str, follow_up_date: str):
+        """Schedule (or reschedule) a job's follow-up."""
+        when = due_at(follow_up_date)
+        self._due[job_id] = when
+        heapq.heappush(self._heap, FollowUp(when, user_id, job_id, follow_up_date))
+        if self._heap[0].job_id == job_id:
+            self._wakeup.set()  # new earliest item: the worker's sleep may be too long
+        if len(self._heap) > 2 * len(self._due) + 1024:
+            self._compact()
+
+    def cancel(self, job_id: str) -> bool:
+        return self._due.pop(job_id, None) is not None
+
+    def _compact(self):
+        """Drop superseded entries once they outnumber live ones."""
+        self._heap = [item for item in self._heap if self._due.get(item.job_id) == item.due_at]
+        heapq.heapify(self._heap)
+
+    def load(self, follow_ups: Iterable[Tuple[str, str, str]]) -> int:
+        """Bulk add (user_id, follow_up_date, job_id) rows with one heapify. Returns how many were added."""
+        added = 0
+        for user_id, follow_up_date, job_id in follow_ups:
+            try:
+                when = due_at(follow_up_date)
+            except ValueError:
+                logger.warning("Skipping unparseable follow-up date", job_id=job_id, follow_up_date=follow_up_date)
+                continue
+            self._due[job_id] = when
+            self._heap.append(FollowUp(when, user_id, job_id, follow_up_date))
+            added += 1
+        heapq.heapify(self._heap)
+        self._wakeup.set()
+        return added
+
+    async def load_from_store(self, store: ApplicationStore, page_size: int = 10000) -> int:
+        """Load every scheduled follow-up from the store, a keyset page at a time."""
+        rows: List[Tuple[str, str, str]] = []
+        after = None
+        while True:
+            page = await store.follow_ups(after=after, limit=page_size)
+            rows += page
+            if len(page) < page_size:
+                break
+            after = page[-1]
+        added = self.load(rows)
+        logger.info("Loaded follow-ups", count=added, pending=len(self))
+        return added
+
+    def pop_due(self, now: Optional[float] = None) -> List[FollowUp]:
+        """Pop up to `batch_size` live follow-ups due at or before `now`."""
+        now = self.clock() if now is None else now
+        batch: List[FollowUp] = []
+        while self._heap and self._heap[0].due_at <= now and len(batch) < self.batch_size:
+            item = heapq.heappop(self._heap)
+            if self._due.get(item.job_id) != item.due_at:
+                self.stale_skipped += 1  # rescheduled or cancelled since this entry was pushed
+                continue
+            del self._due[item.job_id]
+            batch.append(item)
+        return batch
+
+    async def _fire(self, batch: List[FollowUp]):
+        self.batches += 1
+        try:
+            await self.handler(batch)
+            self.fired += len(batch)
+        except Exception as e:
+            self.failures += 1
+            logger.error("Follow-up handler failed, retrying batch later", error=str(e), batch_size=len(batch),
+                         retry_seconds=self.retry_seconds)
+            retry_at = self.clock() + self.retry_seconds
+            for item in batch:
+                if item.job_id not in self._due:  # not rescheduled while the handler ran
+                    self._due[item.job_id] = retry_at
+                    heapq.heappush(self._heap, item._replace(due_at=retry_at))
+            return
+        if self.store is not None:
+            try:
+                await self.store.clear_follow_ups([(item.user_id, item.follow_up_date, item.job_id) for item in batch])
+            except Exception as e:
+                logger.error("Failed to clear fired follow-ups, they fire again on restart", error=str(e),
+                             batch_size=len(batch))
+
+    async def _sleep_until_next(self):
+        delay = self.max_sleep_seconds
+        if self._heap:
+            delay = min(delay, max(0.0, self._heap[0].due_at - self.clock()))
+        self._wakeup.clear()
+        sleeper = asyncio.ensure_future(self.sleep(delay))
+        waker = asyncio.ensure_future(self._wakeup.wait())
+        try:
+            await asyncio.wait({sleeper, waker}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleeper.cancel()
+            waker.cancel()
+
+    async def run(self):
+        """Worker loop: fire due batches, then sleep until the next due item or a wake-up."""
+        while True:
+            batch = self.pop_due()
+            if batch:
+                await self._fire(batch)
+                await asyncio.sleep(0)  # let other tasks run between back-to-back batches
+                continue
+            await self._sleep_until_next()
+
+    def start(self) -> asyncio.Task:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self.run())
+        return self._worker
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._due),
+            "heap_size": len(self._heap),
+            "next_due_at": self._heap[0].due_at if self._heap else None,
+            "fired": self.fired,
+            "batches": self.batches,
+            "failures": self.failures,
+            "stale_skipped": self.stale_skipped,
+        }
+
+
+# Global follow-up scheduler instance (set by the process that runs it)
+_follow_up_scheduler: Optional[FollowUpScheduler] = None
+
+
+def get_follow_up_scheduler() -> Optional[FollowUpScheduler]:
+    """The running scheduler, or None when this process does not run one."""
+    return _follow_up_scheduler
+
+
+async def start_follow_up_scheduler(handler: Handler, store: ApplicationStore, **kwargs: Any) -> FollowUpScheduler:
+    """Create the process-wide scheduler, bulk load the store's follow-ups and start its worker."""
+    global _follow_up_scheduler
+    if _follow_up_scheduler is not None:
+        await _follow_up_scheduler.stop()
+    scheduler = FollowUpScheduler(handler, store=store, **kwargs)
+    await scheduler.load_from_store(store)
+    scheduler.start()
+    _follow_up_scheduler = scheduler
+    return scheduler
@@ -0,0 +1,165 @@
+"""
+Research Cache - Per-company web research cache with per-entry TTL, stale-while-revalidate and single-flight.
+
+Entries live in the shared store under `("websearch_research", CACHE_VERSION)`, keyed by
+`CompanyTarget.cache_key`. Each entry records when it was fetched and how long it stays fresh;
+stale entries are still served (and refreshed in the background) until the store TTL drops them.
+"""
+
+from typing import Any, Awaitable, Callable, Optional
+import asyncio
+import os
+import time
+
+from langchain_core.load.load import loads
+from langchain_core.load.dump import dumps
+from langgraph.store.base import BaseStore
+
+from proximaai.data.store import get_store
+from proximaai.utils.company_extraction import CompanyTarget
+from proximaai.utils.logger import get_logger
+from proximaai.utils.single_flight import SingleFlight
+from proximaai.utils.structured_output import WebSearchResults
+
+logger = get_logger("research_cache")
+
+# Bump when the research output format changes so stale entries are not served
+CACHE_VERSION = "v3"
+
+Fetcher = Callable[[CompanyTarget], Awaitable[WebSearchResults]]
+
+
+def default_ttl_seconds(result: WebSearchResults) -> float:
+    """Fresh lifetime of a result: short for empty/failed research so it is retried soon."""
+    tool_response = (result.get("tool_response") or "").strip()
+    if not tool_response or "No relevant information found" in result.get("agent_response", ""):
+        return float(os.getenv("WEBSEARCH_CACHE_NEGATIVE_TTL_MINUTES", "60")) * 60
+    return float(os.getenv("WEBSEARCH_CACHE_TTL_HOURS", "24")) * 3600
+
+
+class ResearchCache:
+    """Stale-while-revalidate cache in front of a research fetcher, with single-flight per key."""
+
+    namespace = ("websearch_research", CACHE_VERSION)
+
+    def __init__(
+        self,
+        store: Optional[BaseStore] = None,
+        stale_seconds: Optional[float] = None,
+        ttl_for: Callable[[WebSearchResults], float] = default_ttl_seconds,
+        clock: Callable[[], float] = time.time
+    ):
+        self.store = store
+        self.stale_seconds = (
+            stale_seconds if stale_seconds is not None
+            else float(os.getenv("WEBSEARCH_CACHE_STALE_HOURS", "168")) * 3600
+        )
+        self.ttl_for = ttl_for
+        self.clock = clock
+        self._flights = SingleFlight()
+        self._refreshes: set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.errors = 0
+
+    async def _store(self, store: Optional[BaseStore]) -> BaseStore:
+        return store or self.store or await get_store()
+
+    async def get_or_fetch(self, target: CompanyTarget, fetch: Fetcher, store: Optional[BaseStore] = None) -> tuple[WebSearchResults, str]:
+        """
+        Return the research for a target and how it was served: "hit", "stale", or "miss".
+
+        Fresh entries are returned directly. Stale entries are returned immediately while one
+        background refresh runs. Misses fetch once per key; concurrent callers share that fetch.
+        """
+        store = await self._store(store)
+        key = target.cache_key
+        entry = None
+        try:
+            item = await store.aget(namespace=self.namespace, key=key, refresh_ttl=False)
+            entry = item.value if item else None
+        except Exception as e:
+            # A cache failure must never fail the research
+            self.errors += 1
+            logger.warning("Research cache read failed", key=key, error=str(e))
+
+        if entry is not None:
+            result = loads(entry["data"])
+            if self.clock() - entry["fetched_at"] < entry["ttl_seconds"]:
+                self.hits += 1
+                return result, "hit"
+            self.stale_hits += 1
+            if not self._flights.in_flight(key):
+                task = asyncio.create_task(self._fetch(store, target, fetch))
+                self._refreshes.add(task)
+                task.add_done_callback(self._refresh_done)
+            return result, "stale"
+
+        self.misses += 1
+        return await self._fetch(store, target, fetch), "miss"
+
+    def _refresh_done(self, task: asyncio.Task):
+        self._refreshes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Background research refresh failed", error=str(task.exception()))
+
+    async def _fetch(self, store: BaseStore, target: CompanyTarget, fetch: Fetcher) -> WebSearchResults:
+        async def fetch_and_store() -> WebSearchResults:
+            self.fetches += 1
+            result = await fetch(target)
+            await self._put(store, target.cache_key, result)
+            return result
+
+        result, _ = await self._flights.do(target.cache_key, fetch_and_store)
+        return result
+
+    async def _put(self, store: BaseStore, key: str, result: WebSearchResults):
+        ttl_seconds = self.ttl_for(result)
+        try:
+            await store.aput(
+                namespace=self.namespace,
+                key=key,
+                value={
+                    "data": dumps(result, ensure_ascii=False),
+                    "fetched_at": self.clock(),
+                    "ttl_seconds": ttl_seconds,
+                },
+                # Store TTL is in minutes and bounds how long a stale entry may be served
+                ttl=(ttl_seconds + self.stale_seconds) / 60 if store.supports_ttl else None
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Research cache write failed", key=key, error=str(e))
+
+    async def drain(self):
+        """Wait for background refreshes (used on shutdown and in tests)."""
+        if self._refreshes:
+            await asyncio.gather(*list(self._refreshes), return_exceptions=True)
+
+    def metrics(self) -> dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self._flights.coalesced,
+            "fetches": self.fetches,
+            "errors": self.errors,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Global research cache instance
+_research_cache: Optional[ResearchCache] = None
+
+
+def get_research_cache() -> ResearchCache:
+    """Get or create the process-wide research cache (so single-flight spans concurrent runs)."""
+    global _research_cache
+
+    if _research_cache is None:
+        _research_cache = ResearchCache()
+
+    return _research_cache
@@ -0,0 +1,167 @@
+"""
+Response Cache - Normalized-query cache for upstream LLM/search API responses (e.g. Perplexity).
+
+Two tiers: an in-process TTL + LRU map, optionally backed by the shared Postgres store so
+answers are reused across processes. Identical in-flight requests are coalesced into one call.
+"""
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+import hashlib
+import json
+import os
+import re
+import time
+
+from proximaai.data.store import get_store
+from proximaai.utils.logger import get_logger
+from proximaai.utils.single_flight import SingleFlight
+
+logger = get_logger("response_cache")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold, collapse whitespace and drop trailing punctuation so trivially different queries share a key."""
+    return _WHITESPACE.sub(" ", text).strip().casefold().rstrip("?.! ")
+
+
+def query_key(messages: list[dict[str, str]], model: str) -> str:
+    """Stable key for a chat request: SHA-256 of the model and the normalized messages."""
+    normalized = [[m.get("role", "user"), normalize_text(m.get("content", ""))] for m in messages]
+    return hashlib.sha256(json.dumps([model, normalized]).encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """TTL + LRU response cache with optional store backing, request coalescing and dashboard counters."""
+
+    def __init__(
+        self,
+        namespace: tuple[str, ...],
+        ttl_seconds: float = 3600,
+        max_entries: int = 1024,
+        use_store: bool = False,
+        clock: Callable[[], float] = time.time
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.use_store = use_store
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any, float]] = OrderedDict()
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.evictions = 0
+        # Upstream time avoided by hits and coalesced requests, and time actually spent upstream
+        self.saved_latency_seconds = 0.0
+        self.upstream_latency_seconds = 0.0
+
+    def get_local(self, key: str) -> Optional[Any]:
+        """In-process lookup only; usable from synchronous code."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, latency = entry
+        if self.clock() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self.saved_latency_seconds += latency
+        return value
+
+    def set_local(self, key: str, value: Any, latency: float, expires_at: Optional[float] = None):
+        self._entries[key] = (expires_at or self.clock() + self.ttl_seconds, value, latency)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def record_upstream(self, key: str, value: Any, latency: float):
+        """Account for and cache a response fetched outside `get_or_fetch` (synchronous callers)."""
+        self.misses += 1
+        self.upstream_latency_seconds += latency
+        self.set_local(key, value, latency)
+
+    async def _get_stored(self, key: str) -> Optional[Any]:
+        try:
+            store = await get_store()
+            item = await store.aget(namespace=self.namespace, key=key, refresh_ttl=False)
+        except Exception as e:
+            # A cache failure must never fail the request
+            self.errors += 1
+            logger.warning("Response cache read failed", error=str(e))
+            return None
+        if item is None or self.clock() >= item.value["expires_at"]:
+            return None
+        self.store_hits += 1
+        self.saved_latency_seconds += item.value["latency"]
+        self.set_local(key, item.value["data"], item.value["latency"], expires_at=item.value["expires_at"])
+        return item.value["data"]
+
+    async def _put_stored(self, key: str, value: Any, latency: float):
+        try:
+            store = await get_store()
+            await store.aput(
+                namespace=self.namespace,
+                key=key,
+                value={"data": value, "latency": latency, "expires_at": self.clock() + self.ttl_seconds},
+                ttl=self.ttl_seconds / 60
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Response cache write failed", error=str(e))
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a cached response, or call `fetch` once for all concurrent callers of `key`."""
+        value = self.get_local(key)
+        if value is not None:
+            return value
+        if self.use_store:
+            value = await self._get_stored(key)
+            if value is not None:
+                return value
+
+        async def fetch_and_cache() -> tuple[Any, float]:
+            start = time.perf_counter()
+            value = await fetch()
+            latency = time.perf_counter() - start
+            self.record_upstream(key, value, latency)
+            if self.use_store:
+                await self._put_stored(key, value, latency)
+            return value, latency
+
+        (value, latency), shared = await self._flights.do(key, fetch_and_cache)
+        if shared:
+            self.saved_latency_seconds += latency
+        return value
+
+    def metrics(self) -> dict[str, Any]:
+        lookups = self.hits + self.store_hits + self.misses + self._flights.coalesced
+        served_without_upstream = self.hits + self.store_hits + self._flights.coalesced
+        return {
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "coalesced": self._flights.coalesced,
+            "errors": self.errors,
+            "entries": len(self._entries),
+            "evictions": self.evictions,
+            "hit_ratio": round(served_without_upstream / lookups, 4) if lookups else 0.0,
+            "saved_latency_seconds": round(self.saved_latency_seconds, 3),
+            "upstream_latency_seconds": round(self.upstream_latency_seconds, 3),
+        }
+
+
+def response_cache_from_env(namespace: tuple[str, ...], prefix: str) -> ResponseCache:
+    """Build a cache from `<prefix>_TTL_SECONDS`, `<prefix>_MAX_ENTRIES` and `<prefix>_STORE` (true/false)."""
+    return ResponseCache(
+        namespace=namespace,
+        ttl_seconds=float(os.getenv(f"{prefix}_TTL_SECONDS", "3600")),
+        max_entries=int(os.getenv(f"{prefix}_MAX_ENTRIES", "1024")),
+        use_store=os.getenv(f"{prefix}_STORE", "false").lower() in ("1", "true", "yes"),
+    )
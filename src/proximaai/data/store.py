@@ -0,0 +1,113 @@
+"""
+Shared Postgres Store - Process-wide, connection-pooled AsyncPostgresStore for the orchestrator graph.
+"""
+
+from contextlib import AsyncExitStack
+from typing import Any, Optional
+import asyncio
+import os
+
+from psycopg_pool import AsyncConnectionPool
+from langgraph.store.postgres.aio import AsyncPostgresStore
+from langgraph.store.postgres.base import PoolConfig
+
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("store")
+
+
+def default_pool_config() -> PoolConfig:
+    """Build the pool configuration from environment variables."""
+    pool_config: dict[str, Any] = {
+        "min_size": int(os.getenv("STORE_POOL_MIN_SIZE", "1")),
+        "max_size": int(os.getenv("STORE_POOL_MAX_SIZE", "10")),
+        # Extra keys are forwarded to psycopg_pool.AsyncConnectionPool
+        "check": AsyncConnectionPool.check_connection,  # health check on checkout
+        "max_idle": float(os.getenv("STORE_POOL_MAX_IDLE", "300")),
+        "timeout": float(os.getenv("STORE_POOL_TIMEOUT", "30")),
+    }
+    return pool_config  # type: ignore[return-value]
+
+
+class SharedStore:
+    """Owns a single pooled AsyncPostgresStore for the lifetime of the process.
+
+    The store is opened lazily on first use, `setup()` (migrations) runs exactly once,
+    and every graph node receives the same instance through the LangGraph `store` argument.
+    """
+
+    def __init__(self, conn_string: Optional[str] = None, pool_config: Optional[PoolConfig] = None):
+        self.conn_string = conn_string
+        self.pool_config = pool_config
+        self._store: Optional[AsyncPostgresStore] = None
+        self._stack: Optional[AsyncExitStack] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._store is not None
+
+    async def get(self) -> AsyncPostgresStore:
+        """Return the shared store, opening the pool and running setup on first call."""
+        if self._store is not None:
+            return self._store
+
+        async with self._lock:
+            if self._store is None:
+                conn_string = self.conn_string or os.getenv("DB_URI", "")
+                pool_config = self.pool_config or default_pool_config()
+                stack = AsyncExitStack()
+                try:
+                    store = await stack.enter_async_context(
+                        AsyncPostgresStore.from_conn_string(conn_string, pool_config=pool_config)
+                    )
+                    await store.setup()
+                except BaseException:
+                    await stack.aclose()
+                    raise
+                self._stack = stack
+                self._store = store
+                logger.info("Shared store opened",
+                            min_size=pool_config.get("min_size"),
+                            max_size=pool_config.get("max_size"))
+        return self._store
+
+    async def close(self):
+        """Close the pool. The next call to `get` reopens it."""
+        async with self._lock:
+            if self._stack is not None:
+                await self._stack.aclose()
+                logger.info("Shared store closed")
+            self._stack = None
+            self._store = None
+
+
+# Global shared store instance
+_shared_store: Optional[SharedStore] = None
+
+
+def get_shared_store() -> SharedStore:
+    """Get or create the process-wide store manager."""
+    global _shared_store
+
+    if _shared_store is None:
+        _shared_store = SharedStore()
+
+    return _shared_store
+
+
+async def get_store() -> AsyncPostgresStore:
+    """Convenience accessor for the pooled AsyncPostgresStore."""
+    return await get_shared_store().get()
+
+
+async def get_pool() -> AsyncConnectionPool:
+    """The psycopg pool behind the shared store, for queries outside the BaseStore API."""
+    store = await get_store()
+    return store.conn  # type: ignore[return-value]
+
+
+async def close_store():
+    """Close the process-wide store, if open."""
+    if _shared_store is not None:
+        await _shared_store.close()
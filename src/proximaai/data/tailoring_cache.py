@@ -0,0 +1,199 @@
+"""
+Tailoring Cache - Reuse DesignerAgent results for a resume re-run against the same job description.
+
+Entries live in the shared store under `("designer_results", CACHE_VERSION, designer_version,
+resume_hash)`, keyed by the job description hash. `designer_version` hashes the designer's system
+prompt, output schema and model settings, so changing any of them starts a fresh namespace and
+old results are never served (the store TTL drops them). With an embeddings model configured, a
+miss on the exact job description falls back to the most similar cached job description for the
+same resume, e.g. the same posting re-scraped with a different footer.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Sequence
+import hashlib
+import math
+import os
+import time
+
+from langchain_core.embeddings import Embeddings
+from langgraph.store.base import BaseStore
+
+from proximaai.data.store import get_store
+from proximaai.utils.logger import get_logger
+from proximaai.utils.single_flight import SingleFlight
+
+logger = get_logger("tailoring_cache")
+
+# Bump when the cached entry format changes
+CACHE_VERSION = "v1"
+
+Tailor = Callable[[], Awaitable[dict]]
+
+
+def normalize_text(text: str) -> str:
+    """Whitespace-insensitive form of a resume or job description for hashing."""
+    return " ".join(text.split())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.blake2b(normalize_text(text).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+@dataclass(frozen=True)
+class TailoringKey:
+    version: str  # designer prompt/schema/model version
+    resume_hash: str
+    job_hash: str
+    job_description: str  # kept for the embedding lookup
+
+    @classmethod
+    def build(cls, resume: str, job_description: str, version: str) -> "TailoringKey":
+        return cls(version, text_hash(resume), text_hash(job_description), normalize_text(job_description))
+
+    @property
+    def namespace(self) -> tuple:
+        return ("designer_results", CACHE_VERSION, self.version, self.resume_hash)
+
+    @property
+    def flight_key(self) -> str:
+        return ":".join(self.namespace[2:] + (self.job_hash,))
+
+
+def _embeddings_from_env() -> Optional[Embeddings]:
+    spec = os.getenv("DESIGNER_CACHE_EMBEDDINGS")
+    if not spec:
+        return None
+    from langchain.embeddings import init_embeddings
+    return init_embeddings(spec)
+
+
+class TailoringCache:
+    """Exact (and optionally embedding-similar) result cache in front of DesignerAgent, with single-flight per key."""
+
+    def __init__(
+        self,
+        store: Optional[BaseStore] = None,
+        embeddings: Optional[Embeddings] = None,
+        similarity_threshold: Optional[float] = None,
+        ttl_seconds: Optional[float] = None,
+        similar_candidates: int = 50,
+        clock: Callable[[], float] = time.time
+    ):
+        self.store = store
+        self.embeddings = embeddings
+        self.similarity_threshold = (
+            similarity_threshold if similarity_threshold is not None
+            else float(os.getenv("DESIGNER_CACHE_SIMILARITY", "0.97"))
+        )
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else float(os.getenv("DESIGNER_CACHE_TTL_HOURS", "168")) * 3600
+        )
+        self.similar_candidates = similar_candidates
+        self.clock = clock
+        self._flights = SingleFlight()
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def _store(self, store: Optional[BaseStore]) -> BaseStore:
+        return store or self.store or await get_store()
+
+    async def get_or_tailor(self, key: TailoringKey, tailor: Tailor, store: Optional[BaseStore] = None) -> tuple[dict, str]:
+        """
+        Return the designer result for a key and how it was served: "hit", "similar", "shared" or "miss".
+
+        "shared" means a concurrent identical run made the call; only "miss" ran `tailor` here.
+        """
+        store = await self._store(store)
+        embedding: Optional[List[float]] = None
+        try:
+            item = await store.aget(namespace=key.namespace, key=key.job_hash, refresh_ttl=False)
+            if item is not None:
+                self.hits += 1
+                return item.value["data"], "hit"
+            if self.embeddings is not None:
+                embedding = await self.embeddings.aembed_query(key.job_description)
+                similar = await self._most_similar(store, key, embedding)
+                if similar is not None:
+                    self.similar_hits += 1
+                    return similar, "similar"
+        except Exception as e:
+            # A cache failure must never fail the tailoring
+            self.errors += 1
+            logger.warning("Tailoring cache read failed", key=key.flight_key, error=str(e))
+
+        async def tailor_and_store() -> dict:
+            self.misses += 1
+            result = await tailor()
+            await self._put(store, key, result, embedding)
+            return result
+
+        result, shared = await self._flights.do(key.flight_key, tailor_and_store)
+        return result, "shared" if shared else "miss"
+
+    async def _most_similar(self, store: BaseStore, key: TailoringKey, embedding: List[float]) -> Optional[dict]:
+        """Best cached result for this resume whose job description is within the similarity threshold."""
+        best, best_score = None, self.similarity_threshold
+        for item in await store.asearch(key.namespace, limit=self.similar_candidates):
+            candidate = item.value.get("job_embedding")
+            if not candidate:
+                continue
+            score = cosine_similarity(embedding, candidate)
+            if score >= best_score:
+                best, best_score = item.value["data"], score
+        if best is not None:
+            logger.info("Serving tailoring for a similar job description", key=key.flight_key, similarity=round(best_score, 4))
+        return best
+
+    async def _put(self, store: BaseStore, key: TailoringKey, result: dict, embedding: Optional[List[float]]):
+        try:
+            if self.embeddings is not None and embedding is None:
+                embedding = await self.embeddings.aembed_query(key.job_description)
+            await store.aput(
+                namespace=key.namespace,
+                key=key.job_hash,
+                value={
+                    "data": result,
+                    "job_embedding": embedding,
+                    "created_at": self.clock(),
+                },
+                # Store TTL is in minutes
+                ttl=self.ttl_seconds / 60 if store.supports_ttl else None
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Tailoring cache write failed", key=key.flight_key, error=str(e))
+
+    def metrics(self) -> dict[str, Any]:
+        lookups = self.hits + self.similar_hits + self.misses + self._flights.coalesced
+        return {
+            "hits": self.hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "coalesced": self._flights.coalesced,
+            "errors": self.errors,
+            "hit_ratio": round((self.hits + self.similar_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Global tailoring cache instance
+_tailoring_cache: Optional[TailoringCache] = None
+
+
+def get_tailoring_cache() -> TailoringCache:
+    """Get or create the process-wide tailoring cache (embeddings from `DESIGNER_CACHE_EMBEDDINGS`, if set)."""
+    global _tailoring_cache
+
+    if _tailoring_cache is None:
+        _tailoring_cache = TailoringCache(embeddings=_embeddings_from_env())
+
+    return _tailoring_cache
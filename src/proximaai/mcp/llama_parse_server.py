@@ -1,26 +1,131 @@
 from pathlib import Path
-import base64
+from contextlib import ExitStack, asynccontextmanager
+import asyncio
+import math
 import os
 import io
+import time
 
-from typing import Any, Union
+from typing import IO, Any, Optional, Union
 from fastapi.responses import JSONResponse, Response
 from fastapi import Request
 from fastapi import status
+from starlette.middleware.base import BaseHTTPMiddleware
 
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp.exceptions import ToolError
 from llama_cloud_services import LlamaParse
 from llama_cloud_services.parse.types import JobResult
-import aiofiles
+
+from proximaai.data.document_cache import content_digest, create_document_cache
+from proximaai.utils.uploads import UploadTooLarge, file_digest, spool_base64
 
 # --- MCP Server Setup ---
 llama_parse_mcp = FastMCP("llama-parse-server")
 
-async def file_to_bytesio(file_path):
-    """Read a file into a BytesIO object asynchronously."""
-    async with aiofiles.open(file_path, 'rb') as f:
-        content = await f.read()
-    return io.BytesIO(content)
+
+class ParseQueueFull(Exception):
+    """Raised when the parse queue cannot accept another job."""
+
+
+class ParseQueue:
+    """Bounded-concurrency job queue for LlamaParse jobs.
+
+    At most `max_in_flight` parses run at once and at most `max_waiting` callers wait for a slot;
+    beyond that, callers are rejected so the HTTP layer can answer 429 with a Retry-After hint.
+    """
+
+    def __init__(self, max_in_flight: int = 4, max_waiting: int = 16, retry_after: float = 5.0):
+        self.max_in_flight = max_in_flight
+        self.max_waiting = max_waiting
+        self.retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def is_full(self) -> bool:
+        return self.in_flight >= self.max_in_flight and self.waiting >= self.max_waiting
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait for a free parse slot, or raise ParseQueueFull if the queue is saturated."""
+        if self.is_full:
+            self.rejected += 1
+            raise ParseQueueFull(f"Parse queue is full, retry after {self.retry_after:g} seconds")
+
+        self.waiting += 1
+        start = time.monotonic()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        waited = time.monotonic() - start
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    def metrics(self) -> dict[str, Any]:
+        started = self.completed + self.in_flight
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "max_in_flight": self.max_in_flight,
+            "max_waiting": self.max_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_seconds": round(self.total_wait_seconds / started, 4) if started else 0.0,
+            "max_wait_seconds": round(self.max_wait_seconds, 4),
+        }
+
+
+# Content-addressed cache of parsed documents, shared by every caller of the server
+document_cache = create_document_cache()
+
+parse_queue = ParseQueue(
+    max_in_flight=int(os.getenv("LLAMA_PARSE_MAX_IN_FLIGHT", "4")),
+    max_waiting=int(os.getenv("LLAMA_PARSE_MAX_WAITING", "16")),
+    retry_after=float(os.getenv("LLAMA_PARSE_RETRY_AFTER", "5"))
+)
+
+# Pooled LlamaParse clients, one per (organization, project)
+_parsers: dict[tuple[Optional[str], Optional[str]], LlamaParse] = {}
+
+
+def get_parser(org_id: Optional[str] = None, project_id: Optional[str] = None) -> LlamaParse:
+    """Get or create the LlamaParse client for an organization/project."""
+    parser = _parsers.get((org_id, project_id))
+    if parser is None:
+        parser = LlamaParse(organization_id=org_id, project_id=project_id)
+        _parsers[(org_id, project_id)] = parser
+    return parser
+
+
+class ParseQueueBackpressureMiddleware(BaseHTTPMiddleware):
+    """Answer tool calls with 429 + Retry-After while the parse queue is saturated."""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method == "POST" and parse_queue.is_full:
+            body = await request.body()
+            if b'"tools/call"' in body:
+                parse_queue.rejected += 1
+                return JSONResponse(
+                    {"detail": "Parse queue is full", "queue": parse_queue.metrics()},
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    headers={"Retry-After": str(math.ceil(parse_queue.retry_after))}
+                )
+        return await call_next(request)
 
 @llama_parse_mcp.custom_route(
     path="/health",
@@ -29,7 +134,10 @@ async def file_to_bytesio(file_path):
     include_in_schema=True
 )
 async def health(request: Request)->Response:
-    return JSONResponse({"status": "ok"}, status_code=status.HTTP_200_OK)
+    return JSONResponse(
+        {"status": "ok", "parse_queue": parse_queue.metrics(), "document_cache": document_cache.metrics()},
+        status_code=status.HTTP_200_OK
+    )
 
 # --- Tool Registration using @mcp.tool Decorator ---
 @llama_parse_mcp.tool(
@@ -46,16 +154,20 @@ async def parse_document(
     Parse a document using a configured LlamaParse agent.
     """
     ctx = llama_parse_mcp.get_context()
+    stack = ExitStack()
     try:
-        # Instantiate the LlamaParse agent
-        llama_parse = LlamaParse(organization_id=org_id, project_id=project_id)
+        # Reuse the pooled LlamaParse agent
+        llama_parse = get_parser(org_id=org_id, project_id=project_id)
 
         # Non-blocking file read
+        file_like: Union[str, IO[bytes]]
         if isinstance(request, (str, os.PathLike)):
             file_path = Path(request)  # Convert string paths to Path objects
             _type = file_path.suffix
             assert _type == ".pdf", f"FileTypeError: extension {_type} is not supported"
-            file_like = await file_to_bytesio(file_path)
+            # Let the parser stream the file from disk instead of reading it into memory
+            digest = await file_digest(file_path)
+            file_like = str(file_path)
             file_name = str(file_path)  # Ensure file_name is a string
         elif isinstance(request, dict):
             # # Read json content
@@ -63,25 +175,43 @@ async def parse_document(
             file_data = request.get("file_data")
             if file_data is None:
                 raise ValueError("Missing 'file_data' in request")
-            # Extract information
-            file_bytes = base64.b64decode(file_data)
-            file_like = io.BytesIO(file_bytes)
+            # Decode in chunks into a spooled temp file (memory up to a limit, disk beyond), off the event loop
+            upload = await asyncio.to_thread(spool_base64, file_data)
+            stack.callback(upload.close)
+            digest = upload.digest
+            file_like = upload
             file_name = request.get("file_name", "uploaded_file.pdf")
         elif isinstance(request, io.BytesIO):
+            digest = content_digest(request.getbuffer())
             file_like = request
             file_name = "default_resume.pdf"
-        result = await llama_parse.aparse(file_like, extra_info={"file_name": file_name})
+
+        # Identical documents are parsed once, regardless of caller or file name
+        cached = await document_cache.get(digest)
+        if cached is not None:
+            await ctx.info(f"Parsed document cache hit: {digest}")
+            return cached
+
+        async with parse_queue.slot():
+            result = await llama_parse.aparse(file_like, extra_info={"file_name": file_name})
             
         if isinstance(result, JobResult):
             markdown = await result.aget_markdown_documents()
             text = [doc.text for doc in markdown]
+            await document_cache.set(digest, text)
             return text
         else:
             raise ValueError(f"Unexpected result type: {type(result)}")
 
+    # Raised as tool errors (`isError` results) so callers never mistake them for a parsed document
+    except (ParseQueueFull, UploadTooLarge) as e:
+        await ctx.error(str(e))
+        raise ToolError(str(e))
     except Exception as e:
         await ctx.error(f"Error parsing document: {str(e)}")
-        return f"An error occurred while processing the document. Please try again later."
+        raise ToolError("An error occurred while processing the document. Please try again later.")
+    finally:
+        stack.close()
 
 # --- HTTP Streamable Server Startup ---
 if __name__ == "__main__":
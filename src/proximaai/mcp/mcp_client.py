@@ -1,12 +1,87 @@
-from pydantic import BaseModel
-from typing import Any, Union, Optional, List
+from pydantic import BaseModel, PrivateAttr
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Iterator, Union, Optional, List
+import asyncio
+import hashlib
+import itertools
 import json
+import os
+import time
 
 import httpx
 import proximaai
 from fastapi import status
 from importlib.metadata import version
 
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("mcp_client")
+
+# Shared, pooled HTTP client for every MCP session in the process
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get or create the process-wide pooled httpx.AsyncClient (keep-alive, HTTP/2 when available)."""
+    global _shared_client
+
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=float(os.getenv("MCP_CLIENT_TIMEOUT", "60")),
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("MCP_MAX_CONNECTIONS", "100")),
+                max_keepalive_connections=int(os.getenv("MCP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+                keepalive_expiry=float(os.getenv("MCP_KEEPALIVE_EXPIRY", "60")),
+            ),
+        )
+    return _shared_client
+
+
+class MCPSessionExpired(Exception):
+    """Raised when the server no longer recognizes the mcp-session-id (HTTP 404)."""
+
+
+async def iter_sse_json(lines: AsyncIterator[str]) -> AsyncIterator[dict[Any, Any]]:
+    """
+    Incrementally parse an SSE stream, yielding each event's JSON payload as soon as the event ends.
+
+    Multi-line `data:` fields are joined per the SSE spec; events that are not valid JSON are skipped.
+
+    Args:
+        lines (AsyncIterator[str]): Lines of the response body, e.g. `response.aiter_lines()`.
+
+    Yields:
+        dict: The parsed JSON object of each event.
+    """
+    data_lines: List[str] = []
+    async for line in lines:
+        if not line:
+            # Blank line dispatches the event
+            if data_lines:
+                payload = "\n".join(data_lines)
+                data_lines = []
+                try:
+                    yield json.loads(payload)
+                except json.JSONDecodeError:
+                    pass
+        elif line.startswith('data:'):
+            value = line[len('data:'):]
+            data_lines.append(value[1:] if value.startswith(' ') else value)
+    if data_lines:
+        try:
+            yield json.loads("\n".join(data_lines))
+        except json.JSONDecodeError:
+            pass
+
 
 class MCPCommunication(BaseModel):
     mcp_server_url:str
@@ -19,11 +94,31 @@ class MCPCommunication(BaseModel):
         }
     mcp_server_token:Optional[str] = None 
     jwt: Optional[str] = None 
+    session_ttl: Optional[float] = None
+    initialized_at: Optional[float] = None
     model_config= {"arbitrary_types_allowed": True}
+    _lock: asyncio.Lock = PrivateAttr(default_factory=asyncio.Lock)
+    # JSON-RPC ids: the server routes each response by id within a session, and sessions are shared
+    _request_ids: Iterator[int] = PrivateAttr(default_factory=lambda: itertools.count(1))
 
     def model_post_init(self, context: Any, /) -> None:
-        self.client = httpx.AsyncClient(timeout=self.timeout)
+        if self.client is None:
+            self.client = get_shared_client()
         return super().model_post_init(context)
+
+    @property
+    def is_initialized(self) -> bool:
+        if not self.mcp_server_token or self.initialized_at is None:
+            return False
+        if self.session_ttl is not None and time.monotonic() - self.initialized_at > self.session_ttl:
+            return False
+        return True
+
+    def reset_session(self):
+        """Drop the current session so the next call re-runs the initialize handshake."""
+        self.mcp_server_token = None
+        self.initialized_at = None
+        self.headers.pop('mcp-session-id', None)
     
     async def initialize(self, data: Optional[dict[str, Any]] = None, timeout: Optional[Union[int, float]] = None):
         if not data:
@@ -50,6 +145,7 @@ class MCPCommunication(BaseModel):
             if response:   
                 self.mcp_server_token = response.headers.get("mcp-session-id")
                 self.headers['mcp-session-id'] = self.mcp_server_token or ""
+                self.initialized_at = time.monotonic()
 
     async def _method_wrapper(self, data: Optional[dict[str, Any]] = None, timeout: Optional[Union[int, float]] = None):
         headers = self.headers.copy()
@@ -64,13 +160,67 @@ class MCPCommunication(BaseModel):
                     timeout=timeout
                     )
                 
-                if response.status_code == status.HTTP_200_OK:
+                if response.status_code in (status.HTTP_200_OK, status.HTTP_202_ACCEPTED):
                     return response
+                elif response.status_code == status.HTTP_404_NOT_FOUND and headers.get('mcp-session-id'):
+                    raise MCPSessionExpired(f"MCP session {headers['mcp-session-id']} expired")
                 else:
                     response.raise_for_status()
         else:
             raise ConnectionError("MCP client not started")
 
+    async def stream(self, data: dict[str, Any], timeout: Optional[Union[int, float]] = None) -> AsyncIterator[dict[Any, Any]]:
+        """
+        POST a JSON-RPC message and yield the server's JSON-RPC messages as they arrive.
+
+        Handles both `text/event-stream` and plain `application/json` responses without buffering the whole body.
+        """
+        headers = self.headers.copy()
+        if self.jwt:
+            headers["x-api-key"] = f"Bearer {self.jwt}"
+        if not self.client:
+            raise ConnectionError("MCP client not started")
+
+        async with self.client.stream(
+            "POST",
+            url=self.mcp_server_url,
+            headers=headers,
+            json=data,
+            follow_redirects=True,
+            timeout=timeout
+        ) as response:
+            if response.status_code == status.HTTP_404_NOT_FOUND and headers.get('mcp-session-id'):
+                raise MCPSessionExpired(f"MCP session {headers['mcp-session-id']} expired")
+            response.raise_for_status()
+
+            if response.headers.get("content-type", "").startswith("application/json"):
+                body = await response.aread()
+                if body:
+                    yield json.loads(body)
+            else:
+                async for message in iter_sse_json(response.aiter_lines()):
+                    yield message
+
+    async def request_stream(self, data: dict[str, Any], timeout: Optional[Union[int, float]] = None) -> AsyncIterator[dict[Any, Any]]:
+        """
+        Yield server notifications (e.g. `notifications/progress`) for a request, ending with its response.
+
+        Stops reading as soon as the message carrying the request's JSON-RPC `id` is received.
+        """
+        request_id = data.get("id")
+        async for message in self.stream(data=data, timeout=timeout):
+            yield message
+            if "id" in message and message["id"] == request_id and ("result" in message or "error" in message):
+                return
+
+    async def request(self, data: dict[str, Any], timeout: Optional[Union[int, float]] = None) -> dict[Any, Any]:
+        """Send a JSON-RPC request and return only the matching response message."""
+        request_id = data.get("id")
+        async for message in self.request_stream(data=data, timeout=timeout):
+            if message.get("id") == request_id and ("result" in message or "error" in message):
+                return message
+        raise ConnectionError(f"MCP server closed the stream without a response for request {request_id}")
+
     async def notification_initialization(self, data: Optional[dict[str, Any]] = None, timeout: Optional[Union[int, float]] = None) -> dict:
             if not data:
                 data = {
@@ -108,44 +258,118 @@ class MCPCommunication(BaseModel):
             if not data:
                 data = {
                     "jsonrpc": "2.0",
-                    "id": 1,
+                    "id": next(self._request_ids),
                     "method": "tools/list",
                     "params": {}
                 }
             
-            response = await self._method_wrapper(data=data, timeout=timeout)
-            if response:
-                formatted_response = self.parse_sse_json(response.text)
-                tools = await self.tool_list_parse(value=formatted_response)
-                return tools
-            else:
-                return []
+            formatted_response = await self.request(data=data, timeout=timeout)
+            tools = await self.tool_list_parse(value=formatted_response)
+            return tools
 
     async def tool_list_parse(self, value:dict)-> list:
         #TODO Add class method for tools - structure output
         return value["result"]["tools"]
 
-    async def tool_call(self, params: Optional[dict] = None, data: Optional[dict[str, Any]] = None, timeout: Optional[Union[int, float]] = 60.0) -> Any:
+    def _tool_call_data(self, params: Optional[dict] = None, data: Optional[dict[str, Any]] = None) -> dict[str, Any]:
         if not data:
             data = {
                 "jsonrpc": "2.0",
-                "id": 2,
+                "id": next(self._request_ids),
                 "method": "tools/call",
                 "params": params 
             }
-        
-        response = await self._method_wrapper(data=data, timeout=timeout)
-        if response:
-            formatted_response = self.parse_sse_json(response.text)
-            return formatted_response['result']
-        else:
-            return []
+        return data
+
+    async def tool_call(self, params: Optional[dict] = None, data: Optional[dict[str, Any]] = None, timeout: Optional[Union[int, float]] = 60.0) -> Any:
+        data = self._tool_call_data(params=params, data=data)
+        formatted_response = await self.request(data=data, timeout=timeout)
+        if "error" in formatted_response:
+            raise RuntimeError(f"MCP tool call failed: {formatted_response['error']}")
+        return formatted_response['result']
+
+    async def tool_call_stream(self, params: Optional[dict] = None, data: Optional[dict[str, Any]] = None, timeout: Optional[Union[int, float]] = 60.0) -> AsyncIterator[dict[Any, Any]]:
+        """Async iterator over progress notifications for a tool call, ending with the JSON-RPC response."""
+        await self.ensure_session()
+        data = self._tool_call_data(params=params, data=data)
+        async for message in self.request_stream(data=data, timeout=timeout):
+            yield message
+
+    async def ensure_session(self, timeout: Optional[Union[int, float]] = None):
+        """Run the initialize handshake only when there is no live session."""
+        if self.is_initialized:
+            return
+        async with self._lock:
+            if not self.is_initialized:
+                self.reset_session()
+                await self.initialize(timeout=timeout)
+                _ = await self.notification_initialization(timeout=timeout)
+                logger.debug("MCP session initialized", url=self.mcp_server_url)
 
     async def invoke(self, params: Optional[dict] = None, data: Optional[dict[str, Any]] = None, timeout: Optional[Union[int, float]] = 60.0) -> Any:
-        """Invoke the MCP protocol lifecycle to run desired tool"""
-        await self.initialize()
-        _ = await self.notification_initialization()
-        result = await self.tool_call(params=params, data=data, timeout=timeout)
+        """Invoke the MCP protocol lifecycle to run desired tool, reusing an initialized session"""
+        await self.ensure_session()
+        try:
+            result = await self.tool_call(params=params, data=data, timeout=timeout)
+        except MCPSessionExpired:
+            logger.info("MCP session expired, re-initializing", url=self.mcp_server_url)
+            self.reset_session()
+            await self.ensure_session()
+            result = await self.tool_call(params=params, data=data, timeout=timeout)
 
         return result
+
+
+class MCPSessionManager:
+    """Keeps one initialized MCP session per (server URL, JWT scope) on a shared HTTP client."""
+
+    def __init__(self, session_ttl: Optional[float] = None, client: Optional[httpx.AsyncClient] = None, max_sessions: int = 1024):
+        self.session_ttl = session_ttl
+        self.max_sessions = max_sessions
+        self._client = client
+        self._sessions: OrderedDict[tuple[str, str], MCPCommunication] = OrderedDict()
+
+    @staticmethod
+    def _scope(jwt: Optional[str]) -> str:
+        # Key on a digest so raw tokens are not kept as dictionary keys
+        return hashlib.sha256(jwt.encode("utf-8")).hexdigest() if jwt else "anonymous"
+
+    def get_session(self, mcp_server_url: str, jwt: Optional[str] = None) -> MCPCommunication:
+        """Return the session for this server and JWT, creating it on first use."""
+        key = (mcp_server_url, self._scope(jwt))
+        session = self._sessions.get(key)
+        if session is not None:
+            self._sessions.move_to_end(key)
+        else:
+            session = MCPCommunication(
+                mcp_server_url=mcp_server_url,
+                jwt=jwt,
+                client=self._client or get_shared_client(),
+                session_ttl=self.session_ttl
+            )
+            self._sessions[key] = session
+            # Evict the least recently used session (e.g. an expired, rotated JWT)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def drop_session(self, mcp_server_url: str, jwt: Optional[str] = None):
+        self._sessions.pop((mcp_server_url, self._scope(jwt)), None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+# Global session manager instance
+_session_manager: Optional[MCPSessionManager] = None
+
+
+def get_session_manager() -> MCPSessionManager:
+    """Get or create the process-wide MCP session manager."""
+    global _session_manager
+
+    if _session_manager is None:
+        ttl = os.getenv("MCP_SESSION_TTL")
+        _session_manager = MCPSessionManager(session_ttl=float(ttl) if ttl else None)
+    return _session_manager
  
\ No newline at end of file
@@ -3,6 +3,10 @@ import httpx
 from mcp.server.fastmcp import FastMCP
 from pydantic import BaseModel, Field
 from typing import List, Literal
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from proximaai.tools.perplexity_search import aask, format_answer, get_response_cache
 
 PERPLEXITY_API_KEY = os.environ.get("PERPLEXITY_API_KEY")
 if not PERPLEXITY_API_KEY:
@@ -21,24 +25,14 @@ class PerplexityAskInput(BaseModel):
 @mcp.tool()
 async def perplexity_ask(messages: List[Message]) -> str:
     """Engages in a conversation using the Perplexity Sonar API. Accepts an array of messages (each with a role and content) and returns a completion response from the Perplexity model."""
-    url = "https://api.perplexity.ai/chat/completions"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {PERPLEXITY_API_KEY}",
-    }
-    body = {
-        "model": "sonar-pro",
-        "messages": [m.model_dump() for m in messages],
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, headers=headers, json=body)
-        if response.status_code != 200:
-            raise RuntimeError(f"Perplexity API error: {response.text}")
-        data = response.json()
-    message_content = data["choices"][0]["message"]["content"]
-    if "citations" in data and isinstance(data["citations"], list) and data["citations"]:
-        message_content += "\n\nCitations:\n"
-        for idx, citation in enumerate(data["citations"], 1):
-            message_content += f"[{idx}] {citation}\n"
-    return message_content 
-    
\ No newline at end of file
+    try:
+        # Pooled, rate-limited and cached; identical in-flight questions share one upstream call
+        data = await aask([m.model_dump() for m in messages], PERPLEXITY_API_KEY)
+    except httpx.HTTPStatusError as e:
+        raise RuntimeError(f"Perplexity API error: {e.response.text}")
+    return format_answer(data)
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """Response cache counters (hit ratio, saved latency) for dashboards."""
+    return JSONResponse({"perplexity_cache": get_response_cache().metrics()})
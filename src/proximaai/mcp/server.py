@@ -1,11 +1,14 @@
 import contextlib
+from tempfile import SpooledTemporaryFile
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from proximaai.utils.auth import is_valid_key
 from starlette.responses import JSONResponse
 
-from proximaai.mcp.llama_parse_server import llama_parse_mcp
+from proximaai.mcp.llama_parse_server import llama_parse_mcp, ParseQueueBackpressureMiddleware
+from proximaai.data.blob_store import get_blob_store, guess_mime
+from proximaai.utils.uploads import MAX_UPLOAD_BYTES, SPOOL_MAX_BYTES
 import os
 
 
@@ -31,8 +34,41 @@ class SupabaseAuthMiddleware(BaseHTTPMiddleware):
 
 app = FastAPI(lifespan=lifespan)
 llama_app = llama_parse_mcp.streamable_http_app()
-llama_app.add_middleware(SupabaseAuthMiddleware)
+llama_app.add_middleware(ParseQueueBackpressureMiddleware)
+llama_app.add_middleware(SupabaseAuthMiddleware)  # added last, runs first
 app.mount("/parse_document", llama_app)
+
+
+@app.post("/blobs")
+async def upload_blob(request: Request):
+    """Store a raw file body in the blob store and return its reference for `file_input.blob`."""
+    auth_header = request.headers.get("x-api-key")
+    if not auth_header:
+        return JSONResponse({"detail": "Missing API key"}, status_code=401)
+    valid, user_id = await is_valid_key(auth_header)
+    if not valid:
+        return JSONResponse({"detail": "Invalid API key"}, status_code=401)
+
+    content_length = int(request.headers.get("content-length") or 0)
+    if content_length > MAX_UPLOAD_BYTES:
+        return JSONResponse({"detail": "Upload too large"}, status_code=413)
+
+    # Stream the body to a spooled file, never holding more than SPOOL_MAX_BYTES in memory
+    with SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode="w+b") as spool:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > MAX_UPLOAD_BYTES:
+                return JSONResponse({"detail": "Upload too large"}, status_code=413)
+            spool.write(chunk)
+        spool.seek(0)
+        file_name = request.query_params.get("file_name")
+        content_type = request.headers.get("content-type", "")
+        mime = content_type if content_type and content_type != "application/octet-stream" else guess_mime(file_name)
+        # Recorded per user: runs can only reference blobs their user uploaded
+        blob_ref = await get_blob_store().put(spool, mime=mime, owner=user_id)
+
+    return JSONResponse(blob_ref, status_code=201)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:5173"],  # or ["*"] for all
@@ -1,16 +1,18 @@
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage
 from langgraph.types import Send
+from langgraph.config import get_stream_writer
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END, START
 
 import json
 import asyncio
+import base64
 import uuid
 import time
 import os
 
-from typing import Any, List, Union
+from typing import Any, List, Optional, Union
 from typing_extensions import TypedDict
 from proximaai.utils.structured_output import (
     ReasoningPlan, 
@@ -20,16 +22,18 @@ from proximaai.utils.structured_output import (
 )
 
 from langchain_core.load.load import loads
-from langchain.load.dump import dumps
+from langchain_core.load.dump import dumps
 
 # Create alias for compatibility
 OrchestratorState = OrchestratorStateMultiAgent
 
 # Tools
 from proximaai.prebuilt.prompt_templates import PromptTemplates
+from proximaai.prebuilt.resume_conformance import get_resume_conformance
 from proximaai.tools.tool_registry import ToolRegistry
 from proximaai.tools.agent_builder import AgentBuilder
 from proximaai.utils.logger import setup_logging
+from proximaai.utils.prompt_cache import cached_system, get_prompt_cache_usage, prompt_caching_enabled
 
 # Agents
 from proximaai.agents.websearch_agent import create_websearch_agent
@@ -38,7 +42,12 @@ from proximaai.agents.resume_parsing_agent import ResumeParsingAgent
 from proximaai.agents.constructor import TextConstructorAgent
 
 # LongTerm Memory & Cache
-from langgraph.store.postgres.aio import AsyncPostgresStore
+from proximaai.data.store import get_store
+from proximaai.data.blob_store import BlobNotFound, BlobStore, InvalidDigest, get_blob_store, guess_mime, validate_digest
+from proximaai.data.research_cache import get_research_cache
+from proximaai.data.tailoring_cache import TailoringKey, get_tailoring_cache
+from proximaai.utils.company_extraction import CompanyTarget, aextract_target
+from proximaai.utils.uploads import spool_base64
 from langgraph.store.base import BaseStore
 from langchain_core.runnables import RunnableConfig
 from langgraph.cache.memory import InMemoryCache
@@ -48,11 +57,12 @@ from langgraph.types import CachePolicy
 # Setup logging
 logger = setup_logging(level="INFO")
 
-# Initialize the model
+# Initialize the model (prompt-cache reads/writes are recorded per node)
 model = init_chat_model(
     "anthropic:claude-3-7-sonnet-latest",
     temperature=0,
-    max_tokens=4000
+    max_tokens=4000,
+    callbacks=[get_prompt_cache_usage()]
 )
 
 # Get all available tools from the registry
@@ -63,504 +73,551 @@ tools = tool_registry.get_all_tools()
 agent_builder = AgentBuilder({tool.name: tool for tool in tools})
 tools.append(agent_builder)
 
+async def valid_blob_ref(blob_store: BlobStore, blob_ref: Any, owner: Optional[str]) -> bool:
+    """A client-supplied blob reference is usable if its digest is well-formed and the blob exists,
+    belongs to `owner` and has the declared size."""
+    if not isinstance(blob_ref, dict):
+        return False
+    try:
+        size = await blob_store.size(validate_digest(blob_ref.get('digest')), owner=owner)
+    except (InvalidDigest, BlobNotFound) as e:
+        logger.warning("Rejected blob reference", error=str(e))
+        return False
+    if size != blob_ref.get('size'):
+        logger.warning("Rejected blob reference", error="size mismatch", declared=blob_ref.get('size'), stored=size)
+        return False
+    return True
+
+
+def latest_content(messages: List[dict], field: str, value: str) -> str:
+    """Content of the last message whose `field` is `value` ("" if none). `messages` accumulates across
+    runs on a thread, so the latest parsed resume and request are the ones this run is about."""
+    for message in reversed(messages):
+        if message.get(field) == value:
+            return str(message.get("content", ""))
+    return ""
+
+
 async def create_orchestrator_agent():
     """Create the main orchestrator agent with reasoning and planning capabilities."""
-    async with AsyncPostgresStore.from_conn_string(os.getenv("DB_URI", "")) as store:
-        await store.setup()
-        
-        async def resume_parse(state: OrchestratorState, config: Any) -> dict:
-            async with AsyncPostgresStore.from_conn_string(os.getenv("DB_URI", "")) as store:
-                # Set Up Store - Postgres
-                await store.setup()
-                namespace = (state['user_id'] or 'unknown', 'resume_parse')
-
-                # Pull request input
-                file_input = state.get('file_input')
-                user_config = config["configurable"].get("langgraph_auth_user")
-                node_response: dict[str, Union[List[dict[str, Any]], Any]] = {"messages": [{}]}
-
-                # Check Cache
-                import hashlib
-                _key = hashlib.sha256(file_input.get('file_data').encode('utf-8')).hexdigest()
-                cache_results = await store.aget(namespace=namespace, key=f"{_key}", refresh_ttl=False)
-                if cache_results:
-                    logger.info("🔍 RESUME PARSE CACHE HIT")
-                    memory = loads(cache_results.value["data"])
-                    node_response["messages"] = [{ "type": "agent", "content": memory['content'][0]['text'] }]
-                else:
-                    # Parsing Agent
-                    parse_agent = ResumeParsingAgent(jwt=user_config['jwt'])
-                    file_input = state.get('file_input')
-                    if file_input:
-                        result = await parse_agent.invoke(**file_input)
-                        node_response["messages"] = [{ "type": "agent", "content": result['content'][0]['text'] }]
-                    else:
-                        node_response["messages"] = [{ "type": "agent", "content": "Unable to Parse Resume" }  ]        
-
-                    logger.info("Push results to Database")
-                    await store.aput(
-                        namespace=namespace, 
-                        key=f"{_key}", 
-                        value={
-                            "data": dumps(result, ensure_ascii=False)
-                        },
-                        ttl=10080 # 1 week
-                    )
-                # Mask Value    
-                node_response['file_input'] = state['file_input']
-                node_response['file_input']['file_data'] = "MASKED"     
+    store = await get_store()
+
+    async def resume_parse(state: OrchestratorState, config: RunnableConfig, *, store: BaseStore) -> dict:
+        namespace = (state['user_id'] or 'unknown', 'resume_parse')
+
+        # Pull request input
+        file_input = state.get('file_input') or {}
+        user_config = config["configurable"].get("langgraph_auth_user")
+        node_response: dict[str, Union[List[dict[str, Any]], Any]] = {"messages": [{}]}
+
+        # Blobs are scoped to the authenticated user (no owner check when running without auth)
+        owner = config["configurable"].get("langgraph_auth_user_id")
+
+        # Move a raw base64 upload out of graph state into the blob store
+        blob_store = get_blob_store()
+        blob_ref = file_input.get('blob')
+        if blob_ref is None and file_input.get('file_data'):
+            try:
+                # Chunked decode of a multi-MB payload: keep it off the event loop
+                upload = await asyncio.to_thread(spool_base64, file_input['file_data'])
+            except ValueError as e:  # UploadTooLarge or invalid base64
+                logger.warning("Rejected resume upload", error=str(e))
+                node_response["messages"] = [{ "type": "agent", "content": "Unable to Parse Resume" }]
+                return node_response
+            with upload:
+                blob_ref = await blob_store.put(upload, mime=guess_mime(file_input.get('file_name')), owner=owner)
+        if not await valid_blob_ref(blob_store, blob_ref, owner):
+            node_response["messages"] = [{ "type": "agent", "content": "Unable to Parse Resume" }]
+            return node_response
+
+        # Check Cache
+        _key = blob_ref['digest']
+        cache_results = await store.aget(namespace=namespace, key=f"{_key}", refresh_ttl=False)
+        if cache_results:
+            logger.info("🔍 RESUME PARSE CACHE HIT")
+            memory = loads(cache_results.value["data"])
+            node_response["messages"] = [{ "type": "agent", "content": memory['content'][0]['text'] }]
+        else:
+            # Parsing Agent, bytes are read lazily from the blob store
+            parse_agent = ResumeParsingAgent(jwt=user_config['jwt'] if user_config else None)
+            file_bytes = await blob_store.get(blob_ref['digest'], owner=owner)
+            result = await parse_agent.invoke(
+                file_data=base64.b64encode(file_bytes).decode('ascii'),
+                file_name=file_input.get('file_name')
+            )
+            if result.get('isError'):
+                # e.g. a full parse queue: nothing is cached, so a retry parses again
+                logger.warning("Resume parse failed", error=result['content'][0]['text'] if result.get('content') else "")
+                node_response["messages"] = [{ "type": "agent", "content": "Unable to Parse Resume" }]
                 return node_response
+            node_response["messages"] = [{ "type": "agent", "content": result['content'][0]['text'] }]
+
+            logger.info("Push results to Database")
+            await store.aput(
+                namespace=namespace, 
+                key=f"{_key}", 
+                value={
+                    "data": dumps(result, ensure_ascii=False)
+                },
+                ttl=10080 # 1 week
+            )
+        # State carries only the blob reference from here on
+        node_response['file_input'] = {
+            "file_name": file_input.get('file_name') or "resume.pdf",
+            "blob": blob_ref
+        }
+        return node_response
+
+    def markdown_stream(node: str, field: str):
+        """Forward generated markdown to clients streaming with stream_mode="custom" (a no-op otherwise)."""
+        writer = get_stream_writer()
+        return lambda delta: writer({"node": node, "field": field, "delta": delta})
+
+    async def resume_designer(state: OrchestratorState, *, store: BaseStore) -> dict:
+        """Agent rewrites the resume as markdown tailored to the company/job, with section-by-section reasoning."""
+
+        # This run's request (job description) and parsed resume
+        messages = state.get("messages", [])
+        user_message = latest_content(messages, "role", "user")
+        resume_parsed = latest_content(messages, "type", "agent")
+        websearch = state.get("websearch_results", {})
+
+        # Resume Designer Agent: the resume goes ahead of the request so repeat runs reuse the cached prompt prefix
+        agent = DesignerAgent(
+            query=HumanMessage(
+                content=f"""
+                    {user_message}
+                    Below are intermediate results from other research agents providing additional context:
+                        # Web / Company Research Agent Results
+                        {str(websearch)}
+                """
+            ),
+            resume=resume_parsed,
+            model=model
+        )
+        on_token = markdown_stream("resume_designer", "tailored_resume_markdown")
 
-        def resume_designer(state: OrchestratorState) -> dict:
-            """Agent rewrites the resume as markdown tailored to the company/job, with section-by-section reasoning."""
-
-            # Parse user messages
-            user_message = state["messages"][-1]["content"] if state["messages"] else ""
-            websearch = state.get("websearch_results", {})
-            resume_parsed = state.get("messages", [])
-
-            # Resume Designer Agent
-            agent = DesignerAgent(
-                query=HumanMessage(
-                    content=f"""
-                        {user_message}
-                        Below are intermediate results from other research agents providing additional context:
-                            # Web / Company Research Agent Results
-                            {str(websearch)}
-
-                            # User Parsed Resume
-                            {str(resume_parsed)}
-                    """
-                ),
-                model=model
+        # Same parsed resume, same request (job description) and same designer version: reuse the result
+        key = TailoringKey.build(resume=resume_parsed, job_description=user_message, version=agent.version)
+        tailoring_cache = get_tailoring_cache()
+        results, served = await tailoring_cache.get_or_tailor(key, lambda: agent.ainvoke(on_token=on_token), store=store)
+        if served != "miss":
+            on_token(results["tailored_resume_markdown"])
+        logger.info("🎨 RESUME DESIGNER COMPLETED", served=served, **tailoring_cache.metrics())
+
+        return results
+    
+    async def text_constructor_format(state: OrchestratorState) -> dict:
+        """Agent formats the tailored markdown using the RESUME_AGENT.j2 template."""
+        logger.info("🎯 Formatting resume with template")
+        tailored_md = state.get("tailored_resume_markdown", "")
+        if isinstance(tailored_md, str):
+            result = await TextConstructorAgent(model=model).ainvoke(
+                method='format',
+                markdown_like=tailored_md,
+                on_token=markdown_stream("text_constructor_format", "formatted_resume_markdown")
             )
-            results = agent.invoke()
-            
-            return results
+            logger.info("📐 TEMPLATE CONFORMANCE", **get_resume_conformance().metrics())
+            return result
+        else:
+            return {}
+
+    async def file_conversion(state: OrchestratorState) -> dict:
+        """Agent converts formatted markdown to HTML."""
+        agent_output = state.get("formatted_resume_markdown", "")
+        if isinstance(agent_output, str):
+            response = await TextConstructorAgent(model=model).ainvoke(method='convert-html', markdown_like=agent_output)
+            logger.info("💾 PROMPT CACHE USAGE", **get_prompt_cache_usage().metrics())
+            return {"messages": [{"role": "agent", "content": response.get('resume_html', 'error')}]}
+        else:
+            return {}
+
+    async def analyze_request(state: OrchestratorState) -> dict:
+        """Analyze the user request and create a reasoning plan."""
+        start_time = time.time()
+        logger.log_step("analyze_request", {"user_message_length": len(state["messages"][-1]["content"]) if state["messages"] else 0})
         
-        def text_constructor_format(state: OrchestratorState) -> dict:
-            """Agent formats the tailored markdown using the RESUME_AGENT.j2 template."""
-            logger.info("🎯 Formatting resume with template")
-            tailored_md = state.get("tailored_resume_markdown", "")
-            if isinstance(tailored_md, str):
-                return TextConstructorAgent(model=model).invoke(method='format', markdown_like=tailored_md)
-            else:
-                return {}
-
-        def file_conversion(state: OrchestratorState) -> dict:
-            """Agent converts formatted markdown to HTML."""
-            agent_output = state.get("formatted_resume_markdown", "")
-            if isinstance(agent_output, str):
-                response = TextConstructorAgent(model=model).invoke(method='convert-html', markdown_like=agent_output)
-                return {"messages": [{"role": "agent", "content": response.get('resume_html', 'error')}]}
-            else:
-                return {}
-
-        def analyze_request(state: OrchestratorState) -> dict:
-            """Analyze the user request and create a reasoning plan."""
-            start_time = time.time()
-            logger.log_step("analyze_request", {"user_message_length": len(state["messages"][-1]["content"]) if state["messages"] else 0})
-            
-            messages = state["messages"]
-            user_message = messages[-1]["content"] if messages else ""
-            
-            # Create reasoning prompt
-            reasoning_prompt = PromptTemplates('LEAD_AGENT', user_message=user_message)
-            
-            # Get reasoning from the model with structured output
-            structured_model = model.with_structured_output(ReasoningPlan)
-            reasoning_data = structured_model.invoke(reasoning_prompt)
-            
-            try:
-                # With structured output, we get the Pydantic model directly
-                if not isinstance(reasoning_data, ReasoningPlan):
-                    raise Exception("Expected ReasoningPlan but got different type")
-            except Exception as e:
-                logger.error("Failed to get structured output", error=str(e), raw_response=str(reasoning_data))
-                raise
-            
-            logger.info("🧠 ORCHESTRATOR REASONING", reasoning=reasoning_data.reasoning)
-            logger.info("📋 EXECUTION PLAN")
-            for step in reasoning_data.plan:
-                logger.info(f"  Step {step.step}: {step.task}", 
-                        agent_type=step.agent_type, 
-                        tools_needed=step.tools_needed)
-            
-            duration = time.time() - start_time
-            logger.log_performance("analyze_request", duration, plan_steps=len(reasoning_data.plan))
-            
-            return {
-                "reasoning": reasoning_data.reasoning,
-                "plan": [step.model_dump() for step in reasoning_data.plan],
-                "current_step": "reasoning_complete"
-            }
+        messages = state["messages"]
+        user_message = messages[-1]["content"] if messages else ""
         
-        async def websearch_research(state: OrchestratorState, config: RunnableConfig, *, store: BaseStore) -> dict:
-            """Perform web search research based on the user request."""
-            # Cache monitoring
-            request_id = str(uuid.uuid4())[:8]
-            execution_time = time.strftime("%H:%M:%S")
-            logger.info(f"🔄 WEBSEARCH NODE EXECUTION - Request ID: {request_id} | Time: {execution_time} | LangGraph Cache TTL: 1 second")
-            
-            async with AsyncPostgresStore.from_conn_string(os.getenv("DB_URI", "")) as store:
-                company_name = "Geico"  # Default to Geico for now TODO: Make this dynamic
-                # Set Up Store - Postgres
-                await store.setup()
-                namespace = (f"websearch_research", )
-
-                # Check Persisted Cache Web Search Results
-                cache_results = await store.aget(namespace=namespace, key=f"cache_results_{company_name}", refresh_ttl=False)
-                if cache_results:
-                    logger.info("🔍 WEB SEARCH RESEARCH CACHE HIT")
-                    memory = loads(cache_results.value["data"])
-
-                    return {
-                        "websearch_results": WebSearchResults(
-                            **memory
-                        ),
-                        "current_step": "websearch_complete_cache"
-                    }
-                    
-                    
-                # Run Web Search Research
-                logger.log_step("websearch_research", {"user_message_length": len(state["messages"][-1]["content"]) if state["messages"] else 0})
-                
-                messages = state["messages"]
-                user_message = messages[-1]["content"] if messages else ""
-                reasoning = state.get("reasoning", "")
-                
-                # Create web search agent
-                websearch_agent = create_websearch_agent()
-                
-                # Initialize the websearch agent
-                await websearch_agent.initialize()
-                
-                try:
-                    # Extract company name from user message (simple approach)
-                    user_message_lower = user_message.lower()
-                    
-                    
-                    # Execute company about page check
-                    search_result = await websearch_agent.check_company_about_page(company_name)
-                    
-                    logger.info("🔍 WEB SEARCH RESEARCH COMPLETED")
-                    logger.info("Push results to Database")
-                    await store.aput(
-                        namespace=namespace, 
-                        key=f"cache_results_{company_name}", 
-                        value={
-                            "data": dumps(search_result, ensure_ascii=False)
-                        },
-                        ttl=10080 # 1 week
-                    )
-                    return {
-                        "websearch_results": search_result,
-                        "current_step": "websearch_complete"
-                    }
-                    
-                except Exception as e:
-                    logger.error("Web search research failed", error=str(e))
-                    
-                    return {
-                        "websearch_results": WebSearchResults(
-                            company=company_name,
-                            agent_response="",
-                            tool_response=f"Error performing web research: {str(e)}",
-                            intermediate_steps={}
-                        ),
-                        "current_step": "websearch_failed"
-                    }
+        # Create reasoning prompt: stable instructions as a cached prefix, the request after them
+        instructions, request = PromptTemplates.split('LEAD_AGENT', 'user_message', user_message)
+        reasoning_prompt = [cached_system(instructions, cache=prompt_caching_enabled()), HumanMessage(content=request)]
         
-        def create_specialized_agents(state: OrchestratorState) -> dict:
-            """Create specialized agents based on the plan."""
-            start_time = time.time()
-            logger.log_step("create_specialized_agents", {"plan_steps": len(state["plan"])})
-            
-            plan = state["plan"]
-            created_agents = []
-            
-            logger.info("🔧 CREATING SPECIALIZED AGENTS")
-            
-            for step in plan:
-                agent_spec = {
-                    "name": step["agent_type"],
-                    "description": step["agent_description"],
-                    "system_prompt": step["system_prompt"],
-                    "tools": step["tools_needed"],
-                    "model": "anthropic:claude-3-7-sonnet-latest",
-                    "temperature": 0.0
-                }
-                
-                # Get available tool names
-                available_tools = [tool.name for tool in tools]
-
-                # Filter tools to only use available ones
-                available_tool_names = [tool for tool in step["tools_needed"] if tool in available_tools]
-                if not available_tool_names:
-                    # Use default tools if none of the requested tools are available
-                    available_tool_names = available_tools
-                    logger.warning(f"No requested tools available for {step['agent_type']}, using defaults", 
-                                requested_tools=step["tools_needed"], 
-                                default_tools=available_tool_names)
-                
-                # Filter tools to only use available ones
-                available_tool_names = [tool for tool in step["tools_needed"] if tool in available_tools]
-                
-                agent_spec["tools"] = available_tool_names
-                
-                # Create the agent using the agent builder
-                result = agent_builder._run(json.dumps(agent_spec))
-                logger.info(f"Created {step['agent_type']}", result=result)
-                
-                # Extract agent ID properly
-                agent_id = None
-                if "ID: " in result:
-                    id_part = result.split("ID: ")[-1]
-                    # Extract just the ID part (before the closing parenthesis)
-                    agent_id = id_part.split(")")[0] if ")" in id_part else id_part.split()[0]
-                
-                        
-                # Filter tools to only use available ones
-                available_tool_names = [tool for tool in step["tools_needed"] if tool in available_tools]
-                if not available_tool_names:
-                    # Use default tools if none of the requested tools are available
-                    available_tool_names = ["web_search", "resume_optimizer"]
-                    logger.warning(f"No requested tools available for {step['agent_type']}, using defaults", 
-                                requested_tools=step["tools_needed"], 
-                                default_tools=available_tool_names)
-                
-                agent_spec["tools"] = available_tool_names
-                
-                # Create the agent using the agent builder
-                result = agent_builder._run(json.dumps(agent_spec))
-                logger.info(f"Created {step['agent_type']}", result=result)
-                
-                # Extract agent ID properly
-                agent_id = None
-                if "ID: " in result:
-                    id_part = result.split("ID: ")[-1]
-                    # Extract just the ID part (before the closing parenthesis)
-                    agent_id = id_part.split(")")[0] if ")" in id_part else id_part.split()[0]
-                
-                created_agents.append({
-                    "step": step["step"],
-                    "agent_spec": agent_spec,
-                    "agent_id": uuid.uuid4()
-                })
-                
+        # Get reasoning from the model with structured output
+        structured_model = model.with_structured_output(ReasoningPlan)
+        reasoning_data = await structured_model.ainvoke(reasoning_prompt)
+        
+        try:
+            # With structured output, we get the Pydantic model directly
+            if not isinstance(reasoning_data, ReasoningPlan):
+                raise Exception("Expected ReasoningPlan but got different type")
+        except Exception as e:
+            logger.error("Failed to get structured output", error=str(e), raw_response=str(reasoning_data))
+            raise
+        
+        logger.info("🧠 ORCHESTRATOR REASONING", reasoning=reasoning_data.reasoning)
+        logger.info("📋 EXECUTION PLAN")
+        for step in reasoning_data.plan:
+            logger.info(f"  Step {step.step}: {step.task}", 
+                    agent_type=step.agent_type, 
+                    tools_needed=step.tools_needed)
+        
+        duration = time.time() - start_time
+        logger.log_performance("analyze_request", duration, plan_steps=len(reasoning_data.plan))
+        
+        return {
+            "reasoning": reasoning_data.reasoning,
+            "plan": [step.model_dump() for step in reasoning_data.plan],
+            "current_step": "reasoning_complete"
+        }
+    
+    async def websearch_research(state: OrchestratorState, config: RunnableConfig, *, store: BaseStore) -> dict:
+        """Perform web search research based on the user request."""
+        # Cache monitoring
+        request_id = str(uuid.uuid4())[:8]
+        execution_time = time.strftime("%H:%M:%S")
+        logger.info(f"🔄 WEBSEARCH NODE EXECUTION - Request ID: {request_id} | Time: {execution_time} | LangGraph Cache TTL: 1 second")
+        
+        # Run Web Search Research
+        logger.log_step("websearch_research", {"user_message_length": len(state["messages"][-1]["content"]) if state["messages"] else 0})
+
+        messages = state["messages"]
+        user_message = messages[-1]["content"] if messages else ""
+
+        # Company/role from the request: regex first, LLM only when that finds nothing
+        target = await aextract_target(user_message, model=model)
+        if target is None:
+            logger.info("No company found in request, skipping web research")
             return {
-                "created_agents": created_agents,
-                "current_step": "agents_created"
+                "websearch_results": WebSearchResults(
+                    company="",
+                    agent_response="",
+                    tool_response="No company identified in the request",
+                    intermediate_steps={}
+                ),
+                "current_step": "websearch_skipped"
+            }
+
+        async def research(target: CompanyTarget) -> WebSearchResults:
+            websearch_agent = create_websearch_agent()
+            await websearch_agent.initialize()
+            return await websearch_agent.check_company_about_page(target.company)
+
+        try:
+            research_cache = get_research_cache()
+            search_result, served = await research_cache.get_or_fetch(target, research, store=store)
+            logger.info("🔍 WEB SEARCH RESEARCH COMPLETED", company=target.company, role=target.role,
+                        cache_key=target.cache_key, extracted_by=target.source, served=served,
+                        **research_cache.metrics())
+            return {
+                "websearch_results": search_result,
+                "current_step": "websearch_complete" if served == "miss" else "websearch_complete_cache"
+            }
+
+        except Exception as e:
+            logger.error("Web search research failed", error=str(e))
+
+            return {
+                "websearch_results": WebSearchResults(
+                    company=target.company,
+                    agent_response="",
+                    tool_response=f"Error performing web research: {str(e)}",
+                    intermediate_steps={}
+                ),
+                "current_step": "websearch_failed"
             }
+
+    def create_specialized_agents(state: OrchestratorState) -> dict:
+        """Create specialized agents based on the plan."""
+        start_time = time.time()
+        logger.log_step("create_specialized_agents", {"plan_steps": len(state["plan"])})
+        
+        plan = state["plan"]
+        created_agents = []
+        
+        logger.info("🔧 CREATING SPECIALIZED AGENTS")
         
-        def define_agent_graph_nodes(state: OrchestratorState):
-            created_agents = state["created_agents"]
-            max_agents_to_run = state.get("max_agents_to_run", 2)  # Default to 2 agents if not specified
-            return [Send("run_agent", {"state": state, "agent_spec": agent_info["agent_spec"], "agent_id": agent_info["agent_id"]}) for agent_info in created_agents[:max_agents_to_run]]
-
-        def run_agent(state: AgentSpec) -> dict:
-            """Execute tasks with the created agents in parallel."""
-            start_time = time.time()
-            graph_state = state['state'] 
-            agent_info = state['agent_spec']
+        for step in plan:
+            agent_spec = {
+                "name": step["agent_type"],
+                "description": step["agent_description"],
+                "system_prompt": step["system_prompt"],
+                "tools": step["tools_needed"],
+                "model": "anthropic:claude-3-7-sonnet-latest",
+                "temperature": 0.0
+            }
             
-            user_message = graph_state["messages"][-1]["content"] if graph_state["messages"] else ""
-            agent_results = {}
-
             # Get available tool names
             available_tools = [tool.name for tool in tools]
-            logger.info("Available tools", tools=available_tools)
-            
+
             # Filter tools to only use available ones
-            available_tool_names = [tool for tool in agent_info["tools"] if tool in available_tools]
+            available_tool_names = [tool for tool in step["tools_needed"] if tool in available_tools]
             if not available_tool_names:
                 # Use default tools if none of the requested tools are available
                 available_tool_names = available_tools
-                logger.warning(f"No requested tools available for {agent_info['name']}, using defaults", 
-                                requested_tools=agent_info["tools"], 
-                                default_tools=available_tool_names)
+                logger.warning(f"No requested tools available for {step['agent_type']}, using defaults", 
+                            requested_tools=step["tools_needed"], 
+                            default_tools=available_tool_names)
             
-            agent_info["tools"] = available_tool_names
+            # Filter tools to only use available ones
+            available_tool_names = [tool for tool in step["tools_needed"] if tool in available_tools]
+            
+            agent_spec["tools"] = available_tool_names
             
             # Create the agent using the agent builder
-            result = agent_builder._run(json.dumps(agent_info))
-            logger.info(f"Created {agent_info['name']}", result=result)
-            logger.info(f"🚀 EXECUTING {state['agent_spec']['name']} AGENT TASKS")
+            result = agent_builder._run(json.dumps(agent_spec))
+            logger.info(f"Created {step['agent_type']}", result=result)
             
-            # Execute each agent's task
-            agent_start_time = time.time()
+            # Extract agent ID properly
+            agent_id = None
             if "ID: " in result:
                 id_part = result.split("ID: ")[-1]
                 # Extract just the ID part (before the closing parenthesis)
                 agent_id = id_part.split(")")[0] if ")" in id_part else id_part.split()[0]
-            logger.info("Processing agent", agent_id=agent_id)
             
-            if agent_id and agent_id in agent_builder.created_agents:
-                agent = agent_builder.created_agents[agent_id]["agent"]
-                agent_spec = agent_info
+                    
+            # Filter tools to only use available ones
+            available_tool_names = [tool for tool in step["tools_needed"] if tool in available_tools]
+            if not available_tool_names:
+                # Use default tools if none of the requested tools are available
+                available_tool_names = ["web_search", "resume_optimizer"]
+                logger.warning(f"No requested tools available for {step['agent_type']}, using defaults", 
+                            requested_tools=step["tools_needed"], 
+                            default_tools=available_tool_names)
+            
+            agent_spec["tools"] = available_tool_names
+            
+            # Create the agent using the agent builder
+            result = agent_builder._run(json.dumps(agent_spec))
+            logger.info(f"Created {step['agent_type']}", result=result)
+            
+            # Extract agent ID properly
+            agent_id = None
+            if "ID: " in result:
+                id_part = result.split("ID: ")[-1]
+                # Extract just the ID part (before the closing parenthesis)
+                agent_id = id_part.split(")")[0] if ")" in id_part else id_part.split()[0]
+            
+            created_agents.append({
+                "step": step["step"],
+                "agent_spec": agent_spec,
+                "agent_id": uuid.uuid4()
+            })
+            
+        return {
+            "created_agents": created_agents,
+            "current_step": "agents_created"
+        }
+    
+    def define_agent_graph_nodes(state: OrchestratorState):
+        created_agents = state["created_agents"]
+        max_agents_to_run = state.get("max_agents_to_run", 2)  # Default to 2 agents if not specified
+        return [Send("run_agent", {"state": state, "agent_spec": agent_info["agent_spec"], "agent_id": agent_info["agent_id"]}) for agent_info in created_agents[:max_agents_to_run]]
+
+    def run_agent(state: AgentSpec) -> dict:
+        """Execute tasks with the created agents in parallel."""
+        start_time = time.time()
+        graph_state = state['state'] 
+        agent_info = state['agent_spec']
+        
+        user_message = graph_state["messages"][-1]["content"] if graph_state["messages"] else ""
+        agent_results = {}
+
+        # Get available tool names
+        available_tools = [tool.name for tool in tools]
+        logger.info("Available tools", tools=available_tools)
+        
+        # Filter tools to only use available ones
+        available_tool_names = [tool for tool in agent_info["tools"] if tool in available_tools]
+        if not available_tool_names:
+            # Use default tools if none of the requested tools are available
+            available_tool_names = available_tools
+            logger.warning(f"No requested tools available for {agent_info['name']}, using defaults", 
+                            requested_tools=agent_info["tools"], 
+                            default_tools=available_tool_names)
+        
+        agent_info["tools"] = available_tool_names
+        
+        # Create the agent using the agent builder
+        result = agent_builder._run(json.dumps(agent_info))
+        logger.info(f"Created {agent_info['name']}", result=result)
+        logger.info(f"🚀 EXECUTING {state['agent_spec']['name']} AGENT TASKS")
+        
+        # Execute each agent's task
+        agent_start_time = time.time()
+        if "ID: " in result:
+            id_part = result.split("ID: ")[-1]
+            # Extract just the ID part (before the closing parenthesis)
+            agent_id = id_part.split(")")[0] if ")" in id_part else id_part.split()[0]
+        logger.info("Processing agent", agent_id=agent_id)
+        
+        if agent_id and agent_id in agent_builder.created_agents:
+            agent = agent_builder.created_agents[agent_id]["agent"]
+            agent_spec = agent_info
+            
+            logger.info(f"Executing {agent_spec['name']}", tools=agent_spec['tools'])
+            
+            # Create task-specific prompt
+            task_prompt = f"""
+            {agent_spec['system_prompt']}
+            
+            USER REQUEST: {user_message}
+            
+            Please execute your specialized task and provide a detailed response.
+            """
+            
+            logger.debug("Task prompt created", prompt_length=len(task_prompt))
+            
+            # Execute the agent
+            try:
+                logger.debug("Invoking agent")
+                response = agent.invoke({
+                    "messages": [{"role": "user", "content": task_prompt}]
+                })
                 
-                logger.info(f"Executing {agent_spec['name']}", tools=agent_spec['tools'])
+                logger.debug("Agent response received", 
+                            response_type=type(response).__name__,
+                            response_keys=list(response.keys()) if isinstance(response, dict) else "Not a dict")
                 
-                # Create task-specific prompt
-                task_prompt = f"""
-                {agent_spec['system_prompt']}
+                # Extract the response
+                messages = response.get('messages', [])
+                logger.debug("Processing messages", message_count=len(messages))
                 
-                USER REQUEST: {user_message}
+                agent_response = ""
+                for i, message in enumerate(reversed(messages)):
+                    logger.debug(f"Processing message {i}", 
+                                message_type=type(message).__name__,
+                                has_content=hasattr(message, 'content'))
+                    if hasattr(message, 'content') and isinstance(message.content, str):
+                        agent_response = message.content
+                        logger.debug("Found response", response_length=len(agent_response))
+                        break
                 
-                Please execute your specialized task and provide a detailed response.
-                """
+                if not agent_response:
+                    agent_response = "No response content found"
+                    logger.warning("No response content found")
                 
-                logger.debug("Task prompt created", prompt_length=len(task_prompt))
+                agent_results[agent_spec['name']] = {
+                    "response": agent_response,
+                    "status": "completed"
+                }
                 
-                # Execute the agent
-                try:
-                    logger.debug("Invoking agent")
-                    response = agent.invoke({
-                        "messages": [{"role": "user", "content": task_prompt}]
-                    })
-                    
-                    logger.debug("Agent response received", 
-                                response_type=type(response).__name__,
-                                response_keys=list(response.keys()) if isinstance(response, dict) else "Not a dict")
-                    
-                    # Extract the response
-                    messages = response.get('messages', [])
-                    logger.debug("Processing messages", message_count=len(messages))
-                    
-                    agent_response = ""
-                    for i, message in enumerate(reversed(messages)):
-                        logger.debug(f"Processing message {i}", 
-                                    message_type=type(message).__name__,
-                                    has_content=hasattr(message, 'content'))
-                        if hasattr(message, 'content') and isinstance(message.content, str):
-                            agent_response = message.content
-                            logger.debug("Found response", response_length=len(agent_response))
-                            break
-                    
-                    if not agent_response:
-                        agent_response = "No response content found"
-                        logger.warning("No response content found")
-                    
-                    agent_results[agent_spec['name']] = {
-                        "response": agent_response,
-                        "status": "completed"
-                    }
-                    
-                    agent_duration = time.time() - agent_start_time
-                    logger.log_agent_execution(agent_spec['name'], "completed", agent_duration)
-                    
-                except Exception as e:
-                    agent_duration = time.time() - agent_start_time
-                    logger.exception(f"Agent execution failed: {agent_spec['name']}", 
-                                    agent_name=agent_spec['name'], 
-                                    error=str(e))
-                    agent_results[agent_spec['name']] = {
-                        "response": f"Error: {str(e)}",
-                        "status": "failed"
-                    }
-                    logger.log_agent_execution(agent_spec['name'], "failed", agent_duration)
-            else:
-                logger.warning("Agent not found in created agents", agent_id=agent_id)
-                agent_results[f"agent_{agent_id}"] = {
-                    "response": "Agent not found",
+                agent_duration = time.time() - agent_start_time
+                logger.log_agent_execution(agent_spec['name'], "completed", agent_duration)
+                
+            except Exception as e:
+                agent_duration = time.time() - agent_start_time
+                logger.exception(f"Agent execution failed: {agent_spec['name']}", 
+                                agent_name=agent_spec['name'], 
+                                error=str(e))
+                agent_results[agent_spec['name']] = {
+                    "response": f"Error: {str(e)}",
                     "status": "failed"
                 }
-            
-            duration = time.time() - start_time
-            logger.log_performance("execute_agent_tasks", duration, 
-                                total_results=len(agent_results),
-                                successful_results=len([r for r in agent_results.values() if r["status"] == "completed"]))
-
-            return {
-                "agent_results": agent_results,
-                "current_step": "tasks_completed"
+                logger.log_agent_execution(agent_spec['name'], "failed", agent_duration)
+        else:
+            logger.warning("Agent not found in created agents", agent_id=agent_id)
+            agent_results[f"agent_{agent_id}"] = {
+                "response": "Agent not found",
+                "status": "failed"
             }
+        
+        duration = time.time() - start_time
+        logger.log_performance("execute_agent_tasks", duration, 
+                            total_results=len(agent_results),
+                            successful_results=len([r for r in agent_results.values() if r["status"] == "completed"]))
+
+        return {
+            "agent_results": agent_results,
+            "current_step": "tasks_completed"
+        }
 
-        def synthesize_final_response(state: OrchestratorState) -> dict:
-            """Synthesize responses from all agents into a final response."""
-            start_time = time.time()
-            logger.log_step("synthesize_final_response", {"agent_results_count": len(state["agent_results"])})
-            
-            agent_results = state["agent_results"]
-            websearch_results = state.get("websearch_results", {})
-            user_message = state["messages"][-1]["content"] if state["messages"] else ""
-            reasoning = state["reasoning"]
-            
-            # Create synthesis prompt
-            synthesis_prompt = f"""
-            You are the lead orchestrator synthesizing responses from multiple specialized agents.
+    def synthesize_final_response(state: OrchestratorState) -> dict:
+        """Synthesize responses from all agents into a final response."""
+        start_time = time.time()
+        logger.log_step("synthesize_final_response", {"agent_results_count": len(state["agent_results"])})
+        
+        agent_results = state["agent_results"]
+        websearch_results = state.get("websearch_results", {})
+        user_message = state["messages"][-1]["content"] if state["messages"] else ""
+        reasoning = state["reasoning"]
+        
+        # Create synthesis prompt
+        synthesis_prompt = f"""
+        You are the lead orchestrator synthesizing responses from multiple specialized agents.
 
-            ORIGINAL USER REQUEST:
-            {user_message}
+        ORIGINAL USER REQUEST:
+        {user_message}
 
-            ORCHESTRATOR REASONING:
-            {reasoning}
+        ORCHESTRATOR REASONING:
+        {reasoning}
 
-            WEB SEARCH RESEARCH:
-            {json.dumps(websearch_results, indent=2)}
+        WEB SEARCH RESEARCH:
+        {json.dumps(websearch_results, indent=2)}
 
-            AGENT RESPONSES:
-            {json.dumps(agent_results, indent=2)}
+        AGENT RESPONSES:
+        {json.dumps(agent_results, indent=2)}
 
-            Your task is to synthesize all the agent responses and web search research into a comprehensive, well-structured final response that:
-            1. Addresses the user's original request completely
-            2. Integrates insights from web search research and all specialized agents
-            3. Provides actionable recommendations based on current market information
-            4. Maintains a professional and helpful tone
+        Your task is to synthesize all the agent responses and web search research into a comprehensive, well-structured final response that:
+        1. Addresses the user's original request completely
+        2. Integrates insights from web search research and all specialized agents
+        3. Provides actionable recommendations based on current market information
+        4. Maintains a professional and helpful tone
 
-            Provide your final synthesized response:
-            """
-            
-            # Get final response from the model
-            response = model.invoke(synthesis_prompt)
-            final_response = response.content if hasattr(response, 'content') and isinstance(response.content, str) else str(response)
-            
-            logger.info("🤖 FINAL SYNTHESIZED RESPONSE", response_length=len(final_response))
-            
-            duration = time.time() - start_time
-            logger.log_performance("synthesize_final_response", duration, response_length=len(final_response))
-            
-            return {
-                "final_response": final_response,
-                "current_step": "complete"
-            }
+        Provide your final synthesized response:
+        """
         
-        # Create the workflow graph
-        workflow = StateGraph(OrchestratorState)
+        # Get final response from the model
+        response = model.invoke(synthesis_prompt)
+        final_response = response.content if hasattr(response, 'content') and isinstance(response.content, str) else str(response)
         
-        # Add nodes
-        # workflow.add_node("analyze_request", analyze_request)
-        workflow.add_node("websearch_research", websearch_research, cache_policy=CachePolicy(ttl=5))
-        # workflow.add_node("create_agents", create_specialized_agents)
-        # workflow.add_node("run_agent", run_agent)
-        # workflow.add_node("synthesize_response", synthesize_final_response)
-        workflow.add_node("Resume_Parsing_Agent", resume_parse, cache_policy=CachePolicy(ttl=5))
-        workflow.add_node("resume_designer", resume_designer)
-        workflow.add_node("text_constructor_format", text_constructor_format)
-        workflow.add_node("file_conversion", file_conversion)
+        logger.info("🤖 FINAL SYNTHESIZED RESPONSE", response_length=len(final_response))
         
-        # Add edges
-        workflow.add_edge(START, "Resume_Parsing_Agent")
-        workflow.add_edge(START, "websearch_research")
-        workflow.add_edge("websearch_research", "resume_designer")
-        workflow.add_edge("Resume_Parsing_Agent", "resume_designer")
-        workflow.add_edge("resume_designer", "text_constructor_format")
-        workflow.add_edge("text_constructor_format", "file_conversion")
-        # workflow.add_edge("analyze_request", "websearch_research")
-        # workflow.add_edge("analyze_request", "create_agents")
-        # workflow.add_edge("websearch_research", "synthesize_response")
-
-        #Dynamic Conditional Edges
-        # workflow.add_conditional_edges("create_agents", define_agent_graph_nodes, ["run_agent"])
-        # workflow.add_edge("run_agent", "synthesize_response")
-        # workflow.add_edge("synthesize_response", END)
+        duration = time.time() - start_time
+        logger.log_performance("synthesize_final_response", duration, response_length=len(final_response))
         
+        return {
+            "final_response": final_response,
+            "current_step": "complete"
+        }
+    
+    # Create the workflow graph
+    workflow = StateGraph(OrchestratorState)
+    
+    # Add nodes
+    # workflow.add_node("analyze_request", analyze_request)
+    workflow.add_node("websearch_research", websearch_research, cache_policy=CachePolicy(ttl=5))
+    # workflow.add_node("create_agents", create_specialized_agents)
+    # workflow.add_node("run_agent", run_agent)
+    # workflow.add_node("synthesize_response", synthesize_final_response)
+    workflow.add_node("Resume_Parsing_Agent", resume_parse, cache_policy=CachePolicy(ttl=5))
+    workflow.add_node("resume_designer", resume_designer)
+    workflow.add_node("text_constructor_format", text_constructor_format)
+    workflow.add_node("file_conversion", file_conversion)
+    
+    # Add edges
+    workflow.add_edge(START, "Resume_Parsing_Agent")
+    workflow.add_edge(START, "websearch_research")
+    workflow.add_edge("websearch_research", "resume_designer")
+    workflow.add_edge("Resume_Parsing_Agent", "resume_designer")
+    workflow.add_edge("resume_designer", "text_constructor_format")
+    workflow.add_edge("text_constructor_format", "file_conversion")
+    # workflow.add_edge("analyze_request", "websearch_research")
+    # workflow.add_edge("analyze_request", "create_agents")
+    # workflow.add_edge("websearch_research", "synthesize_response")
+
+    #Dynamic Conditional Edges
+    # workflow.add_conditional_edges("create_agents", define_agent_graph_nodes, ["run_agent"])
+    # workflow.add_edge("run_agent", "synthesize_response")
+    # workflow.add_edge("synthesize_response", END)
+    
 
 
-        return workflow.compile(
-            store=store,
-            cache=InMemoryCache()
-        )
+    return workflow.compile(
+        store=store,
+        cache=InMemoryCache()
+    )
 
 
 def format_response(response):
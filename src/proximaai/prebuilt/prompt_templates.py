@@ -5,6 +5,27 @@ from proximaai.utils.logger import get_logger
 
 logger = get_logger("prompt_templates")
 
+_VARIABLE_SENTINEL = "\x00PROMPT_VARIABLE\x00"
+
+
+def split_prompt(template: Template, variable: str, value: str, **kwargs) -> tuple[str, str]:
+    """Render `template` as (stable prefix, per-run suffix) so the prefix can be prompt-cached.
+
+    The line holding `variable` moves to the end, together with the label line above it when the
+    value sits on a line of its own (e.g. "Markdown Input:" / "{{resume_markdown}}"). A template
+    that never renders `variable` has nothing stable to split off: the whole render is the suffix.
+    """
+    lines = template.render(**kwargs, **{variable: _VARIABLE_SENTINEL}).split("\n")
+    index = next((i for i, line in enumerate(lines) if _VARIABLE_SENTINEL in line), None)
+    if index is None:
+        return "", template.render(**kwargs, **{variable: value}).strip()
+    start = index
+    if lines[index].strip() == _VARIABLE_SENTINEL and index > 0 and lines[index - 1].rstrip().endswith(":"):
+        start = index - 1
+    suffix = "\n".join(lines[start:index + 1]).replace(_VARIABLE_SENTINEL, value)
+    prefix = "\n".join(lines[:start] + lines[index + 1:])
+    return prefix.strip(), suffix.strip()
+
 class PromptTemplates:
     _template_dir = Path(__file__).parent / 'templates'
     _general_agent_template_name = "GENERAL_AGENT"
@@ -29,6 +50,12 @@ class PromptTemplates:
         except KeyError:
             return f"Template {template_name} not found"
 
+    @classmethod
+    def split(cls, template_name: str, variable: str, value: str, **kwargs) -> tuple[str, str]:
+        """Like `PromptTemplates(template_name, variable=value)`, as (stable prefix, per-run suffix)."""
+        general_agent_prompt = cls._templates[cls._general_agent_template_name].render()
+        return split_prompt(cls._templates[template_name], variable, value, **kwargs, general_agent_prompt=general_agent_prompt)
+
 
 if __name__ == "__main__":
     # Example usage:
@@ -0,0 +1,201 @@
+"""
+Resume Conformance - Deterministic check and normalization of resume markdown against RESUME_AGENT.j2.
+
+The rules are read from the template itself: its <style> block, the contact block under the name,
+the `##` sections in order, and the layout each section expects (an HTML container such as
+`<table>`, or `###` entries). Trivial deviations are fixed locally: wrapping code fences, a
+missing style block, heading levels, blank lines around headings and lists, and `---` section
+separators. Only structural divergences (missing name or contact block, sections out of order,
+a section without its table/list layout) need the LLM format pass.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from textwrap import dedent
+from typing import Any, Dict, List, Optional, Tuple
+import re
+
+TEMPLATE_PATH = Path(__file__).parent / "templates" / "RESUME_AGENT.j2"
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])\s+")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+_WRAPPING_FENCE = re.compile(r"^```[\w-]*[ \t]*\n(.*?)\n```$", re.DOTALL)
+_STYLE = re.compile(r"<style>.*?</style>", re.DOTALL)
+
+
+def section_key(title: str) -> str:
+    """Case/punctuation-insensitive section name, e.g. 'Skills & Tools' -> 'skills and tools'."""
+    return " ".join(re.findall(r"[a-z0-9]+", title.lower().replace("&", " and ")))
+
+
+@dataclass(frozen=True)
+class TemplateRules:
+    style: str  # the template's <style> block
+    contact: str  # opening tag of the contact block under the name
+    sections: Tuple[str, ...]  # `##` section titles in template order
+    containers: Dict[str, str]  # section key -> opening HTML its content goes in
+    entry_sections: Tuple[str, ...]  # section keys whose entries are `###` headings
+    layout: str  # the template without its style block
+
+    @classmethod
+    def from_template(cls, template: str) -> "TemplateRules":
+        body = dedent(template.split('"""')[1]).strip()
+        style = _STYLE.search(body).group(0)  # type: ignore[union-attr]
+        contact = re.search(r"^<div class=\"[^\"]+\">", body, re.MULTILINE).group(0)  # type: ignore[union-attr]
+        sections, containers, entry_sections = [], {}, []
+        for title, content in re.findall(r"^## ([^\n]+)\n(.*?)(?=^## |\Z)", body, re.MULTILINE | re.DOTALL):
+            sections.append(title.strip())
+            first = next((line.strip() for line in content.splitlines() if line.strip() not in ("", "---")), "")
+            if first.startswith("<"):
+                containers[section_key(title)] = first.split("<tr>")[0]
+            elif first.startswith("### "):
+                entry_sections.append(section_key(title))
+        layout = _STYLE.sub("", body).strip()
+        return cls(style, contact, tuple(sections), containers, tuple(entry_sections), layout)
+
+
+@dataclass
+class ConformanceResult:
+    markdown: str  # normalized markdown
+    fixes: List[str] = field(default_factory=list)  # trivial issues fixed locally
+    divergences: List[str] = field(default_factory=list)  # structural issues that need the LLM pass
+
+    @property
+    def conforms(self) -> bool:
+        return not self.divergences
+
+
+class ResumeConformance:
+    """Normalizes resume markdown, checks it against the template rules and counts how often the
+    LLM format pass could be skipped."""
+
+    def __init__(self, rules: TemplateRules):
+        self.rules = rules
+        self._order = {section_key(title): i for i, title in enumerate(rules.sections)}
+        self.checked = 0
+        self.skipped = 0
+        self.fixes: Counter = Counter()
+        self.divergences: Counter = Counter()
+
+    def check(self, markdown: str) -> ConformanceResult:
+        """Normalize `markdown` and report whether it conforms; updates the skip metrics."""
+        result = self.normalize(markdown)
+        result.divergences = self.divergences_of(result.markdown)
+        self.checked += 1
+        self.skipped += result.conforms
+        self.fixes.update(result.fixes)
+        self.divergences.update(result.divergences)
+        return result
+
+    def normalize(self, markdown: str) -> ConformanceResult:
+        fixes: List[str] = []
+        text = markdown.replace("\r\n", "\n").strip()
+        wrapped = _WRAPPING_FENCE.match(text)
+        if wrapped:
+            text = wrapped.group(1).strip()
+            fixes.append("code_fence")
+
+        lines = [line.rstrip() for line in text.split("\n")]
+        lines = self._fix_heading_levels(lines, fixes)
+        lines = self._fix_spacing(lines, fixes)
+        text = re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+        if "<style>" not in text:
+            text = f"{self.rules.style}\n\n{text}"
+            fixes.append("style")
+        return ConformanceResult(markdown=text + "\n", fixes=list(dict.fromkeys(fixes)))
+
+    def _fix_heading_levels(self, lines: List[str], fixes: List[str]) -> List[str]:
+        fixed, in_fence, previous_level = [], False, 0
+        for line in lines:
+            if _FENCE.match(line):
+                in_fence = not in_fence
+            heading = None if in_fence else _HEADING.match(line)
+            if heading is None:
+                fixed.append(line)
+                continue
+            level, title = len(heading.group(1)), heading.group(2)
+            if section_key(title) in self._order:
+                wanted = 2
+            elif previous_level == 0:
+                wanted = 1  # the first heading is the name
+            else:
+                wanted = min(level, max(previous_level, 2) + 1)  # no skipped levels under a section
+            if wanted != level:
+                fixes.append("heading_level")
+            fixed.append(f"{'#' * wanted} {title}")
+            previous_level = wanted
+        return fixed
+
+    def _fix_spacing(self, lines: List[str], fixes: List[str]) -> List[str]:
+        fixed: List[str] = []
+        in_fence = False
+        for line in lines:
+            if _FENCE.match(line):
+                in_fence = not in_fence
+            elif not in_fence and line:
+                previous = fixed[-1] if fixed else ""
+                is_heading = _HEADING.match(line) is not None
+                if line.startswith("## ") and fixed and previous != "---" and "---" not in fixed[-2:]:
+                    fixed += ["", "---", ""] if previous else ["---", ""]
+                    fixes.append("separator")
+                    previous = ""
+                starts_list = _LIST_ITEM.match(line) and not _LIST_ITEM.match(previous) and not previous.startswith((" ", "\t"))
+                if previous and (is_heading or starts_list or _HEADING.match(previous) or previous.startswith("**")):
+                    fixed.append("")
+                    fixes.append("blank_line")
+            fixed.append(line)
+        return fixed
+
+    def divergences_of(self, markdown: str) -> List[str]:
+        """Structural differences from the template that a local fix cannot resolve."""
+        divergences = []
+        headings = [(len(m.group(1)), m.group(2), m.start()) for m in re.finditer(r"^(#{1,3}) (.+)$", markdown, re.MULTILINE)]
+        sections = [(title, start) for level, title, start in headings if level == 2]
+        if sum(1 for level, _, _ in headings if level == 1) != 1:
+            divergences.append("name_heading")
+        if not sections:
+            return divergences + ["sections"]
+        if self.rules.contact not in markdown[:sections[0][1]]:
+            divergences.append("contact")
+
+        positions = [self._order.get(section_key(title)) for title, _ in sections]
+        known = [position for position in positions if position is not None]
+        extras_before_known = any(position is None for position in positions[:positions.index(known[-1])]) if known else False
+        if known != sorted(set(known)) or extras_before_known:
+            divergences.append("section_order")
+
+        bounds = [start for _, start in sections[1:]] + [len(markdown)]
+        for (title, start), end in zip(sections, bounds):
+            key, content = section_key(title), markdown[start:end]
+            container = self.rules.containers.get(key)
+            if container and container not in content:
+                divergences.append(f"layout:{key}")
+            if key in self.rules.entry_sections and not re.search(r"^### ", content, re.MULTILINE):
+                divergences.append(f"layout:{key}")
+        return divergences
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "checked": self.checked,
+            "llm_skipped": self.skipped,
+            "llm_calls": self.checked - self.skipped,
+            "skip_rate": round(self.skipped / self.checked, 4) if self.checked else 0.0,
+            "fixes": dict(self.fixes),
+            "divergences": dict(self.divergences),
+        }
+
+
+# Global resume conformance instance
+_resume_conformance: Optional[ResumeConformance] = None
+
+
+def get_resume_conformance() -> ResumeConformance:
+    """Get or create the process-wide checker for RESUME_AGENT.j2 (so metrics span runs)."""
+    global _resume_conformance
+
+    if _resume_conformance is None:
+        _resume_conformance = ResumeConformance(TemplateRules.from_template(TEMPLATE_PATH.read_text()))
+
+    return _resume_conformance
@@ -0,0 +1,205 @@
+"""
+Job Feeds - Streaming ingestion of JSONL, CSV and RSS/Atom job feeds into the job index.
+
+Feed files dropped into a directory are read lazily with generators, one record at a time,
+normalized into `JobPosting`, and upserted into the JobIndex in batches. The index skips
+postings whose content is unchanged and reposts whose description is a near-identical MinHash
+match, so re-ingesting a large feed only writes its deltas.
+"""
+
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from html import unescape
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import csv
+import os
+import re
+import xml.etree.ElementTree as ET
+
+from proximaai.tools.job_index import IndexStats, JobIndex, get_job_index, iter_jsonl
+from proximaai.tools.job_search import JobPosting
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("job_feeds")
+
+# Feed field names accepted for each JobPosting field, first match wins
+FIELD_ALIASES = {
+    "id": ["id", "job_id", "guid", "reference"],
+    "title": ["title", "job_title", "position", "name"],
+    "company": ["company", "company_name", "employer", "hiring_organization"],
+    "location": ["location", "job_location", "city"],
+    "description": ["description", "summary", "content", "body"],
+    "requirements": ["requirements", "qualifications", "skills"],
+    "salary_range": ["salary_range", "salary", "compensation"],
+    "job_type": ["job_type", "employment_type", "type"],
+    "remote_option": ["remote_option", "remote", "is_remote"],
+    "application_url": ["application_url", "url", "link", "apply_url"],
+    "posted_date": ["posted_date", "date_posted", "pubdate", "published", "updated", "date"],
+    "source": ["source"],
+}
+
+JOB_TYPES = {"full_time", "part_time", "contract", "internship"}
+
+_TAG = re.compile(r"<[^>]+>")
+_LIST_SEPARATOR = re.compile(r"[;\n|•]+")
+
+
+def iter_csv(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+    """Stream rows of a CSV feed with a header line as dicts, dropping empty cells."""
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            yield {key.strip(): value for key, value in row.items() if key and value not in (None, "")}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def iter_rss(path: Union[str, os.PathLike]) -> Iterator[Dict[str, Any]]:
+    """Stream RSS <item> and Atom <entry> elements as dicts of child tag -> text."""
+    for _, element in ET.iterparse(path, events=("end",)):
+        if _local_name(element.tag) not in ("item", "entry"):
+            continue
+        record: Dict[str, Any] = {}
+        for child in element:
+            name = _local_name(child.tag)
+            if name == "link" and child.get("href"):
+                record.setdefault("link", child.get("href"))  # Atom links carry the URL as an attribute
+            elif child.text and child.text.strip():
+                record.setdefault(name, child.text.strip())
+        element.clear()  # keep memory flat on large feeds
+        yield record
+
+
+FEED_READERS = {
+    ".jsonl": iter_jsonl,
+    ".ndjson": iter_jsonl,
+    ".csv": iter_csv,
+    ".rss": iter_rss,
+    ".xml": iter_rss,
+    ".atom": iter_rss,
+}
+
+
+def iter_feed_records(directory: Union[str, os.PathLike]) -> Iterator[Tuple[Path, Dict[str, Any]]]:
+    """Stream (feed path, raw record) from every supported feed file under a directory."""
+    for path in sorted(Path(directory).rglob("*")):
+        reader = FEED_READERS.get(path.suffix.lower())
+        if reader is None or not path.is_file():
+            continue
+        try:
+            for record in reader(path):
+                yield path, record
+        except (OSError, ET.ParseError, csv.Error, UnicodeDecodeError) as e:
+            logger.warning("Stopped reading feed", path=str(path), error=str(e))
+
+
+def _field(record: Dict[str, Any], field: str) -> Any:
+    """First non-empty value among a field's aliases; `record` keys must be lowercased."""
+    for alias in FIELD_ALIASES[field]:
+        if record.get(alias) not in (None, ""):
+            return record[alias]
+    return None
+
+
+def _text(value: Any) -> str:
+    """Plain text from a feed value, stripping HTML markup that RSS descriptions often carry."""
+    if value is None:
+        return ""
+    text = str(value)
+    if "<" in text:
+        text = _TAG.sub(" ", text)
+    if "&" in text:
+        text = unescape(text)
+    return " ".join(text.split())
+
+
+def _requirements(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [_text(item) for item in value if _text(item)]
+    return [part.strip() for part in _LIST_SEPARATOR.split(_text(value)) if part.strip()]
+
+
+def _job_type(value: Any) -> str:
+    job_type = re.sub(r"[\s-]+", "_", _text(value).lower())
+    return job_type if job_type in JOB_TYPES else "full_time"
+
+
+def _remote(value: Any, location: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    if value is None:
+        return "remote" in location.lower()
+    return str(value).strip().lower() in ("1", "true", "yes", "y", "remote")
+
+
+def _posted_date(value: Any) -> str:
+    """ISO date (YYYY-MM-DD) from an ISO timestamp or an RSS RFC 822 date."""
+    text = _text(value)
+    if not text:
+        return ""
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date().isoformat()
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(text).date().isoformat()
+    except (TypeError, ValueError):
+        return text[:10]
+
+
+def normalize_posting(record: Dict[str, Any], source: str = "") -> Optional[JobPosting]:
+    """Map a raw feed record onto JobPosting, or None when it has no title or description."""
+    record = {key.lower(): value for key, value in record.items()}
+    title = _text(_field(record, "title"))
+    description = _text(_field(record, "description"))
+    if not title or not description:
+        return None
+    location = _text(_field(record, "location"))
+    salary = _text(_field(record, "salary_range"))
+    return JobPosting(
+        title=title,
+        company=_text(_field(record, "company")),
+        location=location,
+        description=description,
+        requirements=_requirements(_field(record, "requirements")),
+        salary_range=salary or None,
+        job_type=_job_type(_field(record, "job_type")),
+        remote_option=_remote(_field(record, "remote_option"), location),
+        application_url=_text(_field(record, "application_url")),
+        posted_date=_posted_date(_field(record, "posted_date")),
+        source=_text(_field(record, "source")) or source,
+    )
+
+
+def iter_postings(directory: Union[str, os.PathLike], stats: Optional[IndexStats] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream normalized posting dicts from a feed directory.
+
+    A record's source defaults to its feed file's name, and a feed-provided id is qualified by
+    the source so ids from different boards never collide. Records without an id are keyed by
+    company, title, location and URL.
+    """
+    for path, record in iter_feed_records(directory):
+        record = {key.lower(): value for key, value in record.items()}
+        posting = normalize_posting(record, source=path.stem)
+        if posting is None:
+            if stats is not None:
+                stats.invalid += 1
+            continue
+        fields = dict(vars(posting))
+        record_id = _field(record, "id")
+        if record_id not in (None, ""):
+            fields["id"] = f"{posting.source}:{record_id}"
+        yield fields
+
+
+def ingest_feeds(directory: Union[str, os.PathLike], index: Optional[JobIndex] = None,
+                 batch_size: int = 5000) -> IndexStats:
+    """Ingest every feed under `directory` into the index (default: the JOB_SEARCH_INDEX one)."""
+    index = index or get_job_index()
+    if index is None:
+        raise ValueError("No job index: pass one or set JOB_SEARCH_INDEX")
+    stats = IndexStats()
+    return index.upsert_postings(iter_postings(directory, stats), batch_size=batch_size, stats=stats)
@@ -0,0 +1,465 @@
+"""
+Job Index - Local SQLite index of JobPosting records behind JobSearchTool.
+
+Postings live in a `jobs` table with B-tree indexes on location, company, remote_option and
+job_type, plus an external-content FTS5 table over title and description ranked with BM25.
+Job titles repeat heavily across postings, so distinct titles also get their own small FTS
+table: a title search ranks a few thousand titles, then reads each title's newest postings from
+the (title_id, posted_date) index and stops at k, instead of scoring every matching posting.
+Feeds are bulk loaded from JSONL in large transactions. Upserts are incremental: a posting whose
+content hash is unchanged is skipped, and a new posting whose description is a near-identical
+MinHash match for one already indexed at the same company, title and location (a repost under a
+new id or URL) is dropped, so re-ingesting a feed only writes what changed.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from proximaai.tools.near_duplicates import (
+    Signature, band_keys, minhash_signature, pack_signature, similarity, unpack_signature
+)
+from proximaai.tools.search_backends import fts_query
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("job_index")
+
+# JobPosting fields stored as columns, in table order
+JOB_FIELDS = [
+    "title", "company", "location", "description", "requirements", "salary_range",
+    "job_type", "remote_option", "application_url", "posted_date", "source"
+]
+
+
+def job_key(posting: Dict[str, Any]) -> str:
+    """Stable key for a posting: its `id`, else a hash of company, title, location and URL."""
+    if posting.get("id"):
+        return str(posting["id"])
+    identity = "\x1f".join(str(posting.get(field) or "").strip().lower()
+                           for field in ("company", "title", "location", "application_url"))
+    return hashlib.sha1(identity.encode("utf-8")).hexdigest()
+
+
+def content_hash(fields: Iterable[Any]) -> int:
+    """Signed 64-bit hash of a posting's stored field values, used to detect changed postings."""
+    digest = hashlib.blake2b("\x1f".join(map(str, fields)).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def posting_row(posting: Any) -> tuple:
+    """(job_key, *JOB_FIELDS, content_hash) row for a JobPosting or a posting dict."""
+    if not isinstance(posting, dict):
+        posting = vars(posting)
+    requirements = posting.get("requirements") or []
+    fields = (
+        posting.get("title") or "",
+        posting.get("company") or "",
+        posting.get("location") or "",
+        posting.get("description") or "",
+        json.dumps(requirements if isinstance(requirements, list) else [requirements]),
+        posting.get("salary_range"),
+        posting.get("job_type") or "",
+        int(bool(posting.get("remote_option"))),
+        posting.get("application_url") or "",
+        posting.get("posted_date") or "",
+        posting.get("source") or "",
+    )
+    return (job_key(posting),) + fields + (content_hash(fields),)
+
+
+def iter_jsonl(paths: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]]) -> Iterator[Dict[str, Any]]:
+    """Stream posting dicts from one or more JSONL files, skipping blank and malformed lines."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning("Skipping malformed JSONL line", path=str(path), line=line_number, error=str(e))
+
+
+# A prefix filter matching fewer postings than this drives title searches from its own index
+SELECTIVE_FILTER_ROWS = 10000
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _placeholders(values: List[Any]) -> str:
+    return ", ".join("?" * len(values))
+
+
+@dataclass
+class IndexStats:
+    """What an upsert did with each posting it was given."""
+    seen: int = 0
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    duplicates: int = 0  # same key twice in a batch, or an identical repost under a new key
+    near_duplicates: int = 0
+    invalid: int = 0  # records a feed reader could not turn into a posting
+
+    @property
+    def written(self) -> int:
+        return self.inserted + self.updated
+
+
+class JobIndex:
+    """SQLite job index with FTS5 text search, indexed filters, top-k ranking and paging.
+
+    Title searches rank by title relevance, then recency. Free-text queries rank by BM25 (title
+    weighted over description) with `ORDER BY rank LIMIT k`; filter-only queries return the
+    newest postings first. Location and company match by
+    case-insensitive prefix so their indexes are used. Each thread gets its own read connection;
+    writes are serialized.
+    """
+
+    def __init__(self, db_path: Union[str, os.PathLike], title_weight: float = 10.0,
+                 near_duplicate_threshold: Optional[float] = 0.8):
+        self.db_path = str(db_path)
+        self.title_weight = title_weight
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._title_ids: Dict[str, int] = {}
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._setup()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+            self._local.conn = conn
+        return conn
+
+    def _setup(self):
+        conn = self._connect()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS job_titles (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL UNIQUE
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS job_titles_fts USING fts5(
+                title, content='job_titles', content_rowid='id', tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS job_titles_ai AFTER INSERT ON job_titles BEGIN
+                INSERT INTO job_titles_fts(rowid, title) VALUES (new.id, new.title);
+            END;
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY,
+                job_key TEXT NOT NULL UNIQUE,
+                title_id INTEGER NOT NULL REFERENCES job_titles(id),
+                title TEXT NOT NULL DEFAULT '',
+                company TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+                location TEXT NOT NULL DEFAULT '' COLLATE NOCASE,
+                description TEXT NOT NULL DEFAULT '',
+                requirements TEXT NOT NULL DEFAULT '[]',
+                salary_range TEXT,
+                job_type TEXT NOT NULL DEFAULT '',
+                remote_option INTEGER NOT NULL DEFAULT 0,
+                application_url TEXT NOT NULL DEFAULT '',
+                posted_date TEXT NOT NULL DEFAULT '',
+                source TEXT NOT NULL DEFAULT '',
+                content_hash INTEGER,
+                signature BLOB
+            );
+            CREATE INDEX IF NOT EXISTS jobs_title ON jobs(title_id, posted_date);
+            CREATE INDEX IF NOT EXISTS jobs_location ON jobs(location, title_id, posted_date, remote_option, job_type);
+            CREATE INDEX IF NOT EXISTS jobs_company ON jobs(company, title_id, posted_date, remote_option, job_type);
+            CREATE INDEX IF NOT EXISTS jobs_remote_option ON jobs(remote_option, posted_date);
+            CREATE INDEX IF NOT EXISTS jobs_job_type ON jobs(job_type, posted_date);
+            CREATE INDEX IF NOT EXISTS jobs_posted_date ON jobs(posted_date);
+            CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                title, description, content='jobs', content_rowid='id', tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, description ON jobs BEGIN
+                INSERT INTO jobs_fts(jobs_fts, rowid, title, description) VALUES ('delete', old.id, old.title, old.description);
+                INSERT INTO jobs_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+            END;
+            CREATE TABLE IF NOT EXISTS job_signature_bands (
+                band_key INTEGER NOT NULL,
+                job_id INTEGER NOT NULL,
+                PRIMARY KEY (band_key, job_id)
+            ) WITHOUT ROWID;
+            """
+        )
+        # Indexes created before incremental upserts lack the change-detection columns
+        existing_columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        for column, declaration in (("content_hash", "INTEGER"), ("signature", "BLOB")):
+            if column not in existing_columns:
+                conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {declaration}")
+        # Persist the weighted BM25 as the table's rank function so ORDER BY rank uses it
+        conn.execute("INSERT INTO jobs_fts(jobs_fts, rank) VALUES ('rank', ?)",
+                     (f"bm25({float(self.title_weight)}, 1.0)",))
+        conn.commit()
+
+    def index_postings(self, postings: Iterable[Any], batch_size: int = 5000) -> int:
+        """Bulk upsert JobPostings or posting dicts. Returns how many were inserted or updated."""
+        return self.upsert_postings(postings, batch_size=batch_size).written
+
+    def upsert_postings(self, postings: Iterable[Any], batch_size: int = 5000,
+                        stats: Optional[IndexStats] = None) -> IndexStats:
+        """Bulk upsert, one transaction per batch, writing only new and changed postings."""
+        stats = stats or IndexStats()
+        batch: List[tuple] = []
+        with self._write_lock:
+            conn = self._connect()
+            for posting in postings:
+                batch.append(posting_row(posting))
+                if len(batch) >= batch_size:
+                    self._write_batch(conn, batch, stats)
+                    batch = []
+            if batch:
+                self._write_batch(conn, batch, stats)
+        logger.info("Indexed job postings", db_path=self.db_path, **vars(stats))
+        return stats
+
+    def _title_id(self, conn: sqlite3.Connection, title: str) -> int:
+        if not self._title_ids:
+            self._title_ids = dict(conn.execute("SELECT title, id FROM job_titles"))
+        title_id = self._title_ids.get(title)
+        if title_id is None:
+            title_id = conn.execute("INSERT INTO job_titles (title) VALUES (?)", (title,)).lastrowid
+            self._title_ids[title] = title_id
+        return title_id
+
+    def _existing(self, conn: sqlite3.Connection, keys: List[str]) -> Dict[str, tuple]:
+        """job_key -> (id, content_hash, signature, title, company, location) for keys already indexed."""
+        existing = {}
+        for start in range(0, len(keys), 1000):
+            chunk = keys[start:start + 1000]
+            for row in conn.execute(
+                "SELECT job_key, id, content_hash, signature, title, company, location FROM jobs "
+                f"WHERE job_key IN ({_placeholders(chunk)})", chunk
+            ):
+                existing[row[0]] = row[1:]
+        return existing
+
+    @staticmethod
+    def _band_keys(signature: Optional[Signature], title: str, company: str, location: str) -> List[int]:
+        return band_keys(signature, (company.lower(), title.lower(), location.lower())) if signature else []
+
+    @staticmethod
+    def _best_match(conn: sqlite3.Connection, signature: Signature, keys: List[int],
+                    pending: Dict[int, List[Signature]]) -> float:
+        """Highest similarity to an indexed or pending posting sharing an LSH band."""
+        candidates = [candidate for key in keys for candidate in pending.get(key, ())]
+        candidates += [unpack_signature(blob) for (blob,) in conn.execute(
+            "SELECT DISTINCT j.signature FROM job_signature_bands b JOIN jobs j ON j.id = b.job_id "
+            f"WHERE b.band_key IN ({_placeholders(keys)})", keys
+        )]
+        return max((similarity(signature, candidate) for candidate in candidates), default=0.0)
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[tuple], stats: IndexStats):
+        stats.seen += len(batch)
+        rows = {row[0]: row for row in batch}  # a key repeated within a batch keeps its last version
+        stats.duplicates += len(batch) - len(rows)
+        columns = ", ".join(["job_key", "title_id"] + JOB_FIELDS + ["content_hash", "signature"])
+        updates = ", ".join(f"{field} = excluded.{field}"
+                            for field in ["title_id"] + JOB_FIELDS + ["content_hash", "signature"])
+        try:
+            with conn:
+                existing = self._existing(conn, list(rows))
+                writes, stale_bands, new_bands = [], [], {}
+                pending: Dict[int, List[Signature]] = {}  # band key -> signatures of new postings in this batch
+                for key, row in rows.items():
+                    old = existing.get(key)
+                    if old is not None and old[1] == row[-1]:
+                        stats.unchanged += 1
+                        continue
+                    title, company, location, description = row[1:5]
+                    signature = minhash_signature(description)
+                    keys = self._band_keys(signature, title, company, location)
+                    if old is None and keys and self.near_duplicate_threshold is not None:
+                        best = self._best_match(conn, signature, keys, pending)
+                        if best == 1.0:
+                            stats.duplicates += 1
+                            continue
+                        if best >= self.near_duplicate_threshold:
+                            stats.near_duplicates += 1
+                            continue
+                        for band in keys:
+                            pending.setdefault(band, []).append(signature)
+                    if old is None:
+                        stats.inserted += 1
+                    else:
+                        stats.updated += 1
+                        old_signature = unpack_signature(old[2]) if old[2] else None
+                        stale_bands += [(band, old[0]) for band in self._band_keys(old_signature, *old[3:])]
+                    new_bands[key] = keys
+                    writes.append((key, self._title_id(conn, title)) + row[1:]
+                                  + (pack_signature(signature) if signature else None,))
+                if not writes:
+                    return
+                conn.executemany(
+                    f"INSERT INTO jobs ({columns}) VALUES ({_placeholders(writes[0])}) "
+                    f"ON CONFLICT(job_key) DO UPDATE SET {updates}",
+                    writes
+                )
+                conn.executemany("DELETE FROM job_signature_bands WHERE band_key = ? AND job_id = ?", stale_bands)
+                ids = {key: row[0] for key, row in self._existing(conn, list(new_bands)).items()}
+                conn.executemany(
+                    "INSERT OR IGNORE INTO job_signature_bands (band_key, job_id) VALUES (?, ?)",
+                    [(band, ids[key]) for key, keys in new_bands.items() for band in keys]
+                )
+        except Exception:
+            self._title_ids = {}  # titles inserted by the rolled-back batch are gone
+            raise
+
+    def ingest_jsonl(self, paths: Union[str, os.PathLike, Iterable[Union[str, os.PathLike]]], batch_size: int = 5000) -> int:
+        """Bulk load one or more JSONL feeds (one posting object per line)."""
+        return self.index_postings(iter_jsonl(paths), batch_size=batch_size)
+
+    def optimize(self):
+        """Merge FTS5 segments and refresh planner statistics after a large bulk load."""
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('optimize')")
+                conn.execute("INSERT INTO job_titles_fts(job_titles_fts) VALUES ('optimize')")
+            conn.execute("ANALYZE")
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT count(*) FROM jobs").fetchone()[0]
+
+    def search(
+        self,
+        query: str = "",
+        title: str = "",
+        location: str = "",
+        company: str = "",
+        remote_only: bool = False,
+        job_type: str = "",
+        k: int = 10,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        Top-k postings matching every given criterion, starting at `offset` (for paging).
+
+        `query` matches title or description (all terms required) and ranks by BM25; `title`
+        alone matches the title only and ranks by title relevance, then recency. Without either,
+        the newest postings come first. Location and company match by case-insensitive prefix.
+        """
+        conditions, params = [], []
+        prefix_filters = []
+        for column, value in (("location", location), ("company", company)):
+            if value:
+                condition = f"j.{column} LIKE ? ESCAPE '\\'"
+                conditions.append(condition)
+                params.append(_escape_like(value) + "%")
+                prefix_filters.append((condition, params[-1]))
+        if remote_only:
+            conditions.append("j.remote_option = 1")
+        if job_type:
+            conditions.append("j.job_type = ?")
+            params.append(job_type)
+        columns = ", ".join(f"j.{field}" for field in ["job_key"] + JOB_FIELDS)
+        conn = self._connect()
+
+        if title and not query:
+            selective = any(
+                conn.execute(f"SELECT 1 FROM jobs j WHERE {condition} LIMIT 1 OFFSET ?",
+                             (value, SELECTIVE_FILTER_ROWS)).fetchone() is None
+                for condition, value in prefix_filters
+            )
+            return self._search_titles(conn, fts_query(title), columns, conditions, params, k, offset, selective)
+
+        match_parts = []
+        if query and fts_query(query):
+            match_parts.append(f"({fts_query(query)})")
+        if title and fts_query(title):
+            match_parts.append(f"{{title}} : ({fts_query(title)})")
+        if match_parts:
+            where = " AND ".join(["jobs_fts MATCH ?"] + conditions)
+            sql = (f"SELECT {columns}, jobs_fts.rank FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid "
+                   f"WHERE {where} ORDER BY jobs_fts.rank LIMIT ? OFFSET ?")
+            params = [" AND ".join(match_parts)] + params
+        else:
+            where = " AND ".join(conditions) or "1"
+            sql = f"SELECT {columns}, NULL FROM jobs j WHERE {where} ORDER BY j.posted_date DESC LIMIT ? OFFSET ?"
+        rows = conn.execute(sql, params + [k, offset]).fetchall()
+        return [self._row_to_posting(row) for row in rows]
+
+    def _search_titles(self, conn: sqlite3.Connection, match: str, columns: str, conditions: List[str],
+                       params: List[Any], k: int, offset: int, selective: bool) -> List[Dict[str, Any]]:
+        """
+        Postings whose title matches, best title first and newest first within a title.
+
+        With a selective location/company filter, its covering index drives the query and only
+        its few entries are sorted; otherwise matching titles are walked best-first, reading each title's
+        newest postings from the (title_id, posted_date) index until offset + k are found.
+        """
+        if not match:
+            return []
+        if selective:
+            where = " AND ".join(conditions)
+            sql = (
+                "WITH ranked(title_id, rank) AS MATERIALIZED "
+                "(SELECT rowid, rank FROM job_titles_fts WHERE job_titles_fts MATCH ?), "
+                # CROSS JOIN keeps jobs as the outer loop so the filter's covering index is used;
+                # full rows are only read for the page of hits
+                "hits AS (SELECT j.id, ranked.rank, j.posted_date FROM jobs j CROSS JOIN ranked "
+                f"ON j.title_id = ranked.title_id WHERE {where} "
+                "ORDER BY ranked.rank, j.posted_date DESC LIMIT ? OFFSET ?) "
+                f"SELECT {columns}, hits.rank FROM hits CROSS JOIN jobs j ON j.id = hits.id "
+                "ORDER BY hits.rank, hits.posted_date DESC"
+            )
+            rows = conn.execute(sql, [match] + params + [k, offset]).fetchall()
+            return [self._row_to_posting(row) for row in rows]
+
+        titles = conn.execute(
+            "SELECT rowid, rank FROM job_titles_fts WHERE job_titles_fts MATCH ? ORDER BY rank", (match,)
+        ).fetchall()
+        where = " AND ".join(["j.title_id = ?"] + conditions)
+        sql = f"SELECT {columns}, ? FROM jobs j WHERE {where} ORDER BY j.posted_date DESC LIMIT ?"
+        rows: List[tuple] = []
+        for title_id, rank in titles:
+            rows += conn.execute(sql, [rank, title_id] + params + [offset + k - len(rows)]).fetchall()
+            if len(rows) >= offset + k:
+                break
+        return [self._row_to_posting(row) for row in rows[offset:offset + k]]
+
+    @staticmethod
+    def _row_to_posting(row: tuple) -> Dict[str, Any]:
+        posting = dict(zip(["id"] + JOB_FIELDS, row[:-1]))
+        posting["requirements"] = json.loads(posting["requirements"])
+        posting["remote_option"] = bool(posting["remote_option"])
+        if row[-1] is not None:
+            posting["score"] = round(-row[-1], 4)
+        return posting
+
+
+# Global job index instance
+_job_index = None
+
+
+def get_job_index() -> Optional[JobIndex]:
+    """The index at `JOB_SEARCH_INDEX`, or None when unset (JobSearchTool then serves mock data)."""
+    global _job_index
+    db_path = os.getenv("JOB_SEARCH_INDEX")
+    if not db_path:
+        return None
+    if _job_index is None or _job_index.db_path != db_path:
+        _job_index = JobIndex(db_path)
+    return _job_index
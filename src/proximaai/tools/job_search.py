@@ -2,12 +2,51 @@
 Job Search Tools - Tools for finding job opportunities, analyzing postings, and tracking applications.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Union
 from langchain.tools import BaseTool
+from langchain_core.runnables import RunnableConfig
 import json
-from dataclasses import dataclass
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-import re
+from itertools import islice
+
+from proximaai.data.application_store import (
+    TERMINAL_STATUSES, ApplicationStore, get_application_store, new_application_id
+)
+from proximaai.data.follow_up_scheduler import due_at, get_follow_up_scheduler
+from proximaai.tools.job_index import JobIndex, get_job_index
+from proximaai.tools.keyword_matcher import keyword_matcher
+from proximaai.tools.pattern_sets import PatternSet
+from proximaai.utils.run_sync import run_sync
+
+# Work-style keywords and the label reported for each
+WORK_STYLE_LABELS = {"remote": "remote-friendly", "flexible": "flexible hours", "collaborative": "collaborative"}
+
+# Compiled pattern tables, one scan per category
+REQUIREMENT_PATTERNS = PatternSet({
+    "requirements": r'requirements?[:\s]+(?=(?P<value>[^.\n]+))',
+    "must_have": r'must have[:\s]+(?=(?P<value>[^.\n]+))',
+    "required": r'required[:\s]+(?=(?P<value>[^.\n]+))',
+    "qualifications": r'qualifications?[:\s]+(?=(?P<value>[^.\n]+))'
+})
+
+PREFERRED_PATTERNS = PatternSet({
+    "preferred": r'preferred[:\s]+(?=(?P<value>[^.\n]+))',
+    "nice_to_have": r'nice to have[:\s]+(?=(?P<value>[^.\n]+))',
+    "bonus": r'bonus[:\s]+(?=(?P<value>[^.\n]+))',
+    "plus": r'plus[:\s]+(?=(?P<value>[^.\n]+))'
+})
+
+# Listed by priority: an explicit dollar range wins over a "salary:" / "compensation:" phrase
+SALARY_PATTERNS = PatternSet({
+    "range": r'\$[\d,]+[\s-]+\$[\d,]+',
+    "range_k": r'\$[\d,]+k[\s-]+\$[\d,]+k',
+    "salary": r'salary[:\s]+(?=(?P<value>[^.\n]+))',
+    "compensation": r'compensation[:\s]+(?=(?P<value>[^.\n]+))'
+})
 
 
 @dataclass
@@ -41,17 +80,20 @@ class ApplicationTracker:
 class JobSearchTool(BaseTool):
     """Tool for searching job opportunities."""
     
-    def __init__(self):
+    def __init__(self, index: Optional[JobIndex] = None):
         super().__init__(
             name="job_search",
             description="""
             Searches for job opportunities based on criteria like job title, location, 
             company, and requirements.
             
-            Input should be JSON with search criteria.
+            Input should be JSON with search criteria: job_title, location, company,
+            remote_only, job_type, query (free text), limit and offset (for paging).
             Returns matching job opportunities.
             """
         )
+        # Local job index; falls back to JOB_SEARCH_INDEX, then to mock data
+        self._index = index
     
     def _run(self, search_criteria_json: str) -> str:
         """Search for job opportunities."""
@@ -63,7 +105,20 @@ class JobSearchTool(BaseTool):
             remote_only = criteria.get("remote_only", False)
             experience_level = criteria.get("experience_level", "")
             
-            jobs = self._search_jobs(job_title, location, company, remote_only, experience_level)
+            index = self._index or get_job_index()
+            if index is not None:
+                jobs = index.search(
+                    query=criteria.get("query", ""),
+                    title=job_title,
+                    location=location,
+                    company=company,
+                    remote_only=remote_only,
+                    job_type=criteria.get("job_type", ""),
+                    k=int(criteria.get("limit", 10)),
+                    offset=int(criteria.get("offset", 0))
+                )
+            else:
+                jobs = self._search_jobs(job_title, location, company, remote_only, experience_level)
             return json.dumps(jobs, indent=2)
             
         except json.JSONDecodeError:
@@ -136,6 +191,55 @@ class JobSearchTool(BaseTool):
         return True
 
 
+# Postings per worker task in JobAnalyzerTool.analyze_batch
+BATCH_CHUNK_SIZE = 256
+
+# Analyzer reused by every chunk a pool worker process handles
+_worker_analyzer = None
+
+
+def _analyze_chunk(chunk: List[tuple]) -> List[str]:
+    """Pool worker: analyze (index, id, text) postings into compact NDJSON lines."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = JobAnalyzerTool()
+    lines = []
+    for index, posting_id, text in chunk:
+        record = {"index": index, "id": posting_id}
+        try:
+            record["analysis"] = _worker_analyzer._analyze_job_posting(text)
+        except Exception as e:
+            record["error"] = str(e)
+        lines.append(json.dumps(record, separators=(",", ":")))
+    return lines
+
+
+def _posting_fields(index: int, posting: Union[str, Dict[str, Any], JobPosting]) -> tuple:
+    """(index, id, text) for a raw posting text, a posting dict or a JobPosting."""
+    if isinstance(posting, str):
+        return index, index, posting
+    if isinstance(posting, JobPosting):
+        posting = asdict(posting)
+    text = posting.get("text") or posting.get("description") or ""
+    return index, posting.get("id") or posting.get("application_url") or index, text
+
+
+def _read_checkpoint(path: str) -> int:
+    try:
+        with open(path) as f:
+            return json.load(f)["completed"]
+    except FileNotFoundError:
+        return 0
+
+
+def _write_checkpoint(path: str, completed: int):
+    """Atomically record how many postings have been analyzed and consumed."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"completed": completed, "updated_at": datetime.now().isoformat()}, f)
+    os.replace(tmp_path, path)
+
+
 class JobAnalyzerTool(BaseTool):
     """Tool for analyzing job postings and extracting insights."""
     
@@ -159,74 +263,81 @@ class JobAnalyzerTool(BaseTool):
         except Exception as e:
             return f"Error analyzing job posting: {str(e)}"
     
+    def analyze_batch(
+        self,
+        postings: Iterable[Union[str, Dict[str, Any], JobPosting]],
+        checkpoint_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        chunk_size: int = BATCH_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """
+        Analyze a stream of postings across worker processes, yielding one compact NDJSON line each.
+
+        Postings may be raw text, dicts with `text`/`description` (and optionally `id`) or
+        JobPostings. Lines come back in input order as `{"index", "id", "analysis"}` (or `"error"`).
+        Postings are read lazily in chunks with a bounded number in flight, so memory stays flat.
+
+        With `checkpoint_path`, the number of postings whose lines the caller has consumed is saved
+        after each chunk; rerunning with the same input and checkpoint resumes after them. A crash
+        mid-chunk may repeat that chunk's lines, identifiable by `index`. The caller should flush its
+        output before asking for the next line.
+        """
+        completed = _read_checkpoint(checkpoint_path) if checkpoint_path else 0
+        numbered = (_posting_fields(i, posting) for i, posting in islice(enumerate(postings), completed, None))
+        chunks = iter(lambda: list(islice(numbered, chunk_size)), [])
+        max_workers = max_workers or os.cpu_count() or 1
+
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            pending = deque()
+            for chunk in islice(chunks, max_workers * 2):
+                pending.append((len(chunk), pool.submit(_analyze_chunk, chunk)))
+            while pending:
+                size, future = pending.popleft()
+                lines = future.result()
+                # Keep the workers busy while the caller consumes this chunk
+                for chunk in islice(chunks, 1):
+                    pending.append((len(chunk), pool.submit(_analyze_chunk, chunk)))
+                yield from lines
+                completed += size
+                if checkpoint_path:
+                    _write_checkpoint(checkpoint_path, completed)
+        finally:
+            # Also reached when the caller stops early: drop queued chunks instead of finishing them
+            pool.shutdown(cancel_futures=True)
+
     def _analyze_job_posting(self, text: str) -> Dict[str, Any]:
         """Analyze job posting text and extract insights."""
+        # One keyword scan shared by every keyword-based analysis below
+        keywords = keyword_matcher.categorize(text)
         analysis = {
             "key_requirements": self._extract_requirements(text),
-            "required_skills": self._extract_skills(text),
+            "required_skills": self._extract_skills(text, keywords),
             "preferred_skills": self._extract_preferred_skills(text),
             "experience_level": self._determine_experience_level(text),
-            "salary_indicators": self._extract_salary_info(text),
-            "company_culture": self._analyze_company_culture(text),
-            "red_flags": self._identify_red_flags(text),
-            "green_flags": self._identify_green_flags(text),
+            "salary_indicators": self._extract_salary_info(text, keywords),
+            "company_culture": self._analyze_company_culture(text, keywords),
+            "red_flags": self._identify_red_flags(text, keywords),
+            "green_flags": self._identify_green_flags(text, keywords),
             "application_tips": self._generate_application_tips(text)
         }
         
         return analysis
     
     def _extract_requirements(self, text: str) -> List[str]:
-        """Extract key requirements from job posting."""
-        requirements = []
-        
-        # Look for requirement patterns
-        requirement_patterns = [
-            r'requirements?[:\s]+([^.\n]+)',
-            r'must have[:\s]+([^.\n]+)',
-            r'required[:\s]+([^.\n]+)',
-            r'qualifications?[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in requirement_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            requirements.extend(matches)
-        
+        """Extract key requirements from job posting, in document order."""
+        requirements = [value for _, value in REQUIREMENT_PATTERNS.finditer(text)]
         return [req.strip() for req in requirements if req.strip()]
     
-    def _extract_skills(self, text: str) -> List[str]:
+    def _extract_skills(self, text: str, keywords: Optional[Dict[str, List[str]]] = None) -> List[str]:
         """Extract required skills from job posting."""
-        skills = []
-        
-        # Common technical skills
-        tech_skills = [
-            "python", "javascript", "java", "react", "angular", "vue", "node.js",
-            "sql", "mongodb", "aws", "azure", "docker", "kubernetes", "git",
-            "agile", "scrum", "machine learning", "data science", "devops"
-        ]
-        
-        text_lower = text.lower()
-        for skill in tech_skills:
-            if skill in text_lower:
-                skills.append(skill)
-        
-        return skills
+        if keywords is None:
+            keywords = keyword_matcher.categorize(text)
+        return keywords["technical_skills"]
     
     def _extract_preferred_skills(self, text: str) -> List[str]:
-        """Extract preferred/nice-to-have skills."""
-        preferred = []
-        
-        # Look for preferred skill indicators
-        preferred_patterns = [
-            r'preferred[:\s]+([^.\n]+)',
-            r'nice to have[:\s]+([^.\n]+)',
-            r'bonus[:\s]+([^.\n]+)',
-            r'plus[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in preferred_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            preferred.extend(matches)
-        
+        """Extract preferred/nice-to-have skills, in document order."""
+        preferred = [value for _, value in PREFERRED_PATTERNS.finditer(text)]
         return [pref.strip() for pref in preferred if pref.strip()]
     
     def _determine_experience_level(self, text: str) -> str:
@@ -242,7 +353,7 @@ class JobAnalyzerTool(BaseTool):
         else:
             return "not specified"
     
-    def _extract_salary_info(self, text: str) -> Dict[str, Any]:
+    def _extract_salary_info(self, text: str, keywords: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
         """Extract salary information from job posting."""
         salary_info = {
             "salary_range": None,
@@ -252,102 +363,45 @@ class JobAnalyzerTool(BaseTool):
         }
         
         # Look for salary patterns
-        salary_patterns = [
-            r'\$[\d,]+[\s-]+\$[\d,]+',
-            r'\$[\d,]+k[\s-]+\$[\d,]+k',
-            r'salary[:\s]+([^.\n]+)',
-            r'compensation[:\s]+([^.\n]+)'
-        ]
-        
-        for pattern in salary_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                salary_info["salary_range"] = matches[0]
-                break
-        
-        # Look for benefits
-        benefit_keywords = ["health insurance", "dental", "vision", "401k", "pto", "vacation"]
-        text_lower = text.lower()
-        for benefit in benefit_keywords:
-            if benefit in text_lower:
-                salary_info["benefits"].append(benefit)
-        
-        # Check for equity and bonus
-        if "equity" in text_lower or "stock options" in text_lower:
-            salary_info["equity"] = True
+        salary = SALARY_PATTERNS.first_by_priority(text)
+        if salary:
+            salary_info["salary_range"] = salary[1]
         
-        if "bonus" in text_lower or "performance" in text_lower:
-            salary_info["bonus"] = True
+        if keywords is None:
+            keywords = keyword_matcher.categorize(text)
+
+        # Benefits, equity ("stock options" is an alias) and bonus
+        salary_info["benefits"] = keywords["benefits"]
+        salary_info["equity"] = bool(keywords["equity"])
+        salary_info["bonus"] = bool(keywords["bonus"])
         
         return salary_info
     
-    def _analyze_company_culture(self, text: str) -> Dict[str, Any]:
+    def _analyze_company_culture(self, text: str, keywords: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
         """Analyze company culture indicators."""
+        if keywords is None:
+            keywords = keyword_matcher.categorize(text)
+
         culture = {
-            "work_style": [],
-            "values": [],
-            "perks": [],
+            "work_style": [WORK_STYLE_LABELS[style] for style in keywords["work_style"]],
+            "values": keywords["values"],
+            "perks": keywords["perks"],
             "team_size": "not specified"
         }
         
-        text_lower = text.lower()
-        
-        # Work style indicators
-        if "remote" in text_lower or "work from home" in text_lower:
-            culture["work_style"].append("remote-friendly")
-        if "flexible" in text_lower:
-            culture["work_style"].append("flexible hours")
-        if "collaborative" in text_lower:
-            culture["work_style"].append("collaborative")
-        
-        # Company values
-        value_keywords = ["innovation", "diversity", "inclusion", "growth", "learning", "impact"]
-        for value in value_keywords:
-            if value in text_lower:
-                culture["values"].append(value)
-        
-        # Perks
-        perk_keywords = ["gym", "snacks", "coffee", "happy hour", "team events", "conferences"]
-        for perk in perk_keywords:
-            if perk in text_lower:
-                culture["perks"].append(perk)
-        
         return culture
     
-    def _identify_red_flags(self, text: str) -> List[str]:
+    def _identify_red_flags(self, text: str, keywords: Optional[Dict[str, List[str]]] = None) -> List[str]:
         """Identify potential red flags in job posting."""
-        red_flags = []
-        text_lower = text.lower()
-        
-        red_flag_indicators = [
-            "rockstar", "ninja", "guru", "work hard play hard",
-            "unlimited overtime", "startup mentality", "wearing many hats",
-            "fast-paced environment", "high pressure", "crunch time"
-        ]
-        
-        for indicator in red_flag_indicators:
-            if indicator in text_lower:
-                red_flags.append(f"Contains '{indicator}' - may indicate poor work-life balance")
-        
-        return red_flags
+        if keywords is None:
+            keywords = keyword_matcher.categorize(text)
+        return [f"Contains '{indicator}' - may indicate poor work-life balance" for indicator in keywords["red_flags"]]
     
-    def _identify_green_flags(self, text: str) -> List[str]:
+    def _identify_green_flags(self, text: str, keywords: Optional[Dict[str, List[str]]] = None) -> List[str]:
         """Identify positive indicators in job posting."""
-        green_flags = []
-        text_lower = text.lower()
-        
-        green_flag_indicators = [
-            "work-life balance", "flexible hours", "remote work",
-            "professional development", "learning budget", "conference attendance",
-            "competitive salary", "health benefits", "401k matching",
-            "diversity", "inclusion", "equal opportunity"
-        ]
-        
-        for indicator in green_flag_indicators:
-            if indicator in text_lower:
-                green_flags.append(f"Promotes '{indicator}'")
-        
-        return green_flags
+        if keywords is None:
+            keywords = keyword_matcher.categorize(text)
+        return [f"Promotes '{indicator}'" for indicator in keywords["green_flags"]]
     
     def _generate_application_tips(self, text: str) -> List[str]:
         """Generate tips for applying to this job."""
@@ -375,7 +429,7 @@ class JobAnalyzerTool(BaseTool):
 class ApplicationTrackerTool(BaseTool):
     """Tool for tracking job applications."""
     
-    def __init__(self):
+    def __init__(self, store: Optional[ApplicationStore] = None, user_id: str = "default"):
         super().__init__(
             name="application_tracker",
             description="""
@@ -383,41 +437,44 @@ class ApplicationTrackerTool(BaseTool):
             Helps manage the job search process and stay organized.
             
             Input should be JSON with application details or tracking commands.
+            "list" accepts "status" or "due_before" (follow-ups due by a date), "limit",
+            and the "cursor" returned as "next_cursor" by the previous page.
             Returns application status and tracking information.
             """
         )
         # Store instance variables in a way that doesn't conflict with Pydantic
-        self._applications: Dict[str, ApplicationTracker] = {}
-        self._application_counter = 0
+        self._store = store
+        self._user_id = user_id
     
     @property
-    def applications(self) -> Dict[str, ApplicationTracker]:
-        """Get the applications dictionary."""
-        return self._applications
+    def store(self) -> ApplicationStore:
+        """The application store (default: the one selected by APPLICATION_STORE_BACKEND)."""
+        return self._store or get_application_store()
     
-    @property
-    def application_counter(self) -> int:
-        """Get the application counter."""
-        return self._application_counter
+    def _user_for(self, config: Optional[RunnableConfig]) -> str:
+        """The authenticated user of the run, else the tool's `user_id`; never taken from the tool input."""
+        configurable = (config or {}).get("configurable") or {}
+        return configurable.get("langgraph_auth_user_id") or self._user_id
     
-    def _increment_counter(self):
-        """Increment the application counter."""
-        self._application_counter += 1
+    def _run(self, input_json: str, config: RunnableConfig = None) -> str:
+        """Handle application tracking operations (async callers use `ainvoke`)."""
+        return run_sync(self._arun(input_json, config=config))
     
-    def _run(self, input_json: str) -> str:
+    async def _arun(self, input_json: str, config: RunnableConfig = None) -> str:
         """Handle application tracking operations."""
         try:
             data = json.loads(input_json)
             action = data.get("action", "")
+            user_id = self._user_for(config)
             
             if action == "add":
-                return self._add_application(data)
+                return await self._add_application(user_id, data)
             elif action == "update":
-                return self._update_application(data)
+                return await self._update_application(user_id, data)
             elif action == "list":
-                return self._list_applications(data)
+                return await self._list_applications(user_id, data)
             elif action == "follow_up":
-                return self._schedule_follow_up(data)
+                return await self._schedule_follow_up(user_id, data)
             else:
                 return "Error: Invalid action. Use 'add', 'update', 'list', or 'follow_up'"
                 
@@ -426,7 +483,7 @@ class ApplicationTrackerTool(BaseTool):
         except Exception as e:
             return f"Error tracking application: {str(e)}"
     
-    def _add_application(self, data: Dict[str, Any]) -> str:
+    async def _add_application(self, user_id: str, data: Dict[str, Any]) -> str:
         """Add a new job application."""
         company = data.get("company", "")
         position = data.get("position", "")
@@ -435,8 +492,7 @@ class ApplicationTrackerTool(BaseTool):
         if not company or not position:
             return "Error: Company and position are required"
         
-        self._increment_counter()
-        job_id = f"job_{self._application_counter}"
+        job_id = new_application_id()
         
         application = ApplicationTracker(
             job_id=job_id,
@@ -448,7 +504,7 @@ class ApplicationTrackerTool(BaseTool):
             notes=data.get("notes", "")
         )
         
-        self._applications[job_id] = application
+        await self.store.add(user_id, asdict(application))
         
         return json.dumps({
             "message": "Application added successfully",
@@ -461,70 +517,65 @@ class ApplicationTrackerTool(BaseTool):
             }
         }, indent=2)
     
-    def _update_application(self, data: Dict[str, Any]) -> str:
+    async def _update_application(self, user_id: str, data: Dict[str, Any]) -> str:
         """Update an existing application."""
         job_id = data.get("job_id", "")
-        new_status = data.get("status", "")
-        notes = data.get("notes", "")
         
-        if job_id not in self._applications:
+        application = await self.store.update(user_id, job_id, status=data.get("status", ""), notes=data.get("notes", ""))
+        if application is None:
             return "Error: Application not found"
         
-        application = self._applications[job_id]
-        
-        if new_status:
-            application.status = new_status
-        
-        if notes:
-            application.notes = notes
+        scheduler = get_follow_up_scheduler()
+        if scheduler is not None and application["status"] in TERMINAL_STATUSES:
+            scheduler.cancel(job_id)  # the store already dropped its follow-up date
         
         return json.dumps({
             "message": "Application updated successfully",
             "application": {
                 "job_id": job_id,
-                "company": application.company,
-                "position": application.position,
-                "status": application.status,
-                "notes": application.notes
+                "company": application["company"],
+                "position": application["position"],
+                "status": application["status"],
+                "notes": application["notes"]
             }
         }, indent=2)
     
-    def _list_applications(self, data: Dict[str, Any]) -> str:
-        """List all applications with optional filtering."""
+    async def _list_applications(self, user_id: str, data: Dict[str, Any]) -> str:
+        """List one page of applications with optional filtering."""
         status_filter = data.get("status", "")
+        due_before = data.get("due_before", "")
         
-        applications = []
-        for job_id, app in self._applications.items():
-            if not status_filter or app.status == status_filter:
-                applications.append({
-                    "job_id": job_id,
-                    "company": app.company,
-                    "position": app.position,
-                    "applied_date": app.applied_date,
-                    "status": app.status,
-                    "follow_up_date": app.follow_up_date,
-                    "notes": app.notes
-                })
+        applications, next_cursor = await self.store.list(
+            user_id, status=status_filter, due_before=due_before, limit=data.get("limit"), cursor=data.get("cursor")
+        )
+        total = await self.store.count(user_id, status=status_filter, due_before=due_before)
         
         return json.dumps({
-            "total_applications": len(applications),
-            "applications": applications
+            "total_applications": total,
+            "applications": applications,
+            "next_cursor": next_cursor
         }, indent=2)
     
-    def _schedule_follow_up(self, data: Dict[str, Any]) -> str:
+    async def _schedule_follow_up(self, user_id: str, data: Dict[str, Any]) -> str:
         """Schedule a follow-up for an application."""
         job_id = data.get("job_id", "")
         follow_up_date = data.get("follow_up_date", "")
+        try:
+            due_at(follow_up_date)
+        except (AttributeError, TypeError, ValueError):
+            return "Error: follow_up_date must be an ISO date or timestamp, e.g. 2025-05-01"
         
-        if job_id not in self._applications:
+        application = await self.store.update(user_id, job_id, follow_up_date=follow_up_date)
+        if application is None:
             return "Error: Application not found"
         
-        application = self._applications[job_id]
-        application.follow_up_date = follow_up_date
+        scheduler = get_follow_up_scheduler()
+        if scheduler is not None:
+            scheduler.schedule(user_id, job_id, follow_up_date)
         
         return json.dumps({
             "message": "Follow-up scheduled successfully",
             "job_id": job_id,
-            "company": application.company,
+            "company": application["company"],
             "follow_up_date": follow_up_date
         }, indent=2) 
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Keyword Matcher - One-pass, word-boundary-aware multi-keyword matcher over a shared taxonomy.
+
+Keywords are indexed by their first word, and all first words are compiled into a single
+trie-shaped regex (shared prefixes are tested once) run over the lowercased text; multi-word
+keywords are then confirmed with a precompiled tail pattern at the end of the first word. Every
+keyword starting at a word is reported with its offsets, so overlapping hits are kept, e.g.
+"machine learning" yields both `machine learning` and `learning`.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import re
+
+from proximaai.tools.pattern_sets import lower_preserving_offsets
+from proximaai.tools.skill_taxonomy import KEYWORD_ALIASES, SKILL_TAXONOMY
+
+_WORD = re.compile(r"\w+")
+_WHITESPACE = re.compile(r"\s+")
+_TERMINAL = ""  # trie key marking the end of a word
+
+
+@dataclass(frozen=True)
+class KeywordHit:
+    """A keyword occurrence: canonical keyword, its categories and the [start, end) span in the text."""
+    keyword: str
+    categories: Tuple[str, ...]
+    start: int
+    end: int
+
+
+def _normalize(surface: str) -> str:
+    return _WHITESPACE.sub(" ", surface.strip().lower())
+
+
+def _split(surface: str) -> Tuple[str, Optional[re.Pattern]]:
+    """First word of a surface form and a pattern for the rest (" " matches any whitespace run)."""
+    spans = [match.span() for match in _WORD.finditer(surface)]
+    if not spans or spans[0][0] != 0 or spans[-1][1] != len(surface):
+        raise ValueError(f"Keyword must start and end with a word character: {surface!r}")
+    first = surface[:spans[0][1]]
+    if len(spans) == 1:
+        return first, None
+    tail = "".join(
+        (r"\s+" if surface[end:start] == " " else re.escape(surface[end:start])) + re.escape(surface[start:next_end])
+        for (_, end), (start, next_end) in zip(spans, spans[1:])
+    )
+    return first, re.compile(tail + r"\b")
+
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for a trie node; longer continuations are tried before ending the word."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char != _TERMINAL]
+    if _TERMINAL in node:
+        branches.append("")
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+class KeywordMatcher:
+    """Precompiled matcher for a `{category: [keyword, ...]}` taxonomy plus surface-form aliases."""
+
+    def __init__(self, taxonomy: Dict[str, Iterable[str]], aliases: Optional[Dict[str, str]] = None):
+        self.taxonomy = {category: [_normalize(k) for k in keywords] for category, keywords in taxonomy.items()}
+
+        categories: Dict[str, List[str]] = {}
+        for category, keywords in self.taxonomy.items():
+            for keyword in keywords:
+                categories.setdefault(keyword, []).append(category)
+        self._categories = {keyword: tuple(cats) for keyword, cats in categories.items()}
+
+        # Surface form -> canonical keyword
+        canonical = {keyword: keyword for keyword in self._categories}
+        for alias, keyword in (aliases or {}).items():
+            if _normalize(keyword) in self._categories:
+                canonical[_normalize(alias)] = _normalize(keyword)
+
+        # First word -> [(tail pattern or None for single words, canonical keyword)], built once
+        self._index: Dict[str, List[Tuple[Optional[re.Pattern], str]]] = {}
+        for surface, keyword in canonical.items():
+            first, tail = _split(surface)
+            self._index.setdefault(first, []).append((tail, keyword))
+
+        trie: dict = {}
+        for first in self._index:
+            node = trie
+            for char in first:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = True
+        self.pattern = re.compile(r"\b" + _trie_pattern(trie) + r"\b")
+
+    def _scan(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """(keyword, start, end) for every occurrence, ordered by start offset."""
+        scan = lower_preserving_offsets(text)
+        for match in self.pattern.finditer(scan):
+            start, word_end = match.span()
+            for tail, keyword in self._index[match.group()]:
+                if tail is None:
+                    yield keyword, start, word_end
+                    continue
+                tail_match = tail.match(scan, word_end)
+                if tail_match is not None:
+                    yield keyword, start, tail_match.end()
+
+    def find_all(self, text: str) -> List[KeywordHit]:
+        """Every keyword occurrence in the text, ordered by start offset, in a single scan."""
+        return [KeywordHit(keyword, self._categories[keyword], start, end) for keyword, start, end in self._scan(text)]
+
+    def categorize(self, text: str, hits: Optional[List[KeywordHit]] = None) -> Dict[str, List[str]]:
+        """Keywords found per category, in taxonomy order and without duplicates."""
+        if hits is None:
+            found = {keyword for keyword, _, _ in self._scan(text)}
+        else:
+            found = {hit.keyword for hit in hits}
+        return {category: [k for k in keywords if k in found] for category, keywords in self.taxonomy.items()}
+
+
+# Global matcher over the shared skill taxonomy, compiled once at import
+keyword_matcher = KeywordMatcher(SKILL_TAXONOMY, KEYWORD_ALIASES)
@@ -0,0 +1,85 @@
+"""
+Near Duplicates - MinHash signatures and LSH band keys for spotting reposted job descriptions.
+
+A description becomes the set of its word 3-shingles. One-permutation MinHash hashes each
+shingle once into one of NUM_BINS bins and keeps the minimum per bin, so a signature costs a
+single pass over the shingles; the fraction of equal bins estimates the Jaccard similarity of
+two descriptions. Signatures are split into NUM_BANDS bands of ROWS_PER_BAND bins: two
+descriptions sharing any band become candidates, which misses few pairs above ~0.8 similarity
+while rarely pairing unrelated text.
+"""
+
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import re
+import zlib
+
+NUM_BANDS = 8
+ROWS_PER_BAND = 4
+NUM_BINS = NUM_BANDS * ROWS_PER_BAND
+SHINGLE_SIZE = 3
+
+_VALUE_BITS = 59  # the top 5 bits of a 64-bit shingle hash pick one of the 32 bins
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_EMPTY = 0xFFFFFFFFFFFFFFFF
+_WORD = re.compile(r"\w+")
+
+Signature = Tuple[int, ...]
+
+
+def shingles(text: str) -> List[str]:
+    """Lowercased word 3-shingles of a text (the whole text when it has fewer words)."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= SHINGLE_SIZE:
+        return [" ".join(words)] if words else []
+    return list(map(" ".join, zip(*(words[i:] for i in range(SHINGLE_SIZE)))))
+
+
+def minhash_signature(text: str) -> Optional[Signature]:
+    """One-permutation MinHash of a text's shingles, or None for text without words."""
+    crc32 = zlib.crc32
+    bins = [_EMPTY] * NUM_BINS
+    # Repeated shingles cannot change a minimum, so there is no need to build a set first
+    for shingle in shingles(text):
+        h = crc32(shingle.encode("utf-8")) * _GOLDEN & _EMPTY
+        h ^= h >> 29
+        index = h >> _VALUE_BITS  # every hash in a bin shares these top bits, so compare whole hashes
+        if h < bins[index]:
+            bins[index] = h
+    filled = [i for i, value in enumerate(bins) if value != _EMPTY]
+    if not filled:
+        return None
+    # Densify: an empty bin borrows the next filled bin's minimum, tagged with the distance so
+    # borrowed values only agree when both texts borrowed from the same place
+    for i in range(NUM_BINS):
+        if bins[i] == _EMPTY:
+            source = next((j for j in filled if j > i), filled[0])
+            distance = (source - i) % NUM_BINS
+            bins[i] = (bins[source] & _VALUE_MASK) | (distance << _VALUE_BITS)
+    return tuple(bins)
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_BINS
+
+
+def band_keys(signature: Sequence[int], scope: Iterable[str] = ()) -> List[int]:
+    """64-bit LSH keys, one per band. `scope` strings (e.g. company) must also match to collide."""
+    prefix = "\x1f".join(scope).encode("utf-8")
+    keys = []
+    for band in range(NUM_BANDS):
+        rows = array("Q", signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]).tobytes()
+        digest = hashlib.blake2b(prefix + bytes([band]) + rows, digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "little", signed=True))  # fits a SQLite INTEGER
+    return keys
+
+
+def pack_signature(signature: Sequence[int]) -> bytes:
+    return array("Q", signature).tobytes()
+
+
+def unpack_signature(blob: bytes) -> Signature:
+    return tuple(array("Q", blob))
@@ -0,0 +1,97 @@
+"""
+Pattern Sets - Named regex alternatives compiled into a single pattern per category.
+
+A category is a list of alternatives compiled into one flat regex, each tagged with a named
+group, so one scan of a document finds every alternative and reports which category matched.
+An alternative may capture the text of interest as `(?P<value>...)` (its last group); otherwise
+the whole match is the value. Putting the value group in a lookahead, e.g.
+`required[:\\s]+(?=(?P<value>[^.\\n]+))`, leaves the value unconsumed so other alternatives can
+still match inside it, as they would with one `re.findall` per pattern.
+
+Alternatives are kept flat (tags go at the end rather than wrapping each one in a group) and
+written in lowercase to run against the lowercased text rather than with re.IGNORECASE; both keep
+the engine's literal-prefix search, which is several times faster. Values are sliced from the
+original text.
+
+`finditer`, `search` and `first_by_priority` scan the text once with the combined regex.
+`findall_each` instead runs each alternative as its own compiled regex, one scan per pattern, for
+callers that need every alternative's matches even where they overlap (the combined scan consumes
+what it matches).
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+import re
+
+_VALUE_GROUP = "(?P<value>"
+
+
+def lower_preserving_offsets(text: str) -> str:
+    """Lowercased text with the same offsets (characters whose lowercase is longer are kept as-is)."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+class PatternSet:
+    """`{category: [pattern, ...]}` compiled into one regex, alternatives tried in table order at each position."""
+
+    def __init__(self, patterns: Dict[str, Union[str, List[str]]]):
+        self.names = list(patterns)
+        self._priority = {name: i for i, name in enumerate(self.names)}
+        # Tag group -> (category, whether the tag is a value group)
+        self._groups: Dict[str, Tuple[str, bool]] = {}
+        # Each alternative on its own, for `findall_each`
+        self._separate: List[Tuple[str, re.Pattern]] = []
+        alternatives = []
+        for name, category_patterns in patterns.items():
+            if isinstance(category_patterns, str):
+                category_patterns = [category_patterns]
+            for i, pattern in enumerate(category_patterns):
+                self._separate.append((name, re.compile(pattern)))
+                group = f"{name}__{i}"
+                has_value = _VALUE_GROUP in pattern
+                if has_value:
+                    pattern = pattern.replace(_VALUE_GROUP, f"(?P<{group}>", 1)
+                else:
+                    pattern += f"(?P<{group}>)"
+                self._groups[group] = (name, has_value)
+                alternatives.append(pattern)
+        self.pattern = re.compile("|".join(alternatives))
+
+    def _result(self, text: str, match: re.Match) -> Tuple[str, str]:
+        name, has_value = self._groups[match.lastgroup]
+        start, end = match.span(match.lastgroup) if has_value else match.span()
+        return name, text[start:end]
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, str]]:
+        """(category, value) for every match, in document order."""
+        for match in self.pattern.finditer(lower_preserving_offsets(text)):
+            yield self._result(text, match)
+
+    def search(self, text: str) -> Optional[Tuple[str, str]]:
+        """The earliest match in the text, or None."""
+        match = self.pattern.search(lower_preserving_offsets(text))
+        return self._result(text, match) if match else None
+
+    def findall_each(self, text: str) -> Iterator[Tuple[str, str]]:
+        """(category, value) for every match of each alternative scanned on its own, in table order.
+
+        This is what one `re.findall` per pattern returns: unlike `finditer`, a match inside (or
+        overlapping) another alternative's match is still reported.
+        """
+        lowered = lower_preserving_offsets(text)
+        for name, pattern in self._separate:
+            for match in pattern.finditer(lowered):
+                start, end = match.span("value") if "value" in pattern.groupindex else match.span()
+                yield name, text[start:end]
+
+    def first_by_priority(self, text: str) -> Optional[Tuple[str, str]]:
+        """Earliest match of the highest-priority (first in the table) category found, in one scan."""
+        best = None
+        for name, value in self.finditer(text):
+            if best is None or self._priority[name] < self._priority[best[0]]:
+                best = (name, value)
+                if self._priority[name] == 0:
+                    break  # nothing later can outrank the first category
+        return best
@@ -1,13 +1,215 @@
 import os
+import time
+import asyncio
 import httpx
 from langchain.tools import BaseTool
 import json
-from typing import Optional
+from typing import Any, Optional
+
+from proximaai.data.response_cache import ResponseCache, query_key, response_cache_from_env
+from proximaai.utils.logger import get_logger
+from proximaai.utils.rate_limit import TokenBucket, backoff_delay, parse_retry_after
+
+logger = get_logger("perplexity_search")
+
+PERPLEXITY_API_URL = os.getenv("PERPLEXITY_API_URL", "https://api.perplexity.ai/chat/completions")
+PERPLEXITY_MODEL = "sonar-pro"
+PERPLEXITY_MAX_RETRIES = int(os.getenv("PERPLEXITY_MAX_RETRIES", "3"))
+# Upstream statuses worth retrying; everything else fails fast
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Shared, pooled HTTP clients and rate limiter for every Perplexity call in the process
+_async_client: Optional[httpx.AsyncClient] = None
+_sync_client: Optional[httpx.Client] = None
+_rate_limiter: Optional[TokenBucket] = None
+_response_cache: Optional[ResponseCache] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _client_options() -> dict[str, Any]:
+    return {
+        "timeout": float(os.getenv("PERPLEXITY_TIMEOUT", "30")),
+        "limits": httpx.Limits(
+            max_connections=int(os.getenv("PERPLEXITY_MAX_CONNECTIONS", "50")),
+            max_keepalive_connections=int(os.getenv("PERPLEXITY_MAX_KEEPALIVE_CONNECTIONS", "20")),
+            keepalive_expiry=float(os.getenv("PERPLEXITY_KEEPALIVE_EXPIRY", "60")),
+        ),
+    }
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get or create the process-wide pooled httpx.AsyncClient (keep-alive, HTTP/2 when available)."""
+    global _async_client
+
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(http2=_http2_available(), **_client_options())
+    return _async_client
+
+
+def get_sync_client() -> httpx.Client:
+    """Get or create the process-wide pooled httpx.Client used by the synchronous `_run`."""
+    global _sync_client
+
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(http2=_http2_available(), **_client_options())
+    return _sync_client
+
+
+def get_rate_limiter() -> TokenBucket:
+    """Process-wide token bucket sized by PERPLEXITY_RATE_PER_SEC and PERPLEXITY_BURST."""
+    global _rate_limiter
+
+    if _rate_limiter is None:
+        rate = float(os.getenv("PERPLEXITY_RATE_PER_SEC", "0.8"))  # ~50 requests/minute
+        _rate_limiter = TokenBucket(rate=rate, capacity=float(os.getenv("PERPLEXITY_BURST", "5")))
+    return _rate_limiter
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide Perplexity response cache (PERPLEXITY_CACHE_TTL_SECONDS, _MAX_ENTRIES, _STORE)."""
+    global _response_cache
+
+    if _response_cache is None:
+        _response_cache = response_cache_from_env(("perplexity_responses", PERPLEXITY_MODEL), "PERPLEXITY_CACHE")
+    return _response_cache
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None, error: Optional[Exception] = None) -> Optional[float]:
+    """Seconds to wait before retrying, or None if the outcome should be returned/raised as is."""
+    if attempt >= PERPLEXITY_MAX_RETRIES:
+        return None
+    if error is not None:
+        return backoff_delay(attempt) if isinstance(error, httpx.TransportError) else None
+    if response is not None and response.status_code in RETRY_STATUSES:
+        return backoff_delay(attempt, retry_after=parse_retry_after(response.headers.get("retry-after")))
+    return None
+
+
+def format_answer(data: dict[str, Any]) -> str:
+    """Answer text with numbered citations appended."""
+    message_content = data["choices"][0]["message"]["content"]
+    if "citations" in data and isinstance(data["citations"], list) and data["citations"]:
+        message_content += "\n\nCitations:\n"
+        for idx, citation in enumerate(data["citations"], 1):
+            message_content += f"[{idx}] {citation}\n"
+    return message_content
+
+
+async def achat_completion(
+    messages: list[dict[str, str]],
+    api_key: str,
+    client: Optional[httpx.AsyncClient] = None,
+    rate_limiter: Optional[TokenBucket] = None
+) -> dict[str, Any]:
+    """POST a chat completion with rate limiting and jittered exponential backoff on 429/5xx."""
+    client = client or get_async_client()
+    rate_limiter = rate_limiter or get_rate_limiter()
+    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
+    body = {"model": PERPLEXITY_MODEL, "messages": messages}
+
+    attempt = 0
+    while True:
+        await rate_limiter.acquire()
+        try:
+            response = await client.post(PERPLEXITY_API_URL, headers=headers, json=body)
+        except Exception as e:
+            delay = _retry_delay(attempt, error=e)
+            if delay is None:
+                raise
+            logger.warning("Perplexity request failed, retrying", attempt=attempt + 1, delay=round(delay, 2), error=str(e))
+        else:
+            delay = _retry_delay(attempt, response=response)
+            if delay is None:
+                response.raise_for_status()
+                return response.json()
+            logger.warning("Perplexity request throttled, retrying", attempt=attempt + 1,
+                           delay=round(delay, 2), status=response.status_code)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def chat_completion(
+    messages: list[dict[str, str]],
+    api_key: str,
+    client: Optional[httpx.Client] = None,
+    rate_limiter: Optional[TokenBucket] = None
+) -> dict[str, Any]:
+    """Synchronous counterpart of `achat_completion` on the pooled httpx.Client."""
+    client = client or get_sync_client()
+    rate_limiter = rate_limiter or get_rate_limiter()
+    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
+    body = {"model": PERPLEXITY_MODEL, "messages": messages}
+
+    attempt = 0
+    while True:
+        rate_limiter.acquire_sync()
+        try:
+            response = client.post(PERPLEXITY_API_URL, headers=headers, json=body)
+        except Exception as e:
+            delay = _retry_delay(attempt, error=e)
+            if delay is None:
+                raise
+            logger.warning("Perplexity request failed, retrying", attempt=attempt + 1, delay=round(delay, 2), error=str(e))
+        else:
+            delay = _retry_delay(attempt, response=response)
+            if delay is None:
+                response.raise_for_status()
+                return response.json()
+            logger.warning("Perplexity request throttled, retrying", attempt=attempt + 1,
+                           delay=round(delay, 2), status=response.status_code)
+        time.sleep(delay)
+        attempt += 1
+
+
+async def aask(
+    messages: list[dict[str, str]],
+    api_key: str,
+    client: Optional[httpx.AsyncClient] = None,
+    rate_limiter: Optional[TokenBucket] = None,
+    cache: Optional[ResponseCache] = None
+) -> dict[str, Any]:
+    """Cached, coalesced chat completion: identical normalized queries share one upstream call."""
+    cache = cache or get_response_cache()
+    return await cache.get_or_fetch(
+        query_key(messages, PERPLEXITY_MODEL),
+        lambda: achat_completion(messages, api_key, client=client, rate_limiter=rate_limiter)
+    )
+
+
+def ask(
+    messages: list[dict[str, str]],
+    api_key: str,
+    rate_limiter: Optional[TokenBucket] = None,
+    cache: Optional[ResponseCache] = None
+) -> dict[str, Any]:
+    """Synchronous `aask`; uses the in-process cache tier only."""
+    cache = cache or get_response_cache()
+    key = query_key(messages, PERPLEXITY_MODEL)
+    data = cache.get_local(key)
+    if data is None:
+        start = time.perf_counter()
+        data = chat_completion(messages, api_key, rate_limiter=rate_limiter)
+        cache.record_upstream(key, data, time.perf_counter() - start)
+    return data
+
 
 class PerplexityWebSearchTool(BaseTool):
     """Tool for performing web searches using the Perplexity API."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         super().__init__(
             name="perplexity_web_search",
             description="""
@@ -16,31 +218,26 @@ class PerplexityWebSearchTool(BaseTool):
             """
         )
         self._api_key = api_key or os.environ.get("PERPLEXITY_API_KEY")
+        self._client = client
+        self._rate_limiter = rate_limiter
+        self._cache = cache
 
     def _run(self, query: str) -> str:
         if not self._api_key:
             return "Error: PERPLEXITY_API_KEY is not set."
-        url = "https://api.perplexity.ai/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._api_key}",
-        }
-        body = {
-            "model": "sonar-pro",
-            "messages": [
-                {"role": "user", "content": query}
-            ],
-        }
         try:
-            with httpx.Client() as client:
-                response = client.post(url, headers=headers, json=body, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-            message_content = data["choices"][0]["message"]["content"]
-            if "citations" in data and isinstance(data["citations"], list) and data["citations"]:
-                message_content += "\n\nCitations:\n"
-                for idx, citation in enumerate(data["citations"], 1):
-                    message_content += f"[{idx}] {citation}\n"
-            return message_content
+            data = ask([{"role": "user", "content": query}], self._api_key,
+                       rate_limiter=self._rate_limiter, cache=self._cache)
+            return format_answer(data)
+        except Exception as e:
+            return f"Error calling Perplexity API: {str(e)}"
+
+    async def _arun(self, query: str) -> str:
+        if not self._api_key:
+            return "Error: PERPLEXITY_API_KEY is not set."
+        try:
+            data = await aask([{"role": "user", "content": query}], self._api_key,
+                              client=self._client, rate_limiter=self._rate_limiter, cache=self._cache)
+            return format_answer(data)
         except Exception as e:
             return f"Error calling Perplexity API: {str(e)}"
@@ -8,6 +8,28 @@ import json
 import re
 from dataclasses import dataclass
 
+from proximaai.tools.keyword_matcher import keyword_matcher
+from proximaai.tools.pattern_sets import PatternSet
+
+# Compiled pattern tables: section headings in one combined scan, achievements one scan per pattern
+SECTION_PATTERNS = PatternSet({
+    "experience": ["experience", "work history", "employment"],
+    "education": ["education", "academic", "degree"],
+    "skills": ["skills", "technical skills", "competencies"],
+    "summary": ["summary", "objective", "profile"]
+})
+
+ACHIEVEMENT_PATTERNS = PatternSet({
+    "increased": r'increased.*by.*%',
+    "reduced": r'reduced.*by.*%',
+    "led_team": r'led.*team.*of',
+    "managed_budget": r'managed.*budget.*of',
+    "achieved_goal": r'achieved.*goal',
+    "improved_efficiency": r'improved.*efficiency'
+})
+
+YEAR_PATTERN = re.compile(r'\b(20\d{2}|19\d{2})\b')
+
 
 @dataclass
 class ResumeSection:
@@ -69,13 +91,6 @@ class ResumeParserTool(BaseTool):
         sections = []
         
         # Simple section extraction (in production, use more sophisticated NLP)
-        section_patterns = {
-            "experience": r"(?i)(experience|work history|employment)",
-            "education": r"(?i)(education|academic|degree)",
-            "skills": r"(?i)(skills|technical skills|competencies)",
-            "summary": r"(?i)(summary|objective|profile)"
-        }
-        
         lines = text.split('\n')
         current_section = "general"
         current_content = []
@@ -85,18 +100,17 @@ class ResumeParserTool(BaseTool):
             if not line:
                 continue
                 
-            # Check if this line starts a new section
-            for section_name, pattern in section_patterns.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    if current_content:
-                        sections.append(ResumeSection(
-                            section_type=current_section,
-                            content='\n'.join(current_content),
-                            confidence=0.8
-                        ))
-                    current_section = section_name
-                    current_content = [line]
-                    break
+            # Check if this line starts a new section (the first section in the table that matches names it)
+            heading = SECTION_PATTERNS.first_by_priority(line)
+            if heading:
+                if current_content:
+                    sections.append(ResumeSection(
+                        section_type=current_section,
+                        content='\n'.join(current_content),
+                        confidence=0.8
+                    ))
+                current_section = heading[0]
+                current_content = [line]
             else:
                 current_content.append(line)
         
@@ -143,22 +157,9 @@ class ResumeParserTool(BaseTool):
         )
     
     def _extract_skills(self, content: str) -> List[str]:
-        """Extract skills from content."""
-        # Common technical skills
-        common_skills = [
-            "python", "javascript", "java", "react", "node.js", "sql", "aws",
-            "docker", "kubernetes", "machine learning", "data analysis",
-            "project management", "agile", "scrum", "leadership", "communication"
-        ]
-        
-        found_skills = []
-        content_lower = content.lower()
-        
-        for skill in common_skills:
-            if skill in content_lower:
-                found_skills.append(skill)
-        
-        return found_skills
+        """Extract technical and soft skills from content."""
+        keywords = keyword_matcher.categorize(content)
+        return keywords["technical_skills"] + keywords["soft_skills"]
     
     def _estimate_experience(self, sections: List[ResumeSection]) -> int:
         """Estimate years of experience from resume."""
@@ -166,8 +167,7 @@ class ResumeParserTool(BaseTool):
         total_content = " ".join([s.content for s in sections])
         
         # Look for year patterns
-        year_pattern = r'\b(20\d{2}|19\d{2})\b'
-        years = re.findall(year_pattern, total_content)
+        years = YEAR_PATTERN.findall(total_content)
         
         if years:
             years = [int(y) for y in years]
@@ -199,23 +199,14 @@ class ResumeParserTool(BaseTool):
         """Extract key achievements from resume."""
         achievements = []
         
+        # Section by section, each indicator on its own, so overlapping achievements are all found
         for section in sections:
-            content = section.content
-            # Look for achievement indicators
-            achievement_indicators = [
-                r'increased.*by.*%',
-                r'reduced.*by.*%',
-                r'led.*team.*of',
-                r'managed.*budget.*of',
-                r'achieved.*goal',
-                r'improved.*efficiency'
-            ]
-            
-            for pattern in achievement_indicators:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                achievements.extend(matches)
+            for _, value in ACHIEVEMENT_PATTERNS.findall_each(section.content):
+                achievements.append(value)
+                if len(achievements) == 5:
+                    return achievements  # Return top 5 achievements
         
-        return achievements[:5]  # Return top 5 achievements
+        return achievements
     
     def _calculate_ats_score(self, sections: List[ResumeSection], skills: List[str]) -> float:
         """Calculate ATS compatibility score."""
@@ -314,30 +305,9 @@ class ResumeOptimizerTool(BaseTool):
         }
     
     def _extract_keywords(self, text: str) -> List[str]:
-        """Extract important keywords from text."""
-        # Common job-related keywords
-        keywords = []
-        
-        # Technical skills
-        tech_keywords = [
-            "python", "java", "javascript", "react", "angular", "vue", "node.js",
-            "sql", "nosql", "mongodb", "postgresql", "aws", "azure", "gcp",
-            "docker", "kubernetes", "git", "agile", "scrum", "kanban"
-        ]
-        
-        # Soft skills
-        soft_keywords = [
-            "leadership", "communication", "teamwork", "problem solving",
-            "analytical", "creative", "organized", "detail-oriented"
-        ]
-        
-        text_lower = text.lower()
-        
-        for keyword in tech_keywords + soft_keywords:
-            if keyword in text_lower:
-                keywords.append(keyword)
-        
-        return keywords
+        """Extract important keywords (technical and soft skills) from text."""
+        keywords = keyword_matcher.categorize(text)
+        return keywords["technical_skills"] + keywords["soft_skills"]
     
     def _generate_optimization_suggestions(self, missing_keywords: List[str], job_description: str) -> List[str]:
         """Generate specific optimization suggestions."""
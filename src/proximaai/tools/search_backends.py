@@ -0,0 +1,328 @@
+"""
+Search Backends - Pluggable search providers for WebSearchTool and CompanyResearchTool.
+
+- MockSearchBackend: canned results (default, no network).
+- HTTPSearchBackend: adapter for JSON web search APIs (Brave Search field layout by default).
+- SQLiteSearchBackend: offline SQLite FTS5/BM25 index over a directory of crawled pages.
+"""
+
+from abc import ABC, abstractmethod
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import quote_plus
+import asyncio
+import json
+import os
+import re
+import sqlite3
+import threading
+
+import httpx
+
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("search_backends")
+
+
+class SearchBackend(ABC):
+    """Returns ranked results as `{"title", "url", "snippet", "source"}` dicts."""
+
+    @abstractmethod
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        ...
+
+    async def asearch(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        """Async search; blocking backends run on a worker thread."""
+        return await asyncio.to_thread(self.search, query, k)
+
+
+class MockSearchBackend(SearchBackend):
+    """Placeholder results, used when no real backend is configured."""
+
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        return [
+            {
+                "title": f"Search results for: {query}",
+                "url": f"https://example.com/search?q={quote_plus(query)}",
+                "snippet": f"Relevant information about {query} from various sources.",
+                "source": "web_search"
+            },
+            {
+                "title": f"Latest news about {query}",
+                "url": f"https://news.example.com/search?q={quote_plus(query)}",
+                "snippet": f"Recent developments and news related to {query}.",
+                "source": "news_search"
+            }
+        ][:k]
+
+
+class HTTPSearchBackend(SearchBackend):
+    """Adapter for JSON search APIs: GET `endpoint?q=...&count=k`, results read from `results_path`.
+
+    Defaults match the Brave Search API; other providers only need a different path/field map.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: Optional[str] = None,
+        api_key_header: str = "X-Subscription-Token",
+        query_param: str = "q",
+        count_param: str = "count",
+        results_path: str = "web.results",
+        field_map: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0
+    ):
+        self.endpoint = endpoint
+        self.headers = {"Accept": "application/json"}
+        if api_key:
+            self.headers[api_key_header] = api_key
+        self.query_param = query_param
+        self.count_param = count_param
+        self.results_path = [part for part in results_path.split(".") if part]
+        self.field_map = field_map or {"title": "title", "url": "url", "snippet": "description"}
+        self.timeout = timeout
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    def _params(self, query: str, k: int) -> Dict[str, Any]:
+        return {self.query_param: query, self.count_param: k}
+
+    def _parse(self, data: Any, k: int) -> List[Dict[str, Any]]:
+        for part in self.results_path:
+            data = data.get(part, []) if isinstance(data, dict) else []
+        return [
+            {**{field: item.get(source_field, "") for field, source_field in self.field_map.items()}, "source": "web_search"}
+            for item in data[:k] if isinstance(item, dict)
+        ]
+
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout)
+        response = self._client.get(self.endpoint, params=self._params(query, k), headers=self.headers)
+        response.raise_for_status()
+        return self._parse(response.json(), k)
+
+    async def asearch(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        if self._async_client is None or self._async_client.is_closed:
+            self._async_client = httpx.AsyncClient(timeout=self.timeout)
+        response = await self._async_client.get(self.endpoint, params=self._params(query, k), headers=self.headers)
+        response.raise_for_status()
+        return self._parse(response.json(), k)
+
+
+class _PageTextParser(HTMLParser):
+    """Extracts the title, canonical URL and visible text of an HTML page."""
+
+    _SKIP = {"script", "style", "noscript", "template"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.canonical = ""
+        self.parts: List[str] = []
+        self._in_title = False
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "link":
+            attributes = dict(attrs)
+            if attributes.get("rel") == "canonical" and attributes.get("href"):
+                self.canonical = attributes["href"]
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip_depth:
+            self.parts.append(data)
+
+
+def load_page(path: Path) -> Optional[Dict[str, str]]:
+    """Read a crawled page (.html/.htm, .txt/.md, or a .json with url/title/body) into a document."""
+    suffix = path.suffix.lower()
+    if suffix not in (".html", ".htm", ".txt", ".md", ".json"):
+        return None
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    if suffix in (".html", ".htm"):
+        parser = _PageTextParser()
+        parser.feed(text)
+        body = re.sub(r"\s+", " ", " ".join(parser.parts)).strip()
+        return {"url": parser.canonical or path.resolve().as_uri(), "title": parser.title.strip() or path.stem, "body": body}
+    if suffix in (".txt", ".md"):
+        first_line = text.strip().splitlines()[0] if text.strip() else path.stem
+        return {"url": path.resolve().as_uri(), "title": first_line.lstrip("# ").strip(), "body": text}
+    if suffix == ".json":
+        page = json.loads(text)
+        return {"url": page.get("url") or path.resolve().as_uri(), "title": page.get("title", ""), "body": page.get("body") or page.get("text", "")}
+
+
+def iter_pages(directory: str | os.PathLike) -> Iterator[Dict[str, str]]:
+    """Stream documents from every supported file under a directory."""
+    for path in sorted(Path(directory).rglob("*")):
+        if not path.is_file():
+            continue
+        try:
+            page = load_page(path)
+        except Exception as e:
+            logger.warning("Skipping unreadable page", path=str(path), error=str(e))
+            continue
+        if page is not None:
+            yield page
+
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def fts_query(query: str, match_all: bool = True) -> str:
+    """Turn free text into a safe FTS5 query: quoted terms joined by AND (implicit) or OR."""
+    terms = [f'"{term}"' for term in _TOKEN.findall(query.lower())]
+    return (" " if match_all else " OR ").join(terms)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """Offline full-text index (SQLite FTS5, BM25 ranking) over crawled pages.
+
+    Documents are keyed by URL; re-indexing a URL replaces it. Queries use `ORDER BY rank LIMIT k`,
+    so FTS5 keeps only the top k matches instead of sorting every hit. Each thread gets its
+    own read connection; writes are serialized.
+    """
+
+    def __init__(self, db_path: str | os.PathLike, title_weight: float = 5.0):
+        self.db_path = str(db_path)
+        self.title_weight = title_weight
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._setup()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _setup(self):
+        conn = self._connect()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL UNIQUE,
+                title TEXT NOT NULL DEFAULT '',
+                body TEXT NOT NULL DEFAULT ''
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                title, body, content='documents', content_rowid='id', tokenize='porter unicode61'
+            );
+            CREATE TRIGGER IF NOT EXISTS documents_ai AFTER INSERT ON documents BEGIN
+                INSERT INTO documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+            END;
+            CREATE TRIGGER IF NOT EXISTS documents_ad AFTER DELETE ON documents BEGIN
+                INSERT INTO documents_fts(documents_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+            END;
+            CREATE TRIGGER IF NOT EXISTS documents_au AFTER UPDATE ON documents BEGIN
+                INSERT INTO documents_fts(documents_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+                INSERT INTO documents_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+            END;
+            """
+        )
+        # Persist the weighted BM25 as the table's rank function so ORDER BY rank uses it
+        conn.execute("INSERT INTO documents_fts(documents_fts, rank) VALUES ('rank', ?)",
+                     (f"bm25({float(self.title_weight)}, 1.0)",))
+        conn.commit()
+
+    def index_documents(self, documents: Iterable[Dict[str, str]], batch_size: int = 2000) -> int:
+        """Bulk upsert documents (`url`, `title`, `body`), one transaction per batch. Returns the count."""
+        count = 0
+        batch: List[tuple[str, str, str]] = []
+        with self._write_lock:
+            conn = self._connect()
+            for document in documents:
+                batch.append((document["url"], document.get("title", ""), document.get("body", "")))
+                if len(batch) >= batch_size:
+                    count += self._write_batch(conn, batch)
+                    batch = []
+            if batch:
+                count += self._write_batch(conn, batch)
+        logger.info("Indexed documents", count=count, db_path=self.db_path)
+        return count
+
+    @staticmethod
+    def _write_batch(conn: sqlite3.Connection, batch: List[tuple[str, str, str]]) -> int:
+        with conn:
+            conn.executemany(
+                "INSERT INTO documents (url, title, body) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET title = excluded.title, body = excluded.body",
+                batch
+            )
+        return len(batch)
+
+    def index_directory(self, directory: str | os.PathLike, batch_size: int = 2000) -> int:
+        """Index every crawled page under a directory."""
+        return self.index_documents(iter_pages(directory), batch_size=batch_size)
+
+    def optimize(self):
+        """Merge FTS5 segments after a large bulk load (faster queries)."""
+        with self._write_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT INTO documents_fts(documents_fts) VALUES ('optimize')")
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT count(*) FROM documents").fetchone()[0]
+
+    def _query(self, match: str, k: int) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            """
+            SELECT d.url, d.title, snippet(documents_fts, 1, '', '', '...', 24), rank
+            FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid
+            WHERE documents_fts MATCH ? ORDER BY rank LIMIT ?
+            """,
+            (match, k)
+        ).fetchall()
+        return [
+            {"title": title, "url": url, "snippet": snippet, "score": round(-score, 4), "source": "local_index"}
+            for url, title, snippet, score in rows
+        ]
+
+    def search(self, query: str, k: int = 10) -> List[Dict[str, Any]]:
+        match = fts_query(query)
+        if not match:
+            return []
+        results = self._query(match, k)
+        if not results and " " in match:
+            # No page has every term; fall back to any-term matching, still BM25 ranked
+            results = self._query(fts_query(query, match_all=False), k)
+        return results
+
+
+def create_search_backend(backend: Optional[str] = None) -> SearchBackend:
+    """Build the backend selected by `WEB_SEARCH_BACKEND` (mock, http or sqlite)."""
+    backend = (backend or os.getenv("WEB_SEARCH_BACKEND", "mock")).lower()
+
+    if backend == "http":
+        return HTTPSearchBackend(
+            endpoint=os.getenv("WEB_SEARCH_ENDPOINT", "https://api.search.brave.com/res/v1/web/search"),
+            api_key=os.getenv("WEB_SEARCH_API_KEY"),
+            api_key_header=os.getenv("WEB_SEARCH_API_KEY_HEADER", "X-Subscription-Token"),
+            results_path=os.getenv("WEB_SEARCH_RESULTS_PATH", "web.results"),
+        )
+    elif backend == "sqlite":
+        return SQLiteSearchBackend(os.getenv("WEB_SEARCH_INDEX", ".cache/search_index.db"))
+    elif backend == "mock":
+        return MockSearchBackend()
+    else:
+        raise ValueError(f"Unknown WEB_SEARCH_BACKEND: {backend}")
@@ -0,0 +1,45 @@
+"""
+Skill Taxonomy - Shared keyword vocabulary for the job and resume analyzers.
+
+Keywords are lowercase; multi-word keywords match any run of whitespace. Aliases map
+alternative surface forms onto a canonical keyword.
+"""
+
+from typing import Dict, List
+
+SKILL_TAXONOMY: Dict[str, List[str]] = {
+    "technical_skills": [
+        "python", "javascript", "java", "react", "angular", "vue", "node.js",
+        "sql", "nosql", "mongodb", "postgresql", "aws", "azure", "gcp",
+        "docker", "kubernetes", "git", "agile", "scrum", "kanban",
+        "machine learning", "data science", "data analysis", "devops"
+    ],
+    "soft_skills": [
+        "leadership", "communication", "teamwork", "problem solving", "project management",
+        "analytical", "creative", "organized", "detail-oriented"
+    ],
+    "work_style": ["remote", "flexible", "collaborative"],
+    "values": ["innovation", "diversity", "inclusion", "growth", "learning", "impact"],
+    "perks": ["gym", "snacks", "coffee", "happy hour", "team events", "conferences"],
+    "benefits": ["health insurance", "dental", "vision", "401k", "pto", "vacation"],
+    "equity": ["equity"],
+    "bonus": ["bonus", "performance"],
+    "red_flags": [
+        "rockstar", "ninja", "guru", "work hard play hard",
+        "unlimited overtime", "startup mentality", "wearing many hats",
+        "fast-paced environment", "high pressure", "crunch time"
+    ],
+    "green_flags": [
+        "work-life balance", "flexible hours", "remote work",
+        "professional development", "learning budget", "conference attendance",
+        "competitive salary", "health benefits", "401k matching",
+        "diversity", "inclusion", "equal opportunity"
+    ],
+}
+
+KEYWORD_ALIASES: Dict[str, str] = {
+    "work from home": "remote",
+    "stock options": "equity",
+    "nodejs": "node.js",
+    "postgres": "postgresql",
+}
@@ -2,18 +2,23 @@
 Web Search Tool - Performs internet searches for job-related information.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Type
 from langchain.tools import BaseTool
+from pydantic import BaseModel, Field
 import requests
 import json
-from urllib.parse import quote_plus
+import asyncio
 import time
+import weakref
+
+from proximaai.utils.run_sync import run_sync
+from proximaai.tools.search_backends import SearchBackend, create_search_backend
 
 
 class WebSearchTool(BaseTool):
     """Tool for performing web searches."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, backend: Optional[SearchBackend] = None, max_results: int = 10):
         super().__init__(
             name="web_search",
             description="""
@@ -26,90 +31,120 @@ class WebSearchTool(BaseTool):
         )
         # Store api_key in a way that doesn't conflict with Pydantic
         self._api_key = api_key
-        # For now, we'll use a simple approach. In production, you'd want to use
-        # a proper search API like Google Custom Search, SerpAPI, or similar
+        # Mock, HTTP provider or local index, selected by WEB_SEARCH_BACKEND unless given
+        self._backend = backend or create_search_backend()
+        self._max_results = max_results
     
     @property
     def api_key(self) -> Optional[str]:
         """Get the API key."""
         return self._api_key
+
+    @property
+    def backend(self) -> SearchBackend:
+        return self._backend
     
     def _run(self, query: str) -> str:
         """Perform a web search."""
         try:
-            # This is a placeholder implementation
-            # In production, you'd integrate with a real search API
             search_results = self._perform_search(query)
             return json.dumps(search_results, indent=2)
         except Exception as e:
             return f"Error performing search: {str(e)}"
+
+    async def _arun(self, query: str) -> str:
+        """Perform a web search without blocking the event loop."""
+        try:
+            search_results = await self._backend.asearch(query, self._max_results)
+            return json.dumps(search_results, indent=2)
+        except Exception as e:
+            return f"Error performing search: {str(e)}"
     
     def _perform_search(self, query: str) -> List[Dict[str, Any]]:
-        """Perform the actual search (placeholder implementation)."""
-        # This is a mock implementation
-        # In production, replace with actual search API calls
-        
-        # Simulate search results
-        mock_results = [
-            {
-                "title": f"Search results for: {query}",
-                "url": f"https://example.com/search?q={quote_plus(query)}",
-                "snippet": f"Relevant information about {query} from various sources.",
-                "source": "web_search"
-            },
-            {
-                "title": f"Latest news about {query}",
-                "url": f"https://news.example.com/search?q={quote_plus(query)}",
-                "snippet": f"Recent developments and news related to {query}.",
-                "source": "news_search"
-            }
-        ]
-        
-        return mock_results
+        """Perform the actual search with the configured backend."""
+        return self._backend.search(query, self._max_results)
+
+
+# Research facets and the search query issued for each
+COMPANY_RESEARCH_FACETS = {
+    "culture": "{company} company culture",
+    "news": "{company} recent news",
+    "jobs": "{company} job opportunities",
+    "financials": "{company} financial performance",
+}
+
+
+class CompanyResearchInput(BaseModel):
+    company_name: str = Field(description="Name of the company to research")
+    facets: Optional[List[str]] = Field(
+        default=None,
+        description=f"Facets to research, any of {list(COMPANY_RESEARCH_FACETS)}; all when omitted"
+    )
 
 
 class CompanyResearchTool(BaseTool):
     """Tool for researching specific companies."""
-    
-    def __init__(self):
+
+    args_schema: Type[BaseModel] = CompanyResearchInput
+
+    def __init__(self, max_concurrency: int = 4, query_timeout: float = 15.0, backend: Optional[SearchBackend] = None):
         super().__init__(
             name="company_research",
             description="""
             Researches specific companies to find information about their culture, 
             recent news, financial performance, and job opportunities.
             
-            Input should be a company name.
+            Input should be a company name, optionally with the facets to research
+            (culture, news, jobs, financials).
             Returns comprehensive company information.
             """
         )
-    
-    def _run(self, company_name: str) -> str:
+        self._max_concurrency = max_concurrency
+        self._query_timeout = query_timeout
+        self._backend = backend or create_search_backend()
+        # One semaphore per event loop, shared by every call of this tool on that loop
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _run(self, company_name: str, facets: Optional[List[str]] = None) -> str:
         """Research a specific company."""
+        return run_sync(self._arun(company_name, facets))
+
+    async def _arun(self, company_name: str, facets: Optional[List[str]] = None) -> str:
+        """Research a company, running the facet searches concurrently.
+
+        Failed or timed-out searches are reported as `{"error": ...}` in place of their results,
+        so the remaining facets are still returned.
+        """
         try:
-            # Perform multiple searches for comprehensive company info
-            searches = [
-                f"{company_name} company culture",
-                f"{company_name} recent news",
-                f"{company_name} job opportunities",
-                f"{company_name} financial performance"
-            ]
-            
+            selected = facets or list(COMPANY_RESEARCH_FACETS)
+            unknown = [facet for facet in selected if facet not in COMPANY_RESEARCH_FACETS]
+            if unknown:
+                return f"Error researching company: unknown facets {unknown}, expected any of {list(COMPANY_RESEARCH_FACETS)}"
+
+            searches = [COMPANY_RESEARCH_FACETS[facet].format(company=company_name) for facet in dict.fromkeys(selected)]
+            outcomes = await asyncio.gather(*[self._bounded_search(search) for search in searches], return_exceptions=True)
+
             results = {}
-            for search in searches:
-                results[search] = self._perform_search(search)
-            
+            for search, outcome in zip(searches, outcomes):
+                if isinstance(outcome, asyncio.TimeoutError):
+                    results[search] = {"error": f"Search timed out after {self._query_timeout}s"}
+                elif isinstance(outcome, Exception):
+                    results[search] = {"error": str(outcome)}
+                else:
+                    results[search] = outcome
+
             return json.dumps(results, indent=2)
         except Exception as e:
             return f"Error researching company: {str(e)}"
-    
-    def _perform_search(self, query: str) -> List[Dict[str, Any]]:
-        """Perform search (placeholder implementation)."""
-        # Mock implementation - replace with actual search API
-        return [
-            {
-                "title": f"Results for: {query}",
-                "url": f"https://example.com/search?q={quote_plus(query)}",
-                "snippet": f"Information about {query}",
-                "source": "company_research"
-            }
-        ]
+
+    async def _bounded_search(self, query: str) -> List[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        async with semaphore:
+            return await asyncio.wait_for(self._aperform_search(query), timeout=self._query_timeout)
+
+    async def _aperform_search(self, query: str) -> List[Dict[str, Any]]:
+        """Async search on the configured backend (default: the one selected by WEB_SEARCH_BACKEND)."""
+        return await self._backend.asearch(query, 5)
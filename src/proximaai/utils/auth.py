@@ -1,44 +1,190 @@
 from langgraph_sdk import Auth
-from typing import Any
+from typing import Any, Optional
+from collections import OrderedDict
 
+import asyncio
+import hashlib
 import os
+import time
+
+import jwt as pyjwt
 from supabase import AsyncClient, acreate_client
 
-from gotrue.types import User
+try:
+    from supabase_auth.types import User
+except ImportError:  # older supabase releases ship the auth client as gotrue
+    from gotrue.types import User
 
 url: str | None = os.environ.get("SUPABASE_URL")
 key: str | None = os.environ.get("SUPABASE_KEY")
 
+# Token verification mode: "remote" (Supabase auth API) or "local" (JWT signature check, no round-trip)
+verify_mode: str = os.environ.get("SUPABASE_JWT_VERIFY", "remote")
+jwt_secret: str | None = os.environ.get("SUPABASE_JWT_SECRET")
+jwt_audience: str = os.environ.get("SUPABASE_JWT_AUDIENCE", "authenticated")
+
+# Accepted signature algorithms; the token header only selects the path, never the algorithm
+SECRET_ALGORITHMS = ["HS256"]
+JWKS_ALGORITHMS = ["RS256", "ES256"]
+
+
+class TokenCache:
+    """LRU cache of verified tokens keyed by token digest, each entry capped at the JWT `exp`."""
+
+    def __init__(self, ttl: float = 300.0, max_size: int = 10_000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, tuple[bool, Optional[str]]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[tuple[bool, Optional[str]]]:
+        _key = self.digest(token)
+        entry = self._entries.get(_key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[_key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(_key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, token: str, value: tuple[bool, Optional[str]], exp: Optional[float] = None):
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+        if expires_at <= time.time():
+            return
+        _key = self.digest(token)
+        self._entries[_key] = (expires_at, value)
+        self._entries.move_to_end(_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+token_cache = TokenCache(
+    ttl=float(os.environ.get("AUTH_TOKEN_CACHE_TTL", "300")),
+    max_size=int(os.environ.get("AUTH_TOKEN_CACHE_SIZE", "10000"))
+)
+
+# Singleton Supabase client, created on first use
+_supabase: AsyncClient | None = None
+_supabase_lock = asyncio.Lock()
+_jwks_client: pyjwt.PyJWKClient | None = None
+
+
+async def get_supabase_client() -> AsyncClient | None:
+    global _supabase
+
+    if _supabase is None and url and key:
+        async with _supabase_lock:
+            if _supabase is None:
+                _supabase = await acreate_client(url, key)
+    return _supabase
+
+
+def _unverified_exp(token: str) -> Optional[float]:
+    """Read the `exp` claim without verifying; only used to bound the cache entry."""
+    try:
+        exp = pyjwt.decode(token, options={"verify_signature": False}).get("exp")
+    except pyjwt.PyJWTError:
+        return None
+    return float(exp) if exp is not None else None
+
+
+def _verify_local(token: str) -> tuple[bool, Optional[str], Optional[float]]:
+    """Verify the JWT signature locally with the project secret (HS256) or the project JWKS."""
+    global _jwks_client
+
+    header = pyjwt.get_unverified_header(token)
+    if str(header.get("alg", "HS256")).startswith("HS"):
+        if not jwt_secret:
+            raise Auth.exceptions.HTTPException(
+                status_code=500,
+                detail="SUPABASE_JWT_SECRET not set for local verification"
+            )
+        signing_key: Any = jwt_secret
+        algorithms = SECRET_ALGORITHMS
+    else:
+        if _jwks_client is None:
+            if not url:
+                raise Auth.exceptions.HTTPException(
+                    status_code=500,
+                    detail="SUPABASE_URL not set for JWKS verification"
+                )
+            _jwks_client = pyjwt.PyJWKClient(f"{url.rstrip('/')}/auth/v1/.well-known/jwks.json")
+        jwk = _jwks_client.get_signing_key_from_jwt(token)
+        if jwk.algorithm_name not in JWKS_ALGORITHMS:
+            raise pyjwt.InvalidAlgorithmError(f"JWKS key algorithm {jwk.algorithm_name} is not allowed")
+        signing_key, algorithms = jwk.key, [jwk.algorithm_name]
+
+    claims = pyjwt.decode(token, signing_key, algorithms=algorithms, audience=jwt_audience)
+    exp = claims.get("exp")
+    return claims.get("aud") == jwt_audience, claims.get("sub"), float(exp) if exp is not None else None
+
 
 async def is_valid_key(auth_header: Any,):
     if isinstance(auth_header, bytes):
         auth_header = auth_header.decode()
+    if not auth_header or " " not in auth_header:
+        raise Auth.exceptions.HTTPException(
+            status_code=401,
+            detail="Invalid authorization header format"
+        )
+
+    scheme, token = auth_header.split(" ", 1)
+    if scheme != "Bearer":
+        raise Auth.exceptions.HTTPException(
+            status_code=401,
+            detail="Invalid authorization header format"
+        )
+
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+
+    if verify_mode == "local":
+        try:
+            valid, user_id, exp = await asyncio.to_thread(_verify_local, token)
+        except (pyjwt.PyJWTError, TypeError, ValueError):  # any decode failure, e.g. a key/alg mismatch
+            raise Auth.exceptions.HTTPException(
+                status_code=401,
+                detail="Invalid API key"
+            )
+        if valid:
+            token_cache.set(token, (valid, user_id), exp=exp)
+        return valid, user_id
 
-    scheme, token = auth_header.split(" ")
     user: User | None = None
-    if url and key:
-        supabase: AsyncClient | None = await acreate_client(url, key)
-    else:
-        supabase = None
+    supabase = await get_supabase_client()
     if not supabase:
         raise Auth.exceptions.HTTPException(
             status_code=500,
             detail="Supabase client not initialized"
         )
-    elif scheme != "Bearer":
-        raise Auth.exceptions.HTTPException(
-            status_code=401,
-            detail="Invalid authorization header format"
-        )
-    
+
     try:
         data = await supabase.auth.get_user(jwt=token)
-        if data:
-            user = data.user
-            return user.aud=="authenticate", user.id
     except Exception as e:
         raise Auth.exceptions.HTTPException(
             status_code=401,
             detail="Invalid API key"
         )
+    if data:
+        user = data.user
+        result = (user.aud == jwt_audience, user.id)
+        if result[0]:
+            token_cache.set(token, result, exp=_unverified_exp(token))
+        return result
     return False, None
@@ -0,0 +1,153 @@
+"""
+Company Extraction - Pull the target company and role out of a user request.
+
+Regex heuristics run first; an LLM with structured output is only consulted when they find nothing.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import re
+
+from langchain_core.language_models import BaseChatModel
+
+from proximaai.utils.logger import get_logger
+from proximaai.utils.structured_output import CompanyExtraction
+
+logger = get_logger("company_extraction")
+
+# Legal suffixes dropped when canonicalizing company names ("Geico Corp." == "GEICO")
+_LEGAL_SUFFIXES = {
+    "inc", "incorporated", "llc", "llp", "ltd", "limited", "corp", "corporation",
+    "co", "company", "plc", "gmbh", "ag", "sa", "group", "holdings",
+}
+# Capitalized words that start sentences but are never company names
+_NOT_COMPANIES = {
+    "i", "im", "i'm", "me", "my", "we", "our", "you", "your", "the", "a", "an", "this", "that",
+    "please", "help", "resume", "cv", "job", "role", "position", "it", "here", "hi", "hello",
+}
+# Skills and technologies that follow "at"/"join" in requests but are not employers
+_TECHNOLOGIES = {
+    "python", "java", "javascript", "typescript", "go", "golang", "rust", "scala", "kotlin", "swift", "c", "c++",
+    "c#", "r", "sql", "nosql", "html", "css", "react", "angular", "vue", "node", "django", "flask", "fastapi",
+    "spring", "aws", "gcp", "azure", "kubernetes", "docker", "terraform", "linux", "git", "spark", "kafka",
+    "airflow", "dbt", "snowflake", "pandas", "numpy", "pytorch", "tensorflow", "excel", "tableau", "ml", "ai",
+    "nlp", "llm", "llms", "machine", "data", "cloud", "devops", "agile", "scrum",
+}
+# A "." only continues a name when it is not sentence punctuation ("Amazon.com", "U.S"), and
+# names never span lines, so "at Meta. I have" stops at "Meta". Names start with a letter ("5 years")
+_NAME = r"[A-Z](?:[\w&'\-]|\.(?=[\w&'\-]))*"
+_COMPANY_NAME = rf"(?P<company>{_NAME}(?:[ \t]+(?:{_NAME}|&|of|and)){{0,4}})"
+
+# Most explicit first: a stated target ("apply to Netflix") beats a past employer ("worked at Amazon").
+# "for"/"with" are left to the LLM fallback; they mostly introduce skills and roles, not companies
+_COMPANY_PATTERNS = [
+    re.compile(r"^[ \t]*(?:company|employer|organization|organisation)[ \t]*[:\-][ \t]*(?P<company>[^\n]+?)[ \t]*$",
+               re.IGNORECASE | re.MULTILINE),
+    re.compile(rf"\b(?i:apply|applying|applied)\s+(?i:to)\s+{_COMPANY_NAME}"),
+    re.compile(rf"\b(?i:join|joining)\s+{_COMPANY_NAME}"),
+    re.compile(rf"\b(?i:at)\s+{_COMPANY_NAME}"),
+    re.compile(rf"{_COMPANY_NAME}\s+is\s+(?:hiring|looking|seeking)\b"),
+]
+_ROLE_PATTERNS = [
+    re.compile(r"^[ \t]*(?:role|position|job title|title)[ \t]*[:\-][ \t]*(?P<role>[^\n]+?)[ \t]*$",
+               re.IGNORECASE | re.MULTILINE),
+    re.compile(r"\b(?:as|for)\s+(?:an?|the)\s+(?P<role>[A-Za-z][\w /&+\-]{1,60}?)\s+(?:role|position|job|opening)\b",
+               re.IGNORECASE),
+    re.compile(r"\b(?:an?|the)\s+(?P<role>[A-Za-z][\w /&+\-]{1,60}?)\s+(?:role|position|opening)\s+(?:at|with)\b",
+               re.IGNORECASE),
+    re.compile(r"\b(?P<role>[A-Z][\w&+\-]*(?:[ \t]+[A-Z][\w&+\-]*){0,4})[ \t]+(?:role|position|opening)[ \t]+(?:at|with)\b"),
+    re.compile(r"\b(?:as|for)\s+(?:an?\s+)?(?P<role>[A-Z][\w&+\-]*(?:\s+[A-Z][\w&+\-]*){0,4})(?:\s+(?:at|with)\s|[.,;!?]|$)"),
+    re.compile(r"\bis\s+hiring\s+(?:an?\s+)?(?P<role>[A-Za-z][\w /&+\-]{1,60}?)(?:[.,;!?\n]|$)"),
+]
+
+
+@dataclass(frozen=True)
+class CompanyTarget:
+    """The company (and optionally role) a request is about."""
+    company: str
+    role: str = ""
+    source: str = "regex"
+
+    @property
+    def cache_key(self) -> str:
+        """Normalized research key, e.g. `geico`. Research covers the company, not the role, so every
+        role at a company shares one entry."""
+        return canonical_company(self.company)
+
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def canonical_company(name: str) -> str:
+    """Lowercase, strip punctuation and trailing legal suffixes, and slugify a company name."""
+    words = re.sub(r"[^\w&\s]", " ", name.lower()).split()
+    while len(words) > 1 and words[-1] in _LEGAL_SUFFIXES:
+        words.pop()
+    return slugify(" ".join(words))
+
+
+def _clean_company(candidate: str) -> Optional[str]:
+    words = candidate.strip(" .,;:!?").split()
+    # A name ends where a new clause starts ("at Stripe I built...")
+    for i, word in enumerate(words[1:], start=1):
+        if word.lower().strip(".,'") in _NOT_COMPANIES:
+            words = words[:i]
+            break
+    # Trailing connectors come from the greedy name pattern ("Geico and")
+    while words and words[-1].lower() in {"&", "of", "and"}:
+        words.pop()
+    if not words or words[0].lower().strip(".,'") in _NOT_COMPANIES | _TECHNOLOGIES:
+        return None
+    return " ".join(words)
+
+
+def extract_target(text: str) -> Optional[CompanyTarget]:
+    """Cheap regex extraction; returns None when no company is found."""
+    if not text:
+        return None
+
+    company = None
+    for pattern in _COMPANY_PATTERNS:
+        for match in pattern.finditer(text):
+            company = _clean_company(match.group("company"))
+            if company:
+                break
+        if company:
+            break
+    if company is None:
+        return None
+
+    role = ""
+    for pattern in _ROLE_PATTERNS:
+        for match in pattern.finditer(text):
+            candidate = match.group("role").strip(" .,;:!?")
+            # "for Google." matches the role pattern too
+            if canonical_company(candidate) != canonical_company(company):
+                role = candidate
+                break
+        if role:
+            break
+
+    return CompanyTarget(company=company, role=role, source="regex")
+
+
+async def aextract_target(text: str, model: Optional[BaseChatModel] = None) -> Optional[CompanyTarget]:
+    """Regex extraction with an LLM fallback when a model is given."""
+    target = extract_target(text)
+    if target is not None or model is None or not text:
+        return target
+
+    try:
+        extraction = await model.with_structured_output(CompanyExtraction).ainvoke(
+            "Identify the company the user wants to work for and the job title they are targeting. "
+            "Leave a field empty if it is not stated.\n\n"
+            f"Request:\n{text[:4000]}"
+        )
+    except Exception as e:
+        logger.warning("LLM company extraction failed", error=str(e))
+        return None
+
+    if not isinstance(extraction, CompanyExtraction) or not extraction.company.strip():
+        return None
+    return CompanyTarget(company=extraction.company.strip(), role=extraction.role.strip(), source="llm")
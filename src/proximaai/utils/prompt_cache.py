@@ -0,0 +1,178 @@
+"""
+Prompt Cache - Anthropic prompt-prefix caching helpers and per-node cache usage accounting.
+
+Anthropic caches a request's prefix (tools, then system, then messages) up to each content block
+marked with `cache_control`; a later request with a byte-identical prefix reads it at a tenth of
+the input price instead of re-processing it, while writing the cache costs 1.25x. Agents put their
+stable instructions first, mark the end of that prefix, and send the per-run input after it.
+Prefixes shorter than the model's minimum (1024 tokens on Sonnet) are silently not cached.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+import os
+import threading
+import time
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.outputs import LLMResult
+
+from proximaai.utils.logger import get_logger
+
+logger = get_logger("prompt_cache")
+
+# Anthropic input price multipliers relative to uncached input
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+# USD per million tokens; defaults are Claude 3.7 Sonnet list prices
+INPUT_PRICE_PER_MTOK = float(os.getenv("LLM_INPUT_PRICE_PER_MTOK", "3.0"))
+OUTPUT_PRICE_PER_MTOK = float(os.getenv("LLM_OUTPUT_PRICE_PER_MTOK", "15.0"))
+
+
+def prompt_caching_enabled() -> bool:
+    """Whether agents mark cache breakpoints (`PROMPT_CACHING`, default on)."""
+    return os.getenv("PROMPT_CACHING", "true").lower() not in ("0", "false", "no")
+
+
+def text_block(text: str, cache: bool = False) -> Dict[str, Any]:
+    """A text content block, marked as the end of a cacheable prefix when `cache` is set."""
+    block: Dict[str, Any] = {"type": "text", "text": text}
+    if cache:
+        block["cache_control"] = {"type": "ephemeral"}
+    return block
+
+
+def cached_system(text: str, cache: bool = True) -> SystemMessage:
+    """System message whose content is a cacheable prefix (tool definitions are cached with it)."""
+    return SystemMessage(content=[text_block(text, cache)]) if cache else SystemMessage(content=text)
+
+
+def cached_human(stable: str, variable: str, cache: bool = True) -> HumanMessage:
+    """Human message with a stable part (cached, together with everything before it) and a per-run part."""
+    if not cache:
+        return HumanMessage(content=f"{stable}\n\n{variable}" if stable else variable)
+    blocks = [text_block(stable, cache=True)] if stable else []
+    return HumanMessage(content=blocks + [text_block(variable)])
+
+
+@dataclass
+class CacheUsage:
+    calls: int = 0
+    input_tokens: int = 0  # all input tokens, cached or not
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    output_tokens: int = 0
+    latency_seconds: float = 0.0
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        return self.input_tokens - self.cache_read_tokens - self.cache_write_tokens
+
+    def cost(self) -> float:
+        """USD cost of the recorded calls with prompt caching as billed."""
+        billed_input = (self.uncached_input_tokens + self.cache_write_tokens * CACHE_WRITE_MULTIPLIER
+                        + self.cache_read_tokens * CACHE_READ_MULTIPLIER)
+        return (billed_input * INPUT_PRICE_PER_MTOK + self.output_tokens * OUTPUT_PRICE_PER_MTOK) / 1e6
+
+    def uncached_cost(self) -> float:
+        """USD cost of the same calls if every input token had been billed at the base price."""
+        return (self.input_tokens * INPUT_PRICE_PER_MTOK + self.output_tokens * OUTPUT_PRICE_PER_MTOK) / 1e6
+
+    def add(self, other: "CacheUsage"):
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **{f.name: getattr(self, f.name) for f in fields(self)},
+            "latency_seconds": round(self.latency_seconds, 3),
+            "cache_hit_ratio": round(self.cache_read_tokens / self.input_tokens, 4) if self.input_tokens else 0.0,
+            "cost_usd": round(self.cost(), 6),
+            "savings_usd": round(self.uncached_cost() - self.cost(), 6),
+        }
+
+
+def usage_from_message(message: Any) -> Optional[CacheUsage]:
+    """Token usage of one chat model response, from LangChain's `usage_metadata`."""
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return None
+    details = usage.get("input_token_details") or {}
+    cache_write = details.get("cache_creation") or 0
+    if not cache_write:  # newer responses split writes by cache TTL
+        cache_write = sum(details.get(key) or 0 for key in ("ephemeral_5m_input_tokens", "ephemeral_1h_input_tokens"))
+    return CacheUsage(
+        calls=1,
+        input_tokens=usage.get("input_tokens", 0),
+        cache_read_tokens=details.get("cache_read") or 0,
+        cache_write_tokens=cache_write,
+        output_tokens=usage.get("output_tokens", 0),
+    )
+
+
+class PromptCacheUsage(BaseCallbackHandler):
+    """Callback handler recording token usage, cache reads/writes and latency per LangGraph node.
+
+    Attach it to the chat model (`callbacks=[get_prompt_cache_usage()]`); the node comes from the
+    `langgraph_node` run metadata, "unknown" outside a graph.
+    """
+
+    run_inline = True
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._runs: Dict[UUID, Tuple[str, float]] = {}
+        self.nodes: Dict[str, CacheUsage] = {}
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *, run_id: UUID,
+                            metadata: Optional[Dict[str, Any]] = None, **kwargs: Any):
+        with self._lock:
+            self._runs[run_id] = ((metadata or {}).get("langgraph_node", "unknown"), self.clock())
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        with self._lock:
+            node, started = self._runs.pop(run_id, ("unknown", self.clock()))
+            usage = CacheUsage()
+            for generations in response.generations:
+                for generation in generations:
+                    recorded = usage_from_message(getattr(generation, "message", None))
+                    if recorded is not None:
+                        usage.add(recorded)
+            usage.calls = 1
+            usage.latency_seconds = self.clock() - started
+            self.nodes.setdefault(node, CacheUsage()).add(usage)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def total(self) -> CacheUsage:
+        total = CacheUsage()
+        for usage in self.nodes.values():
+            total.add(usage)
+        return total
+
+    def metrics(self) -> Dict[str, Any]:
+        return {node: usage.to_dict() for node, usage in sorted(self.nodes.items())}
+
+    def reset(self):
+        with self._lock:
+            self.nodes = {}
+
+
+# Global prompt cache usage instance
+_prompt_cache_usage: Optional[PromptCacheUsage] = None
+
+
+def get_prompt_cache_usage() -> PromptCacheUsage:
+    """Get or create the process-wide per-node usage recorder."""
+    global _prompt_cache_usage
+
+    if _prompt_cache_usage is None:
+        _prompt_cache_usage = PromptCacheUsage()
+
+    return _prompt_cache_usage
@@ -0,0 +1,24 @@
+"""
+Run sync - Call a coroutine from synchronous code, whether or not the thread has a running event loop.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Coroutine, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+
+def run_sync(coroutine: Coroutine[object, object, T]) -> T:
+    """`asyncio.run(coroutine)`, or the same on a dedicated thread when this thread's loop is running.
+
+    Sync tool entry points (`_run`) are also called from inside async code, e.g. LangChain's
+    sync `invoke` in a notebook or a sync callback on the server loop, where `asyncio.run` raises.
+    The calling thread blocks until the coroutine finishes either way.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="run-sync") as executor:
+        return executor.submit(asyncio.run, coroutine).result()
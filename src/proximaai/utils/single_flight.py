@@ -0,0 +1,45 @@
+"""
+Single-flight - Coalesce concurrent calls for the same key into one in-flight coroutine.
+"""
+
+from typing import Any, Awaitable, Callable
+import asyncio
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers for that key await the same result.
+
+    Results are not retained once the call finishes; pair with a cache for that.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Future] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> tuple[Any, bool]:
+        """Run `fn` for `key`, or join the call already running. Returns (result, shared)."""
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+            # Shielded so one cancelled waiter does not cancel the call for everyone else
+            return await asyncio.shield(call), True
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody else awaited is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            del self._calls[key]
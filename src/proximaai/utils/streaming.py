@@ -0,0 +1,104 @@
+"""
+Structured-output streaming - Stream one string field of a tool-call structured response as it is generated.
+
+Structured output arrives as the JSON arguments of a forced tool call, a few characters per
+chunk. Re-parsing the accumulated partial JSON on every chunk is quadratic in the output length,
+so the field of interest is decoded incrementally instead, and the complete arguments are
+validated against the schema once at the end (keeping every other field, e.g. `reasoning`).
+"""
+
+from typing import Callable, List, Optional, Type, TypeVar
+import json
+import re
+
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from pydantic import BaseModel
+
+Schema = TypeVar("Schema", bound=BaseModel)
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class JsonStringFieldStream:
+    """Incrementally decodes the string value of `field` from JSON text fed in arbitrary fragments."""
+
+    def __init__(self, field: str):
+        self._key = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._in_value = False
+        self.done = False
+
+    def feed(self, fragment: str) -> str:
+        """Add the next fragment of JSON text; returns newly decoded characters of the field's value."""
+        if self.done:
+            return ""
+        self._buffer += fragment
+        if not self._in_value:
+            match = self._key.search(self._buffer)
+            if match is None:
+                return ""
+            self._in_value = True
+            self._buffer = self._buffer[match.end():]
+
+        buffer, position, decoded = self._buffer, 0, []
+        while True:
+            match = _STRING_SPECIAL.search(buffer, position)
+            if match is None:
+                decoded.append(buffer[position:])
+                position = len(buffer)
+                break
+            start = match.start()
+            decoded.append(buffer[position:start])
+            if buffer[start] == '"':  # closing quote
+                self.done = True
+                position = len(buffer)
+                break
+            length = self._escape_length(buffer, start)
+            if length is None:  # escape split across fragments: wait for the rest
+                position = start
+                break
+            decoded.append(json.loads('"' + buffer[start:start + length] + '"'))
+            position = start + length
+        self._buffer = buffer[position:]
+        return "".join(decoded)
+
+    @staticmethod
+    def _escape_length(buffer: str, start: int) -> Optional[int]:
+        if start + 1 >= len(buffer):
+            return None
+        if buffer[start + 1] != "u":
+            return 2
+        if start + 6 > len(buffer):
+            return None
+        if 0xD800 <= int(buffer[start + 2:start + 6], 16) <= 0xDBFF:  # high surrogate, decode with its pair
+            return 12 if start + 12 <= len(buffer) else None
+        return 6
+
+
+async def astream_structured(
+    model: BaseChatModel,
+    schema: Type[Schema],
+    messages: LanguageModelInput,
+    field: str,
+    on_token: Callable[[str], None]
+) -> Schema:
+    """Structured output through a forced tool call, passing `field`'s text to `on_token` as it streams.
+
+    Returns the validated schema instance built from the complete tool-call arguments.
+    """
+    llm = model.bind_tools([schema], tool_choice="any")
+    stream = JsonStringFieldStream(field)
+    fragments: List[str] = []
+    tool_index = None
+    async for chunk in llm.astream(messages):
+        for tool_chunk in getattr(chunk, "tool_call_chunks", None) or []:
+            if tool_index is None:
+                tool_index = tool_chunk.get("index")
+            elif tool_chunk.get("index") != tool_index:
+                continue  # only the first tool call carries the structured output
+            args = tool_chunk.get("args") or ""
+            fragments.append(args)
+            text = stream.feed(args)
+            if text:
+                on_token(text)
+    return schema.model_validate_json("".join(fragments))
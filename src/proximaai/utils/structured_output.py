@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Annotated, Optional
-from typing_extensions import TypedDict
+from typing_extensions import TypedDict, NotRequired
 import operator
 
 # Pydantic models for structured output
@@ -17,9 +17,17 @@ class ReasoningPlan(BaseModel):
     plan: List[AgentPlan] = Field(description="List of steps in the execution plan")
 
 
+class BlobRef(TypedDict):
+    digest: str
+    size: int
+    mime: str
+
 class ResumeParseStructure(TypedDict):
-    file_data: str
+    # Raw base64 payload, only accepted on input; resume_parse moves it to the blob store
+    file_data: NotRequired[str]
     file_name: str
+    # Content-addressed reference to the uploaded file (see proximaai.data.blob_store)
+    blob: NotRequired[BlobRef]
 
 # State definition for the orchestrator
 class OrchestratorState(TypedDict):
@@ -54,6 +62,10 @@ def merge_dictionaries(current_dict: Dict[str, Any], new_dict: Dict[str, Any]) -
     return {**current_dict, **new_dict}  # Use dictionary unpacking to merge
 
 
+class CompanyExtraction(BaseModel):
+    company: str = Field(default="", description="Name of the company the user is applying to, empty if not stated")
+    role: str = Field(default="", description="Job title the user is targeting, empty if not stated")
+
 class WebSearchResults(TypedDict):
     company: str
     agent_response: str
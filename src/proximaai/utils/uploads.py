@@ -0,0 +1,139 @@
+"""
+Upload helpers - Stream base64 uploads into spooled temporary files with size limits.
+"""
+
+from tempfile import SpooledTemporaryFile
+from typing import IO, Optional
+import base64
+import hashlib
+import io
+import os
+import re
+
+import aiofiles
+
+# Decoded uploads larger than this are rejected before any decoding happens
+MAX_UPLOAD_BYTES = int(float(os.getenv("MAX_UPLOAD_MB", "25")) * 1024 * 1024)
+# Spooled uploads stay in memory up to this size, then roll over to disk
+SPOOL_MAX_BYTES = int(float(os.getenv("UPLOAD_SPOOL_MB", "5")) * 1024 * 1024)
+# Base64 characters decoded per step (multiple of 4)
+DECODE_CHUNK_CHARS = 256 * 1024
+
+_WHITESPACE = re.compile(r"\s+")
+_WHITESPACE_CHARS = ("\n", "\r", " ", "\t")
+
+
+class UploadTooLarge(ValueError):
+    """Raised when an upload exceeds the configured maximum size."""
+
+
+class SpooledUpload(io.BufferedIOBase):
+    """Read-only binary file handle over a SpooledTemporaryFile.
+
+    Parsers that only accept `BufferedIOBase` handles (e.g. LlamaParse) can consume the upload
+    without it being copied into a `bytes` object.
+    """
+
+    def __init__(self, spool: IO[bytes], size: int, digest: str):
+        super().__init__()
+        self._spool = spool
+        self.size = size
+        self.digest = digest
+
+    @property
+    def rolled_to_disk(self) -> bool:
+        return bool(getattr(self._spool, "_rolled", False))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._spool.read(-1 if size is None else size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer) -> int:
+        data = self._spool.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._spool.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._spool.tell()
+
+    def close(self):
+        if not self.closed:
+            self._spool.close()
+        super().close()
+
+
+def decoded_size(file_data: str) -> int:
+    """Upper bound on the decoded size of a base64 string, computed without decoding."""
+    return (len(file_data) * 3) // 4
+
+
+def spool_base64(
+    file_data: str,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    spool_max_bytes: int = SPOOL_MAX_BYTES,
+    chunk_chars: int = DECODE_CHUNK_CHARS
+) -> SpooledUpload:
+    """
+    Decode a base64 string chunk by chunk into a SpooledTemporaryFile, hashing as it goes.
+
+    Args:
+        file_data (str): Base64-encoded document.
+        max_bytes (int): Maximum decoded size; checked before decoding starts.
+        spool_max_bytes (int): In-memory size before the spool rolls over to disk.
+        chunk_chars (int): Base64 characters decoded per step.
+
+    Returns:
+        SpooledUpload: A file handle positioned at the start of the decoded document.
+    """
+    if decoded_size(file_data) > max_bytes + 2:
+        raise UploadTooLarge(f"Upload exceeds the {max_bytes // (1024 * 1024)} MB limit")
+
+    chunk_chars -= chunk_chars % 4
+    spool = SpooledTemporaryFile(max_size=spool_max_bytes, mode="w+b")
+    sha256 = hashlib.sha256()
+    size = 0
+    carry = ""
+    try:
+        for start in range(0, len(file_data), chunk_chars):
+            piece = carry + file_data[start:start + chunk_chars]
+            # Substring checks are much cheaper than a regex scan on the common unwrapped payload
+            if any(ws in piece for ws in _WHITESPACE_CHARS):
+                piece = _WHITESPACE.sub("", piece)
+            usable = len(piece) - len(piece) % 4
+            carry = piece[usable:]
+            decoded = base64.b64decode(piece[:usable])
+            sha256.update(decoded)
+            spool.write(decoded)
+            size += len(decoded)
+        if carry:
+            raise ValueError("Invalid base64 payload: incorrect padding")
+        if size > max_bytes:
+            raise UploadTooLarge(f"Upload exceeds the {max_bytes // (1024 * 1024)} MB limit")
+    except BaseException:
+        spool.close()
+        raise
+
+    spool.seek(0)
+    return SpooledUpload(spool, size=size, digest=sha256.hexdigest())
+
+
+async def file_digest(file_path: str | os.PathLike, max_bytes: int = MAX_UPLOAD_BYTES, chunk_size: int = 1024 * 1024) -> str:
+    """SHA-256 of a file, read in chunks without loading it into memory."""
+    if os.path.getsize(file_path) > max_bytes:
+        raise UploadTooLarge(f"Upload exceeds the {max_bytes // (1024 * 1024)} MB limit")
+    sha256 = hashlib.sha256()
+    async with aiofiles.open(file_path, "rb") as f:
+        while chunk := await f.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
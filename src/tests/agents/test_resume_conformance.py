@@ -0,0 +1,73 @@
+"""
+Tests for the resume template conformance checker and the LLM format-pass skip.
+"""
+
+import asyncio
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from proximaai.agents.constructor import TextConstructorAgent
+from proximaai.prebuilt.resume_conformance import get_resume_conformance
+
+CONFORMING_WITH_TRIVIAL_ISSUES = """```markdown
+# Jane Doe
+<div class="contact">
+<a href="mailto:jane@example.com">Email</a>
+</div>
+# Summary
+Machine learning engineer.
+## Education
+<table>
+<tr><th>Institution</th><th>Degree</th></tr>
+<tr><td>State University</td><td>BSc Computer Science</td></tr>
+</table>
+## Experience
+#### Acme, New York
+**ML Engineer** <span style="float:right">01/20 - 02/24</span>
+Shipped ranking models.
+- Built feature pipelines
+## Skills & Tools
+<div class="skills-list">
+<span>Python</span><span>PyTorch</span>
+</div>
+## Awards
+- Hackathon winner
+```"""
+
+
+def test_trivial_issues_are_fixed_locally():
+    conformance = get_resume_conformance()
+    result = conformance.normalize(CONFORMING_WITH_TRIVIAL_ISSUES)
+    assert result.fixes == ["code_fence", "heading_level", "blank_line", "separator", "style"]
+    assert conformance.divergences_of(result.markdown) == []
+
+    markdown = result.markdown
+    assert markdown.startswith("<style>") and "```" not in markdown
+    assert "---\n\n## Summary\n\nMachine learning engineer." in markdown
+    assert "### Acme, New York\n\n**ML Engineer**" in markdown
+    assert "Shipped ranking models.\n\n- Built feature pipelines" in markdown
+    assert conformance.normalize(markdown).markdown == markdown and conformance.normalize(markdown).fixes == []
+
+
+def test_structural_divergences_need_the_llm():
+    conformance = get_resume_conformance()
+    plain = "# Jane Doe\n\njane@example.com\n\n## Skills\n\n- Python\n\n## Experience\n\n- Acme: built models\n\n## Education\n\n- BSc"
+    assert conformance.check(plain).divergences == ["contact", "section_order", "layout:experience", "layout:education"]
+    assert conformance.check("Just some text").divergences == ["name_heading", "sections"]
+
+
+def test_format_skips_the_llm_for_conforming_markdown():
+    conformance = get_resume_conformance()
+    before = conformance.metrics()
+    model = FakeListChatModel(responses=[])  # any model call would fail
+    streamed = []
+
+    result = asyncio.run(TextConstructorAgent(model=model).ainvoke(
+        method="format", markdown_like=CONFORMING_WITH_TRIVIAL_ISSUES, on_token=streamed.append))
+    assert result["current_step"] == "format_resume_with_template_skipped"
+    assert streamed == [result["formatted_resume_markdown"]]
+    assert result["formatted_resume_markdown"] == conformance.normalize(CONFORMING_WITH_TRIVIAL_ISSUES).markdown
+
+    after = conformance.metrics()
+    assert (after["checked"] - before["checked"], after["llm_skipped"] - before["llm_skipped"]) == (1, 1)
+    assert 0 < after["skip_rate"] <= 1
@@ -0,0 +1,157 @@
+"""
+Micro-benchmarks for the regex-driven analyzers: the compiled pattern tables against the previous
+per-pattern `re.findall`/`re.search` loops, on a realistic job posting and resume.
+
+Each benchmark checks the two implementations agree, then reports microseconds per call:
+    uv run pytest src/tests/benchmarks -s
+Set ANALYZER_BENCH_ITERATIONS for steadier numbers (default 50).
+"""
+
+import os
+import re
+import timeit
+
+import pytest
+
+from proximaai.tools.job_search import JobAnalyzerTool
+from proximaai.tools.resume_tools import ResumeParserTool
+
+ITERATIONS = int(os.getenv("ANALYZER_BENCH_ITERATIONS", "50"))
+
+JOB_POSTING = "\n".join([
+    "Senior Data Engineer - Acme Insurance",
+    "About us: we are a remote-friendly team building claims and pricing platforms.",
+    "Requirements: 5+ years of Python and SQL. Must have: experience with Airflow or Dagster.",
+    "Required: strong communication skills. Qualifications: BS in Computer Science or equivalent.",
+    "Preferred: Spark, Kafka. Nice to have: Terraform. Bonus: insurance domain knowledge.",
+    "Experience with dbt is a plus: we use it daily.",
+    "Compensation: $150,000 - $185,000 plus equity. Benefits include dental, vision and 401k.",
+] * 8)
+
+RESUME = "\n".join([
+    "Jane Doe",
+    "Senior engineer with a decade of platform experience.",
+    "Summary",
+    "Builder of reliable data systems.",
+    "Work History",
+    "Acme Corp, 2016 - 2024",
+    "Increased pipeline throughput by 40% through batching",
+    "Led a team of 6 engineers across two time zones",
+    "Reduced cloud spend by 25% by rightsizing clusters",
+    "Managed a budget of $2M for the data platform",
+    "Education",
+    "BS Computer Science, State University, 2012",
+    "Technical Skills",
+    "Python, SQL, Kubernetes, Terraform",
+] * 6)
+
+SECTION_PATTERNS = {
+    "experience": r"(?i)(experience|work history|employment)",
+    "education": r"(?i)(education|academic|degree)",
+    "skills": r"(?i)(skills|technical skills|competencies)",
+    "summary": r"(?i)(summary|objective|profile)"
+}
+
+
+def legacy_findall(patterns, text):
+    matches = []
+    for pattern in patterns:
+        matches.extend(re.findall(pattern, text, re.IGNORECASE))
+    return [match.strip() for match in matches if match.strip()]
+
+
+def legacy_requirements(text):
+    return legacy_findall([
+        r'requirements?[:\s]+([^.\n]+)', r'must have[:\s]+([^.\n]+)',
+        r'required[:\s]+([^.\n]+)', r'qualifications?[:\s]+([^.\n]+)'
+    ], text)
+
+
+def legacy_preferred(text):
+    return legacy_findall([
+        r'preferred[:\s]+([^.\n]+)', r'nice to have[:\s]+([^.\n]+)',
+        r'bonus[:\s]+([^.\n]+)', r'plus[:\s]+([^.\n]+)'
+    ], text)
+
+
+def legacy_salary_range(text):
+    for pattern in [r'\$[\d,]+[\s-]+\$[\d,]+', r'\$[\d,]+k[\s-]+\$[\d,]+k',
+                    r'salary[:\s]+([^.\n]+)', r'compensation[:\s]+([^.\n]+)']:
+        matches = re.findall(pattern, text, re.IGNORECASE)
+        if matches:
+            return matches[0]
+    return None
+
+
+def legacy_section_types(text):
+    types = []
+    for line in text.split('\n'):
+        line = line.strip()
+        for section_name, pattern in SECTION_PATTERNS.items():
+            if line and re.search(pattern, line, re.IGNORECASE):
+                types.append(section_name)
+                break
+    return types
+
+
+def legacy_achievements(sections):
+    achievements = []
+    for section in sections:
+        for pattern in [r'increased.*by.*%', r'reduced.*by.*%', r'led.*team.*of',
+                        r'managed.*budget.*of', r'achieved.*goal', r'improved.*efficiency']:
+            achievements.extend(re.findall(pattern, section.content, re.IGNORECASE))
+    return achievements
+
+
+def report(name, legacy, compiled):
+    legacy_us = timeit.timeit(legacy, number=ITERATIONS) / ITERATIONS * 1e6
+    compiled_us = timeit.timeit(compiled, number=ITERATIONS) / ITERATIONS * 1e6
+    print(f"\n{name:<24} legacy {legacy_us:8.1f}us  compiled {compiled_us:8.1f}us  ({legacy_us / compiled_us:4.1f}x)")
+
+
+@pytest.fixture(scope="module")
+def job_tool():
+    return JobAnalyzerTool()
+
+
+@pytest.fixture(scope="module")
+def resume_tool():
+    return ResumeParserTool()
+
+
+def test_bench_requirements(job_tool):
+    assert sorted(job_tool._extract_requirements(JOB_POSTING)) == sorted(legacy_requirements(JOB_POSTING))
+    report("_extract_requirements", lambda: legacy_requirements(JOB_POSTING),
+           lambda: job_tool._extract_requirements(JOB_POSTING))
+
+
+def test_bench_preferred_skills(job_tool):
+    assert sorted(job_tool._extract_preferred_skills(JOB_POSTING)) == sorted(legacy_preferred(JOB_POSTING))
+    report("_extract_preferred_skills", lambda: legacy_preferred(JOB_POSTING),
+           lambda: job_tool._extract_preferred_skills(JOB_POSTING))
+
+
+def test_bench_salary_info(job_tool):
+    keywords = {"benefits": [], "equity": [], "bonus": []}
+    assert job_tool._extract_salary_info(JOB_POSTING, keywords)["salary_range"] == legacy_salary_range(JOB_POSTING)
+    report("_extract_salary_info", lambda: legacy_salary_range(JOB_POSTING),
+           lambda: job_tool._extract_salary_info(JOB_POSTING, keywords))
+
+    # Worst case for the legacy loop: no dollar range, so every pattern scans the whole posting
+    no_range = JOB_POSTING.replace("$", "USD ")
+    assert job_tool._extract_salary_info(no_range, keywords)["salary_range"] == legacy_salary_range(no_range)
+    report("_extract_salary_info*", lambda: legacy_salary_range(no_range),
+           lambda: job_tool._extract_salary_info(no_range, keywords))
+
+
+def test_bench_sections(resume_tool):
+    sections = resume_tool._extract_sections(RESUME)
+    assert [s.section_type for s in sections if s.section_type != "general"] == legacy_section_types(RESUME)
+    report("_extract_sections", lambda: legacy_section_types(RESUME), lambda: resume_tool._extract_sections(RESUME))
+
+
+def test_bench_achievements(resume_tool):
+    sections = resume_tool._extract_sections(RESUME)
+    assert resume_tool._extract_achievements(sections) == legacy_achievements(sections)[:5]
+    report("_extract_achievements", lambda: legacy_achievements(sections)[:5],
+           lambda: resume_tool._extract_achievements(sections))
@@ -0,0 +1,86 @@
+"""
+Tests for the durable application store and ApplicationTrackerTool on top of it.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from proximaai.data.application_store import SQLiteApplicationStore, new_application_id
+from proximaai.tools.job_search import ApplicationTrackerTool
+
+
+def application(job_id, status="applied", follow_up_date=None):
+    return {"job_id": job_id, "company": "Acme", "position": "Actuary", "applied_date": "2025-03-01",
+            "status": status, "follow_up_date": follow_up_date, "notes": ""}
+
+
+def test_ids_are_unique_and_time_ordered():
+    ids = [new_application_id() for _ in range(1000)]
+    assert len(set(ids)) == 1000
+    timestamps = [job_id[:16] for job_id in ids]
+    assert timestamps == sorted(timestamps)
+
+
+def test_paginates_by_status_and_due_follow_ups(tmp_path):
+    store = SQLiteApplicationStore(tmp_path / "applications.db")
+
+    async def run():
+        ids = [f"job_{i:04d}" for i in range(25)]
+        for i, job_id in enumerate(ids):
+            await store.add("alice", application(job_id, status="interview" if i % 2 else "applied",
+                                                 follow_up_date=f"2025-04-{i + 1:02d}" if i < 20 else None))
+        await store.add("bob", application("job_9999", status="interview"))
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await store.list("alice", status="interview", limit=5, cursor=cursor)
+            seen += [a["job_id"] for a in page]
+            if cursor is None:
+                break
+        assert seen == ids[1::2][::-1]  # newest first, every page in order, other tenants excluded
+        assert await store.count("alice", status="interview") == 12
+
+        due, cursor = await store.list("alice", due_before="2025-04-10", limit=6)
+        rest, last = await store.list("alice", due_before="2025-04-10", limit=6, cursor=cursor)
+        assert [a["follow_up_date"] for a in due + rest] == [f"2025-04-{d:02d}" for d in range(1, 11)] and last is None
+
+        updated = await store.update("alice", "job_0003", status="offer", notes="")
+        assert (updated["status"], updated["notes"]) == ("offer", "")
+        assert [await store.count("alice", status=s) for s in ("interview", "offer", "")] == [11, 1, 25]
+        assert await store.update("bob", "job_0003", status="offer") is None
+        with pytest.raises(ValueError):
+            await store.list("alice", cursor="not a cursor!")
+
+    asyncio.run(run())
+
+
+def test_tracker_tool_persists_across_instances(tmp_path):
+    store = SQLiteApplicationStore(tmp_path / "applications.db")
+    added = json.loads(ApplicationTrackerTool(store=store, user_id="alice")._run(json.dumps(
+        {"action": "add", "company": "Globex", "position": "Data Scientist"})))
+    job_id = added["job_id"]
+
+    restarted = ApplicationTrackerTool(store=SQLiteApplicationStore(tmp_path / "applications.db"), user_id="alice")
+    assert "scheduled" in restarted._run(json.dumps({"action": "follow_up", "job_id": job_id, "follow_up_date": "2025-05-01"}))
+    listing = json.loads(asyncio.run(restarted._arun(json.dumps({"action": "list", "due_before": "2025-05-31"}))))
+    assert listing["total_applications"] == 1 and listing["next_cursor"] is None
+    assert listing["applications"][0]["job_id"] == job_id
+    assert restarted._run(json.dumps({"action": "update", "job_id": "job_missing", "status": "offer"})) == "Error: Application not found"
+    assert json.loads(ApplicationTrackerTool(store=store)._run(json.dumps({"action": "list"})))["total_applications"] == 0
+
+
+def test_tracker_tool_takes_the_user_from_the_run_not_the_input(tmp_path):
+    tool = ApplicationTrackerTool(store=SQLiteApplicationStore(tmp_path / "applications.db"))
+    alice = {"configurable": {"langgraph_auth_user_id": "alice"}}
+
+    async def run():
+        await tool.ainvoke(json.dumps({"action": "add", "company": "Globex", "position": "Data Scientist"}), config=alice)
+        spoofed = await tool.ainvoke(json.dumps({"action": "list", "user_id": "alice"}))
+        own = await tool.ainvoke(json.dumps({"action": "list", "user_id": "bob"}), config=alice)
+        return json.loads(spoofed), json.loads(own)
+
+    spoofed, own = asyncio.run(run())
+    assert spoofed["total_applications"] == 0 and own["total_applications"] == 1
+    assert tool.invoke(json.dumps({"action": "list"}), config=alice).count("Globex") == 1
@@ -0,0 +1,98 @@
+"""
+Tests for the content-addressed blob store and the upload route.
+"""
+
+import asyncio
+import hashlib
+import io
+
+import pytest
+from starlette.testclient import TestClient
+
+from proximaai.data import blob_store as blob_store_module
+from proximaai.data.blob_store import BlobNotFound, FileSystemBlobStore, InvalidDigest
+
+
+def test_filesystem_blob_store_roundtrip(tmp_path):
+    payload = b"%PDF-1.7\n" + b"resume" * 1000
+    digest = hashlib.sha256(payload).hexdigest()
+
+    async def run():
+        store = FileSystemBlobStore(tmp_path)
+        ref = await store.put(io.BytesIO(payload))
+        again = await store.put(payload)
+        assert ref == again == {"digest": digest, "size": len(payload), "mime": "application/pdf"}
+        assert await store.exists(digest)
+        assert await store.get(digest) == payload
+        with pytest.raises(BlobNotFound):
+            await store.get("0" * 64)
+
+    asyncio.run(run())
+    assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+
+def test_upload_route_returns_blob_ref(tmp_path, monkeypatch):
+    from proximaai.mcp import server
+
+    async def fake_is_valid_key(auth_header):
+        return auth_header == "Bearer good", "user-1"
+
+    monkeypatch.setattr(server, "is_valid_key", fake_is_valid_key)
+    monkeypatch.setattr(blob_store_module, "_blob_store", FileSystemBlobStore(tmp_path))
+
+    client = TestClient(server.app)
+    payload = b"%PDF-1.7 resume"
+    response = client.post("/blobs?file_name=resume.pdf", content=payload,
+                           headers={"x-api-key": "Bearer good", "content-type": "application/octet-stream"})
+    assert response.status_code == 201
+    assert response.json() == {"digest": hashlib.sha256(payload).hexdigest(), "size": len(payload), "mime": "application/pdf"}
+
+    assert client.post("/blobs", content=payload, headers={"x-api-key": "Bearer bad"}).status_code == 401
+
+
+def test_digests_are_validated_before_touching_storage(tmp_path):
+    async def run():
+        store = FileSystemBlobStore(tmp_path / "blobs")
+        for digest in ("/etc/hostname", "../" * 3 + "etc/hostname", "A" * 64, "0" * 64 + "\n", None):
+            with pytest.raises(InvalidDigest):
+                await store.get(digest)
+            with pytest.raises(InvalidDigest):
+                await store.size(digest)
+
+    asyncio.run(run())
+
+
+def test_owner_scoped_reads_only_see_the_owners_uploads(tmp_path):
+    payload = b"%PDF-1.7 private resume"
+
+    async def run():
+        store = FileSystemBlobStore(tmp_path)
+        ref = await store.put(payload, owner="user-1")
+        assert await store.get(ref["digest"], owner="user-1") == payload
+        assert await store.size(ref["digest"], owner="user-1") == len(payload)
+        assert not await store.exists(ref["digest"], owner="user-2")
+        with pytest.raises(BlobNotFound):
+            await store.get(ref["digest"], owner="user-2")
+        await store.put(payload, owner="user-2")  # same content uploaded by another user: stored once
+        assert await store.get(ref["digest"], owner="user-2") == payload
+
+    asyncio.run(run())
+    assert len([p for p in tmp_path.rglob("*") if p.is_file() and "owners" not in p.parts]) == 1
+
+
+def test_resume_parse_rejects_unusable_blob_refs(tmp_path):
+    from proximaai.orchestrator.main_agent import valid_blob_ref
+
+    payload = b"%PDF-1.7 resume"
+
+    async def run():
+        store = FileSystemBlobStore(tmp_path)
+        ref = await store.put(payload, owner="user-1")
+        assert await valid_blob_ref(store, ref, "user-1")
+        assert not await valid_blob_ref(store, {**ref, "digest": "/etc/hostname"}, "user-1")
+        assert not await valid_blob_ref(store, {**ref, "size": 1}, "user-1")
+        assert not await valid_blob_ref(store, {**ref, "digest": "0" * 64}, "user-1")
+        assert not await valid_blob_ref(store, ref, "user-2")
+        assert not await valid_blob_ref(store, "not-a-ref", "user-1")
+
+    asyncio.run(run())
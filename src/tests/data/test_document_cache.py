@@ -0,0 +1,50 @@
+"""
+Tests for the content-addressed parsed-document cache.
+"""
+
+import asyncio
+
+from proximaai.data.document_cache import (
+    DiskBackend,
+    DocumentCache,
+    MemoryLRUBackend,
+    content_digest,
+)
+
+
+def test_memory_backend_evicts_by_size():
+    async def run():
+        backend = MemoryLRUBackend(max_bytes=60)
+        cache = DocumentCache(backend)
+        await cache.set("a", ["x" * 20])
+        await cache.set("b", ["y" * 20])
+        assert await cache.get("a") == ["x" * 20]  # refresh "a" so "b" is least recent
+        await cache.set("c", ["z" * 20])
+        assert await cache.get("b") is None
+        assert await cache.get("a") == ["x" * 20]
+        assert backend.evictions == 1
+        return cache.metrics()
+
+    metrics = asyncio.run(run())
+    assert metrics["hits"] == 2 and metrics["misses"] == 1
+    assert metrics["size_bytes"] <= 60
+
+
+def test_disk_backend_persists_and_evicts(tmp_path):
+    digest = content_digest(b"%PDF-1.7 resume")
+
+    async def run():
+        cache = DocumentCache(DiskBackend(tmp_path, max_bytes=1024))
+        await cache.set(digest, ["# Resume"])
+        # A new backend over the same directory sees the entry
+        reopened = DocumentCache(DiskBackend(tmp_path, max_bytes=1024))
+        assert await reopened.get(digest) == ["# Resume"]
+
+        small = DocumentCache(DiskBackend(tmp_path, max_bytes=30))
+        await small.set("other", ["a" * 20])
+        assert await small.get(digest) is None
+        return small.backend.stats()
+
+    stats = asyncio.run(run())
+    assert stats["entries"] == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
@@ -0,0 +1,119 @@
+"""
+Tests for the heap-backed follow-up scheduler, driven by a simulated clock.
+"""
+
+import asyncio
+import json
+
+from proximaai.data.application_store import SQLiteApplicationStore
+from proximaai.data import follow_up_scheduler
+from proximaai.data.follow_up_scheduler import FollowUpScheduler, SimulatedClock, due_at
+from proximaai.tools.job_search import ApplicationTrackerTool
+
+DAY = 86400.0
+START = due_at("2025-03-01")
+
+
+def test_fires_due_follow_ups_in_batches_at_their_time():
+    clock = SimulatedClock(start=START)
+    fired = []
+
+    async def handler(batch):
+        fired.append([(clock.time(), item.job_id) for item in batch])
+
+    async def run():
+        scheduler = FollowUpScheduler(handler, batch_size=2, clock=clock.time, sleep=clock.sleep)
+        scheduler.load([("alice", "2025-02-27", "overdue-1"), ("alice", "2025-02-28", "overdue-2"),
+                        ("bob", "2025-02-28", "overdue-3"), ("alice", "2025-03-03", "later"),
+                        ("bob", "2025-03-05T12:00:00", "cancelled"), ("bob", "not a date", "bad")])
+        scheduler.start()
+        await clock.settle()
+        assert [len(batch) for batch in fired] == [2, 1]  # overdue items fire at once, in batches
+
+        scheduler.cancel("cancelled")
+        await clock.advance(1.9 * DAY)
+        assert len(fired) == 2  # nothing before its due time
+        await clock.advance(0.1 * DAY)
+        assert fired[-1] == [(START + 2 * DAY, "later")]
+
+        scheduler.schedule("carol", "new", "2025-03-10")
+        scheduler.schedule("carol", "new", "2025-03-04")  # rescheduled earlier: the worker wakes up
+        await clock.advance(30 * DAY)
+        assert [job for batch in fired for _, job in batch] == ["overdue-1", "overdue-2", "overdue-3", "later", "new"]
+        assert fired[-1][0][0] == START + 3 * DAY
+        assert scheduler.metrics()["pending"] == 0 and scheduler.stale_skipped == 2
+        await scheduler.stop()
+
+    asyncio.run(run())
+
+
+def test_failed_batches_are_retried():
+    clock = SimulatedClock(start=START)
+    attempts = []
+
+    async def handler(batch):
+        attempts.append(clock.time())
+        if len(attempts) == 1:
+            raise RuntimeError("queue unavailable")
+
+    async def run():
+        scheduler = FollowUpScheduler(handler, retry_seconds=600, clock=clock.time, sleep=clock.sleep)
+        scheduler.schedule("alice", "job-1", "2025-03-01")
+        scheduler.start()
+        await clock.advance(3600)
+        assert attempts == [START, START + 600]
+        assert (scheduler.failures, scheduler.fired) == (1, 1)
+        await scheduler.stop()
+
+    asyncio.run(run())
+
+
+def test_bulk_loads_follow_ups_from_the_store(tmp_path):
+    store = SQLiteApplicationStore(tmp_path / "applications.db")
+
+    async def run():
+        for i in range(25):
+            await store.add(f"user-{i % 3}", {"job_id": f"job_{i:04d}", "company": "Acme", "position": "Actuary",
+                                              "applied_date": "2025-03-01", "status": "applied",
+                                              "follow_up_date": f"2025-04-{i + 1:02d}" if i % 5 else None, "notes": ""})
+        scheduler = FollowUpScheduler(lambda batch: asyncio.sleep(0))
+        assert await scheduler.load_from_store(store, page_size=4) == 20
+        assert scheduler.pop_due(now=due_at("2025-04-01")) == []  # job_0000 has no follow-up
+        assert [item.job_id for item in scheduler.pop_due(now=due_at("2025-04-04"))] == ["job_0001", "job_0002", "job_0003"]
+
+    asyncio.run(run())
+
+
+def test_fired_and_closed_follow_ups_are_not_reloaded(tmp_path, monkeypatch):
+    store = SQLiteApplicationStore(tmp_path / "applications.db")
+    tool = ApplicationTrackerTool(store=store, user_id="alice")
+    clock = SimulatedClock(start=START)
+    fired = []
+
+    async def handler(batch):
+        fired.extend(item.job_id for item in batch)
+
+    async def track(**data):
+        return await tool.ainvoke(json.dumps(data))
+
+    async def run():
+        scheduler = FollowUpScheduler(handler, store=store, clock=clock.time, sleep=clock.sleep)
+        monkeypatch.setattr(follow_up_scheduler, "_follow_up_scheduler", scheduler)
+        job_ids = []
+        for company in ("Acme", "Globex", "Initech"):
+            added = json.loads(await track(action="add", company=company, position="Actuary"))
+            job_ids.append(added["job_id"])
+            assert "scheduled" in await track(action="follow_up", job_id=added["job_id"], follow_up_date="2025-03-02")
+        assert (await track(action="follow_up", job_id=job_ids[0], follow_up_date="next week")).startswith("Error")
+        await track(action="update", job_id=job_ids[1], status="rejected")
+        await track(action="update", job_id=job_ids[2], status="interview")
+        scheduler.start()
+        await clock.advance(2 * DAY)
+        await scheduler.stop()
+        return job_ids
+
+    acme, globex, initech = asyncio.run(run())
+    assert sorted(fired) == sorted([acme, initech])  # the rejected application's follow-up was cancelled
+    assert asyncio.run(store.follow_ups()) == []
+    assert asyncio.run(FollowUpScheduler(handler).load_from_store(store)) == 0
+    assert asyncio.run(store.get("alice", globex))["follow_up_date"] is None
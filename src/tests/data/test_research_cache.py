@@ -0,0 +1,89 @@
+"""
+Tests for the per-company research cache: TTL, stale-while-revalidate and single-flight.
+"""
+
+import asyncio
+
+from langgraph.store.memory import InMemoryStore
+
+from proximaai.data.research_cache import ResearchCache
+from proximaai.utils.company_extraction import CompanyTarget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_fetcher(delay: float = 0.0):
+    calls = []
+
+    async def fetch(target: CompanyTarget):
+        calls.append(target.cache_key)
+        await asyncio.sleep(delay)
+        return {"company": target.company, "agent_response": f"about #{len(calls)}",
+                "tool_response": "mission", "intermediate_steps": {}}
+
+    return fetch, calls
+
+
+def test_concurrent_misses_share_one_fetch():
+    async def run():
+        cache = ResearchCache(store=InMemoryStore(), stale_seconds=3600, ttl_for=lambda r: 60)
+        fetch, calls = make_fetcher(delay=0.05)
+        results = await asyncio.gather(*[
+            cache.get_or_fetch(CompanyTarget("GEICO Corp.", "Analyst"), fetch) if i % 2
+            else cache.get_or_fetch(CompanyTarget("Geico", "analyst"), fetch)
+            for i in range(20)
+        ])
+        return cache, calls, results
+
+    cache, calls, results = asyncio.run(run())
+    assert calls == ["geico"]
+    assert all(result["agent_response"] == "about #1" for result, _ in results)
+    assert cache.metrics()["coalesced"] == 19
+
+
+def test_stale_entry_served_while_refreshing():
+    async def run():
+        clock = FakeClock()
+        cache = ResearchCache(store=InMemoryStore(), stale_seconds=3600, ttl_for=lambda r: 60, clock=clock)
+        fetch, calls = make_fetcher()
+        target = CompanyTarget("Stripe")
+
+        first, served_first = await cache.get_or_fetch(target, fetch)
+        clock.now += 30
+        _, served_fresh = await cache.get_or_fetch(target, fetch)
+        clock.now += 60
+        stale, served_stale = await cache.get_or_fetch(target, fetch)
+        await cache.drain()
+        refreshed, served_refreshed = await cache.get_or_fetch(target, fetch)
+        return (served_first, served_fresh, served_stale, served_refreshed), stale, refreshed, calls
+
+    served, stale, refreshed, calls = asyncio.run(run())
+    assert served == ("miss", "hit", "stale", "hit")
+    assert stale["agent_response"] == "about #1"
+    assert refreshed["agent_response"] == "about #2"
+    assert len(calls) == 2
+
+
+def test_failed_fetch_is_not_cached():
+    async def run():
+        cache = ResearchCache(store=InMemoryStore(), stale_seconds=0, ttl_for=lambda r: 60)
+
+        async def failing(target):
+            raise RuntimeError("perplexity down")
+
+        try:
+            await cache.get_or_fetch(CompanyTarget("Acme"), failing)
+        except RuntimeError:
+            pass
+        fetch, calls = make_fetcher()
+        _, served = await cache.get_or_fetch(CompanyTarget("Acme"), fetch)
+        return served, calls
+
+    served, calls = asyncio.run(run())
+    assert served == "miss" and calls == ["acme"]
@@ -0,0 +1,29 @@
+"""
+Tests for the normalized-query response cache: keys, TTL and LRU eviction.
+"""
+
+from proximaai.data.response_cache import ResponseCache, query_key
+
+
+def test_query_key_normalizes_case_whitespace_and_punctuation():
+    a = query_key([{"role": "user", "content": "What is  Geico's mission?"}], "sonar-pro")
+    b = query_key([{"role": "user", "content": "what is geico's mission"}], "sonar-pro")
+    assert a == b
+    assert a != query_key([{"role": "user", "content": "what is geico's mission"}], "sonar")
+    assert a != query_key([{"role": "system", "content": "what is geico's mission"}], "sonar-pro")
+
+
+def test_ttl_and_lru_eviction():
+    now = [0.0]
+    cache = ResponseCache(("test",), ttl_seconds=10, max_entries=2, clock=lambda: now[0])
+    cache.record_upstream("a", {"answer": "a"}, latency=1.0)
+    cache.record_upstream("b", {"answer": "b"}, latency=1.0)
+    assert cache.get_local("a") == {"answer": "a"}  # "b" is now least recently used
+    cache.record_upstream("c", {"answer": "c"}, latency=1.0)
+    assert cache.get_local("b") is None
+    assert cache.evictions == 1
+
+    now[0] = 11.0
+    assert cache.get_local("a") is None
+    metrics = cache.metrics()
+    assert metrics["hits"] == 1 and metrics["saved_latency_seconds"] == 1.0
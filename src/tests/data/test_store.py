@@ -0,0 +1,44 @@
+"""
+Tests for the shared, pooled store lifecycle.
+"""
+
+import asyncio
+import contextlib
+
+from proximaai.data import store as store_module
+from proximaai.data.store import SharedStore
+
+
+class FakeStore:
+    def __init__(self):
+        self.setup_calls = 0
+
+    async def setup(self):
+        self.setup_calls += 1
+
+
+def test_shared_store_opens_once(monkeypatch):
+    opened = []
+
+    @contextlib.asynccontextmanager
+    async def fake_from_conn_string(conn_string, pool_config=None):
+        fake = FakeStore()
+        opened.append((conn_string, pool_config, fake))
+        yield fake
+
+    monkeypatch.setattr(store_module.AsyncPostgresStore, "from_conn_string", fake_from_conn_string)
+
+    async def run():
+        shared = SharedStore(conn_string="postgresql://bench", pool_config={"min_size": 2, "max_size": 4})
+        stores = await asyncio.gather(*(shared.get() for _ in range(20)))
+        assert len({id(s) for s in stores}) == 1
+        await shared.close()
+        assert not shared.is_open
+
+    asyncio.run(run())
+
+    assert len(opened) == 1
+    conn_string, pool_config, fake = opened[0]
+    assert conn_string == "postgresql://bench"
+    assert pool_config == {"min_size": 2, "max_size": 4}
+    assert fake.setup_calls == 1
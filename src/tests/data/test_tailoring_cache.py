@@ -0,0 +1,98 @@
+"""
+Tests for the DesignerAgent result cache: exact keys, prompt-version invalidation, single-flight
+and the embedding-similarity fallback.
+"""
+
+import asyncio
+import hashlib
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import SystemMessage
+from langgraph.store.memory import InMemoryStore
+
+from proximaai.agents.designer import DesignerAgent
+from proximaai.data.tailoring_cache import TailoringCache, TailoringKey
+
+RESUME = "Jane Doe\nML Engineer, Acme 2020-2024\nPython, PyTorch"
+JOB = "Senior ML Engineer at Geico. 5+ years of Python, deep learning and MLOps experience required."
+
+
+class BagOfWordsEmbeddings(Embeddings):
+    """Hashed word counts: near-identical texts get near-identical vectors."""
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = [0.0] * 64
+        for word in text.lower().split():
+            vector[hashlib.md5(word.encode()).digest()[0] % 64] += 1.0
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+
+def make_tailor(delay: float = 0.0):
+    calls = []
+
+    async def tailor():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return {"tailored_resume_markdown": f"# Jane Doe #{len(calls)}", "tailor_reasoning": []}
+
+    return tailor, calls
+
+
+def test_exact_hits_ignore_whitespace_and_versions_invalidate():
+    async def run():
+        cache = TailoringCache(store=InMemoryStore())
+        tailor, calls = make_tailor()
+        first = await cache.get_or_tailor(TailoringKey.build(RESUME, JOB, "v-a"), tailor)
+        again = await cache.get_or_tailor(TailoringKey.build(RESUME + "\n\n", "  " + JOB.replace(" ", "  "), "v-a"), tailor)
+        new_prompt = await cache.get_or_tailor(TailoringKey.build(RESUME, JOB, "v-b"), tailor)
+        other_job = await cache.get_or_tailor(TailoringKey.build(RESUME, "Data Analyst at Stripe", "v-a"), tailor)
+        return cache, calls, [first, again, new_prompt, other_job]
+
+    cache, calls, served = asyncio.run(run())
+    assert [how for _, how in served] == ["miss", "hit", "miss", "miss"]
+    assert served[1][0] == served[0][0] and len(calls) == 3
+    assert cache.metrics()["hits"] == 1
+
+
+def test_designer_version_tracks_the_system_prompt():
+    model = FakeListChatModel(responses=["unused"])
+    agent = DesignerAgent(query="tailor", model=model)
+    version = agent.version
+    assert DesignerAgent(query="another request", model=model).version == version
+    agent.system_prompt = SystemMessage(content=agent.system_prompt.text + "\n- Keep it to one page.")
+    assert agent.version != version
+
+
+def test_concurrent_identical_runs_share_one_call():
+    async def run():
+        cache = TailoringCache(store=InMemoryStore())
+        tailor, calls = make_tailor(delay=0.05)
+        key = TailoringKey.build(RESUME, JOB, "v-a")
+        served = await asyncio.gather(*[cache.get_or_tailor(key, tailor) for _ in range(5)])
+        return calls, served
+
+    calls, served = asyncio.run(run())
+    assert len(calls) == 1
+    assert sorted(how for _, how in served) == ["miss"] + ["shared"] * 4
+
+
+def test_near_identical_job_descriptions_reuse_tailoring():
+    async def run():
+        cache = TailoringCache(store=InMemoryStore(), embeddings=BagOfWordsEmbeddings(), similarity_threshold=0.9)
+        tailor, calls = make_tailor()
+        await cache.get_or_tailor(TailoringKey.build(RESUME, JOB, "v-a"), tailor)
+        reposted = JOB + " Apply today"
+        similar = await cache.get_or_tailor(TailoringKey.build(RESUME, reposted, "v-a"), tailor)
+        different = await cache.get_or_tailor(TailoringKey.build(RESUME, "Barista wanted, weekend shifts, latte art a plus", "v-a"), tailor)
+        other_resume = await cache.get_or_tailor(TailoringKey.build("John Roe\nAccountant", reposted, "v-a"), tailor)
+        return cache, calls, [similar, different, other_resume]
+
+    cache, calls, served = asyncio.run(run())
+    assert [how for _, how in served] == ["similar", "miss", "miss"]
+    assert served[0][0]["tailored_resume_markdown"] == "# Jane Doe #1"
+    assert len(calls) == 3 and cache.metrics()["similar_hits"] == 1
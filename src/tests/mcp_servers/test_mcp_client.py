@@ -0,0 +1,154 @@
+"""
+Tests for MCP session reuse in MCPCommunication / MCPSessionManager.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from proximaai.mcp.mcp_client import MCPSessionManager
+
+
+def make_server():
+    """Minimal stand-in for a streamable-http MCP server."""
+    state = {"methods": [], "sessions": set(), "counter": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        method = body["method"]
+        state["methods"].append(method)
+        if method == "initialize":
+            state["counter"] += 1
+            session_id = f"session-{state['counter']}"
+            state["sessions"].add(session_id)
+            return httpx.Response(200, headers={"mcp-session-id": session_id}, text="")
+        if request.headers.get("mcp-session-id") not in state["sessions"]:
+            return httpx.Response(404, json={"error": "Session not found"})
+        if method == "notifications/initialized":
+            return httpx.Response(202)
+        event = {"jsonrpc": "2.0", "id": body["id"], "result": {"content": [{"type": "text", "text": "ok"}]}}
+        return httpx.Response(200, text=f"event: message\ndata: {json.dumps(event)}\n\n")
+
+    return state, httpx.MockTransport(handler)
+
+
+def test_session_reused_across_calls():
+    state, transport = make_server()
+
+    async def run():
+        manager = MCPSessionManager(client=httpx.AsyncClient(transport=transport))
+        for _ in range(3):
+            session = manager.get_session("http://mcp.local/parse_document/mcp", jwt="token-a")
+            result = await session.invoke(params={"name": "parse_document", "arguments": {}})
+            assert result["content"][0]["text"] == "ok"
+        assert len(manager) == 1
+
+    asyncio.run(run())
+    assert state["methods"].count("initialize") == 1
+    assert state["methods"].count("tools/call") == 3
+
+
+def test_session_reinitialized_after_404():
+    state, transport = make_server()
+
+    async def run():
+        manager = MCPSessionManager(client=httpx.AsyncClient(transport=transport))
+        session = manager.get_session("http://mcp.local/parse_document/mcp", jwt="token-a")
+        await session.invoke(params={"name": "parse_document", "arguments": {}})
+        state["sessions"].clear()  # server restarted / session terminated
+        result = await session.invoke(params={"name": "parse_document", "arguments": {}})
+        assert result["content"][0]["text"] == "ok"
+        assert session.mcp_server_token == "session-2"
+
+    asyncio.run(run())
+    assert state["methods"].count("initialize") == 2
+
+
+def test_concurrent_calls_on_a_shared_session_use_distinct_ids():
+    in_flight, seen = set(), []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["method"] == "initialize":
+            return httpx.Response(200, headers={"mcp-session-id": "s"})
+        if body["method"] == "notifications/initialized":
+            return httpx.Response(202)
+        if body["id"] in in_flight:  # the server keys response streams by id within a session
+            return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "error": {"message": "duplicate id"}})
+        in_flight.add(body["id"])
+        seen.append(body["id"])
+        await asyncio.sleep(0.05)
+        in_flight.discard(body["id"])
+        text = body["params"]["arguments"]["file_name"]
+        return httpx.Response(200, json={"jsonrpc": "2.0", "id": body["id"], "result": {"content": [{"type": "text", "text": text}]}})
+
+    async def run():
+        manager = MCPSessionManager(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        session = manager.get_session("http://mcp.local/parse_document/mcp", jwt="token-a")
+        await session.ensure_session()
+        return await asyncio.gather(*(
+            session.invoke(params={"name": "parse_document", "arguments": {"file_name": f"resume-{i}.pdf"}})
+            for i in range(5)
+        ))
+
+    results = asyncio.run(run())
+    assert [result["content"][0]["text"] for result in results] == [f"resume-{i}.pdf" for i in range(5)]
+    assert len(set(seen)) == 5
+
+
+def test_sessions_scoped_by_jwt():
+    _, transport = make_server()
+    manager = MCPSessionManager(client=httpx.AsyncClient(transport=transport))
+    url = "http://mcp.local/parse_document/mcp"
+    assert manager.get_session(url, jwt="token-a") is manager.get_session(url, jwt="token-a")
+    assert manager.get_session(url, jwt="token-a") is not manager.get_session(url, jwt="token-b")
+
+
+def test_iter_sse_json_incremental():
+    from proximaai.mcp.mcp_client import iter_sse_json
+
+    async def lines():
+        for line in [
+            "event: message",
+            'data: {"jsonrpc": "2.0", "method": "notifications/progress",',
+            'data:  "params": {"progress": 1}}',
+            "",
+            "data: not-json",
+            "",
+            'data: {"jsonrpc": "2.0", "id": 2, "result": {"ok": true}}',
+            "",
+        ]:
+            yield line
+
+    async def collect():
+        return [event async for event in iter_sse_json(lines())]
+
+    events = asyncio.run(collect())
+    assert events[0]["params"] == {"progress": 1}
+    assert events[1] == {"jsonrpc": "2.0", "id": 2, "result": {"ok": True}}
+    assert len(events) == 2
+
+
+def test_tool_call_stream_stops_at_matching_id():
+    progress = {"jsonrpc": "2.0", "method": "notifications/progress", "params": {"progress": 50}}
+    result = {"jsonrpc": "2.0", "id": 1, "result": {"content": []}}
+    trailing = {"jsonrpc": "2.0", "method": "notifications/message", "params": {}}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if body["method"] == "initialize":
+            return httpx.Response(200, headers={"mcp-session-id": "s"})
+        if body["method"] == "notifications/initialized":
+            return httpx.Response(202)
+        assert body["id"] == result["id"]
+        events = "".join(f"data: {json.dumps(e)}\n\n" for e in (progress, result, trailing))
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, text=events)
+
+    async def run():
+        manager = MCPSessionManager(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        session = manager.get_session("http://mcp.local/parse_document/mcp")
+        return [message async for message in session.tool_call_stream(params={"name": "parse_document"})]
+
+    messages = asyncio.run(run())
+    assert messages == [progress, result]
@@ -0,0 +1,76 @@
+"""
+Tests for the bounded-concurrency LlamaParse job queue.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from proximaai.mcp.llama_parse_server import ParseQueue, ParseQueueFull
+
+
+def test_parse_queue_caps_concurrency_and_rejects_overflow():
+    queue = ParseQueue(max_in_flight=2, max_waiting=2, retry_after=3)
+    peak = 0
+
+    async def job(release: asyncio.Event):
+        nonlocal peak
+        async with queue.slot():
+            peak = max(peak, queue.in_flight)
+            await release.wait()
+
+    async def run():
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(job(release)) for _ in range(4)]
+        await asyncio.sleep(0)
+        assert queue.in_flight == 2 and queue.waiting == 2
+        assert queue.is_full
+
+        with pytest.raises(ParseQueueFull):
+            async with queue.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    metrics = queue.metrics()
+    assert peak == 2
+    assert metrics["completed"] == 4
+    assert metrics["rejected"] == 1
+    assert metrics["in_flight"] == 0 and metrics["queue_depth"] == 0
+
+
+def test_full_queue_is_a_tool_error_not_a_parse_result(monkeypatch):
+    from mcp.server.fastmcp.exceptions import ToolError
+
+    from proximaai.mcp import llama_parse_server
+
+    class Context:
+        async def info(self, message):
+            pass
+
+        async def error(self, message):
+            pass
+
+    class EmptyCache:
+        async def get(self, digest):
+            return None
+
+    monkeypatch.setattr(llama_parse_server.llama_parse_mcp, "get_context", Context)
+    monkeypatch.setattr(llama_parse_server, "get_parser", lambda **kwargs: object())
+    monkeypatch.setattr(llama_parse_server, "document_cache", EmptyCache())
+    monkeypatch.setattr(llama_parse_server, "parse_queue", ParseQueue(max_in_flight=0, max_waiting=0, retry_after=3))
+    spool_threads = []
+    spool_base64 = llama_parse_server.spool_base64
+
+    def recording_spool(file_data):
+        spool_threads.append(threading.current_thread())
+        return spool_base64(file_data)
+
+    monkeypatch.setattr(llama_parse_server, "spool_base64", recording_spool)
+
+    with pytest.raises(ToolError, match="Parse queue is full"):
+        asyncio.run(llama_parse_server.parse_document(Context(), request={"file_data": "JVBERi0xLjc=", "file_name": "resume.pdf"}))
+    assert spool_threads and spool_threads[0] is not threading.main_thread()  # decoded off the event loop
@@ -0,0 +1,101 @@
+"""
+Test doubles for orchestrator runs: a local fake chat model and a graph wired to it.
+"""
+
+from typing import Any, Dict, List
+import asyncio
+import hashlib
+import json
+import os
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.load.dump import dumps
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langgraph.store.memory import InMemoryStore
+
+from proximaai.data import blob_store as blob_store_module
+from proximaai.data.blob_store import FileSystemBlobStore
+from proximaai.orchestrator import main_agent
+
+RESPONSES = {
+    "CompanyExtraction": {"company": "", "role": ""},
+    "TailoredResumeWithReasoning": {
+        "tailored_resume_markdown": "# Jane Doe\n\n## Experience\n\n- Built ML pipelines",
+        "reasoning": [{"section": "Experience", "change": "Emphasized ML", "justification": "Target role is ML."}],
+    },
+    "MarkdownResponse": {"text": "# Jane Doe\n\n## Experience\n\n- Built ML pipelines"},
+}
+
+RESUME_PDF = b"%PDF-1.7 Jane Doe - ML Engineer"
+RESUME_BLOB = {"digest": hashlib.sha256(RESUME_PDF).hexdigest(), "size": len(RESUME_PDF), "mime": "application/pdf"}
+
+
+class FakeChatModel(BaseChatModel):
+    """Answers each structured-output schema with a canned tool call after `latency` seconds.
+
+    Streaming spreads the same latency over `chunk_size`-character pieces of the tool-call
+    arguments. Sync calls fail, so a node still blocking on `model.invoke` shows up in tests.
+    """
+
+    latency: float = 0.2
+    chunk_size: int = 8
+    responses: Dict[str, Dict[str, Any]] = RESPONSES
+    calls: List[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-structured"
+
+    def bind_tools(self, tools, *, tool_choice=None, **kwargs):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], **kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise AssertionError("sync model call inside the async graph")
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, tools=(), **kwargs):
+        await asyncio.sleep(self.latency)
+        name = tools[0]["function"]["name"]
+        self.calls.append(name)
+        message = AIMessage(content="", tool_calls=[{"name": name, "args": self.responses[name], "id": f"call_{len(self.calls)}"}])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _astream(self, messages, stop=None, run_manager=None, tools=(), **kwargs):
+        name = tools[0]["function"]["name"]
+        self.calls.append(name)
+        args = json.dumps(self.responses[name])
+        pieces = [args[i:i + self.chunk_size] for i in range(0, len(args), self.chunk_size)]
+        for i, piece in enumerate(pieces):
+            await asyncio.sleep(self.latency / len(pieces))
+            first = i == 0
+            yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[
+                {"name": name if first else None, "args": piece, "id": f"call_{len(self.calls)}" if first else None, "index": 0}
+            ]))
+
+
+def conversation(user_id: str) -> dict:
+    return {
+        "messages": [{"role": "user", "content": f"Tailor my resume for this machine learning role ({user_id})."}],
+        "file_input": {"file_name": "resume.pdf", "blob": RESUME_BLOB},
+        "user_id": user_id,
+    }
+
+
+async def orchestrator_with_fake_model(monkeypatch, runs: int = 1, **model_fields: Any):
+    blob_store = FileSystemBlobStore(os.environ["BLOB_STORE_DIR"])
+    await blob_store.put(RESUME_PDF)
+    monkeypatch.setattr(blob_store_module, "_blob_store", blob_store)
+
+    store = InMemoryStore()
+    parsed = dumps({"content": [{"type": "text", "text": "Jane Doe - ML Engineer"}]}, ensure_ascii=False)
+    for i in range(runs):  # parsed resumes are cached, so the parsing service is never called
+        await store.aput((f"user-{i}", "resume_parse"), RESUME_BLOB["digest"], {"data": parsed})
+
+    async def get_store():
+        return store
+
+    model = FakeChatModel(**model_fields)
+    monkeypatch.setattr(main_agent, "model", model)
+    monkeypatch.setattr(main_agent, "get_store", get_store)
+    return await main_agent.create_orchestrator_agent(), model
@@ -0,0 +1,39 @@
+"""
+Load test: concurrent orchestrator runs against a local fake chat model.
+
+The fake model answers structured-output calls after a fixed async delay and refuses sync calls,
+so a node that still blocks on `model.invoke` fails the test instead of quietly serializing runs
+on the thread pool.
+"""
+
+import asyncio
+import time
+
+from .fakes import conversation, orchestrator_with_fake_model
+
+
+def test_concurrent_runs_overlap_instead_of_serializing(monkeypatch, tmp_path):
+    monkeypatch.setenv("BLOB_STORE_DIR", str(tmp_path / "blobs"))
+    runs = 50
+
+    async def run():
+        orchestrator, model = await orchestrator_with_fake_model(monkeypatch, runs)
+
+        start = time.perf_counter()
+        single = await orchestrator.ainvoke(conversation("user-0"))
+        single_seconds = time.perf_counter() - start
+        assert "<h2>Experience</h2>" in single["messages"][-1]["content"]
+        assert model.calls == ["CompanyExtraction", "TailoredResumeWithReasoning", "MarkdownResponse"]
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(orchestrator.ainvoke(conversation(f"user-{i}")) for i in range(runs)))
+        concurrent_seconds = time.perf_counter() - start
+        assert model.calls.count("TailoredResumeWithReasoning") == runs  # user-0's repeat run is served from the cache
+        return single_seconds, concurrent_seconds, results
+
+    single_seconds, concurrent_seconds, results = asyncio.run(run())
+    assert all("<h2>Experience</h2>" in result["messages"][-1]["content"] for result in results)
+    print(f"1 run: {single_seconds:.2f}s; {runs} concurrent runs: {concurrent_seconds:.2f}s "
+          f"({runs / concurrent_seconds:.1f} runs/s vs {1 / single_seconds:.1f} runs/s serial)")
+    # 3 sequential 200 ms model calls per run: serialized runs would take 30s
+    assert concurrent_seconds < 5 * single_seconds
@@ -0,0 +1,24 @@
+"""
+Tests for resume_designer on a thread whose messages accumulate across runs.
+"""
+
+import asyncio
+
+from .fakes import conversation, orchestrator_with_fake_model
+
+
+def test_retry_on_the_same_thread_reuses_the_tailored_result(monkeypatch, tmp_path):
+    monkeypatch.setenv("BLOB_STORE_DIR", str(tmp_path / "blobs"))
+
+    async def run():
+        orchestrator, model = await orchestrator_with_fake_model(monkeypatch, latency=0.0)
+        first = await orchestrator.ainvoke(conversation("user-0"))
+        # The retry carries the previous run's messages (request, parsed resume, HTML) ahead of the same request
+        retry = conversation("user-0")
+        retry["messages"] = first["messages"] + retry["messages"]
+        second = await orchestrator.ainvoke(retry)
+        return first, second, model.calls
+
+    first, second, calls = asyncio.run(run())
+    assert calls.count("TailoredResumeWithReasoning") == 1
+    assert second["tailored_resume_markdown"] == first["tailored_resume_markdown"]
@@ -0,0 +1,53 @@
+"""
+Tests for resume_parse input handling: bad uploads, blob references and parse errors end the parse cleanly.
+"""
+
+import asyncio
+
+from proximaai.orchestrator import main_agent
+
+from .fakes import RESUME_BLOB, conversation, orchestrator_with_fake_model
+
+
+def parse_messages(result: dict) -> list:
+    return [message["content"] for message in result["messages"] if message.get("type") == "agent"]
+
+
+def test_invalid_uploads_answer_unable_to_parse(monkeypatch, tmp_path):
+    monkeypatch.setenv("BLOB_STORE_DIR", str(tmp_path / "blobs"))
+
+    async def run():
+        orchestrator, _ = await orchestrator_with_fake_model(monkeypatch)
+        bad_base64 = conversation("user-0")
+        bad_base64["file_input"] = {"file_name": "resume.pdf", "file_data": "JVBERi0xLjc=!"}
+        traversal = conversation("user-0")
+        traversal["file_input"]["blob"] = {"digest": "/etc/hostname", "size": 1, "mime": "application/pdf"}
+        return [await orchestrator.ainvoke(inputs) for inputs in (bad_base64, traversal)]
+
+    for result in asyncio.run(run()):
+        assert parse_messages(result) == ["Unable to Parse Resume"]
+
+
+def test_parse_errors_are_not_cached(monkeypatch, tmp_path):
+    monkeypatch.setenv("BLOB_STORE_DIR", str(tmp_path / "blobs"))
+    calls = []
+
+    class BusyParser:
+        def __init__(self, jwt=None):
+            pass
+
+        async def invoke(self, file_data, file_name):
+            calls.append(file_name)
+            return {"content": [{"type": "text", "text": "Parse queue is full, retry after 3 seconds"}], "isError": True}
+
+    monkeypatch.setattr(main_agent, "ResumeParsingAgent", BusyParser)
+
+    async def run():
+        orchestrator, _ = await orchestrator_with_fake_model(monkeypatch, runs=0)
+        result = await orchestrator.ainvoke(conversation("user-0"))
+        store = await main_agent.get_store()
+        return result, await store.aget(("user-0", "resume_parse"), RESUME_BLOB["digest"])
+
+    result, cached = asyncio.run(run())
+    assert parse_messages(result) == ["Unable to Parse Resume"]
+    assert cached is None and calls == ["resume.pdf"]
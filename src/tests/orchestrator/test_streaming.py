@@ -0,0 +1,38 @@
+"""
+Tests for streaming tailored and formatted markdown out of the graph while it is generated.
+"""
+
+import asyncio
+import time
+
+from .fakes import RESPONSES, conversation, orchestrator_with_fake_model
+
+
+def test_markdown_streams_before_the_nodes_finish(monkeypatch, tmp_path):
+    monkeypatch.setenv("BLOB_STORE_DIR", str(tmp_path / "blobs"))
+
+    async def run():
+        orchestrator, _ = await orchestrator_with_fake_model(monkeypatch, latency=1.0)
+        start = time.perf_counter()
+        deltas, finished, messages = {}, {}, set()
+        async for mode, chunk in orchestrator.astream(conversation("user-0"), stream_mode=["custom", "updates", "messages"]):
+            if mode == "custom":
+                deltas.setdefault(chunk["node"], []).append((time.perf_counter() - start, chunk["delta"]))
+            elif mode == "updates":
+                for node, update in chunk.items():
+                    finished[node] = (time.perf_counter() - start, update)
+            else:
+                messages.add(chunk[1]["langgraph_node"])
+        return deltas, finished, messages
+
+    deltas, finished, messages = asyncio.run(run())
+    designer = RESPONSES["TailoredResumeWithReasoning"]
+    assert "".join(delta for _, delta in deltas["resume_designer"]) == designer["tailored_resume_markdown"]
+    assert "".join(delta for _, delta in deltas["text_constructor_format"]) == RESPONSES["MarkdownResponse"]["text"]
+
+    finished_at, update = finished["resume_designer"]
+    first_delta_at = deltas["resume_designer"][0][0]
+    assert finished_at - first_delta_at > 0.8  # first tokens arrive well before the 1s call completes
+    assert update["tailor_reasoning"] == designer["reasoning"]  # reasoning still comes out structured
+    assert finished["text_constructor_format"][1]["formatted_resume_markdown"] == RESPONSES["MarkdownResponse"]["text"]
+    assert {"resume_designer", "text_constructor_format"} <= messages  # raw tool-call chunks on "messages"
@@ -0,0 +1,43 @@
+"""
+Tests for JobAnalyzerTool.analyze_batch: ordering, compact NDJSON output and resumable checkpoints.
+"""
+
+import json
+
+from proximaai.tools.job_search import JobAnalyzerTool, JobPosting
+
+POSTINGS = [f"Posting {i}. Requirements: Python and SQL. Remote friendly team." for i in range(10)]
+
+
+def test_yields_compact_lines_in_input_order():
+    tool = JobAnalyzerTool()
+    job = JobPosting(
+        title="Engineer", company="Acme", location="Remote", description="Java role, work from home",
+        requirements=[], salary_range=None, job_type="full_time", remote_option=True,
+        application_url="https://acme.example/jobs/1", posted_date="2025-01-01", source="test"
+    )
+    lines = list(tool.analyze_batch(POSTINGS + [{"id": "job-42", "text": "Kubernetes"}, job], max_workers=2, chunk_size=3))
+
+    assert all(line == json.dumps(json.loads(line), separators=(",", ":")) for line in lines)
+    records = [json.loads(line) for line in lines]
+    assert [r["index"] for r in records] == list(range(12))
+    assert [r["id"] for r in records[-2:]] == ["job-42", "https://acme.example/jobs/1"]
+    assert records[0]["analysis"] == json.loads(tool._run(POSTINGS[0]))
+    assert records[-1]["analysis"]["required_skills"] == ["java"]
+
+
+def test_resumes_from_checkpoint(tmp_path):
+    tool = JobAnalyzerTool()
+    checkpoint = str(tmp_path / "batch.checkpoint")
+
+    first_run = []
+    for line in tool.analyze_batch(POSTINGS, checkpoint_path=checkpoint, max_workers=1, chunk_size=4):
+        first_run.append(json.loads(line)["index"])
+        if len(first_run) == 6:
+            break  # crash halfway through the second chunk
+
+    assert json.loads(open(checkpoint).read())["completed"] == 4
+    resumed = [json.loads(line)["index"] for line in tool.analyze_batch(POSTINGS, checkpoint_path=checkpoint, max_workers=1, chunk_size=4)]
+    assert resumed == list(range(4, 10))
+    assert json.loads(open(checkpoint).read())["completed"] == 10
+    assert list(tool.analyze_batch(POSTINGS, checkpoint_path=checkpoint)) == []
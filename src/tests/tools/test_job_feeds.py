@@ -0,0 +1,95 @@
+"""
+Tests for streaming feed ingestion, incremental upserts and near-duplicate repost detection.
+"""
+
+import json
+
+import pytest
+
+from proximaai.tools.job_feeds import ingest_feeds, normalize_posting
+from proximaai.tools.job_index import JobIndex
+from proximaai.tools.near_duplicates import minhash_signature, similarity
+
+DESCRIPTION = ("Build pricing models for personal auto insurance using Python and SQL. Partner with actuaries "
+               "and product managers to ship rate changes, monitor loss ratios and explain model behavior.")
+
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item>
+    <title>Claims Analyst</title><company>Globex</company><location>Remote</location>
+    <description>&lt;p&gt;Review &lt;b&gt;claims&lt;/b&gt; data and build dashboards for adjusters.&lt;/p&gt;</description>
+    <link>https://globex.example/jobs/7</link><guid>7</guid><pubDate>Tue, 04 Mar 2025 10:00:00 GMT</pubDate>
+  </item>
+</channel></rss>
+"""
+
+
+@pytest.fixture
+def feeds(tmp_path):
+    directory = tmp_path / "feeds"
+    directory.mkdir()
+    (directory / "board.jsonl").write_text("\n".join(json.dumps(p) for p in [
+        {"id": "1", "title": "Pricing Actuary", "company": "Acme", "location": "Austin, TX",
+         "description": DESCRIPTION, "posted_date": "2025-03-01T09:30:00Z"},
+        {"id": "2", "title": "Data Engineer", "company": "Acme", "location": "Austin, TX",
+         "description": "Own the claims warehouse and streaming pipelines."},
+        {"id": "3", "title": "No description"},
+    ]) + "\n")
+    (directory / "agency.csv").write_text(
+        "job_title,company_name,location,description,employment_type,skills,remote\n"
+        "Underwriter,Initech,\"New York, NY\",Underwrite small business policies.,Part-time,Excel; SQL,no\n"
+    )
+    (directory / "globex.rss").write_text(RSS)
+    return directory
+
+
+def test_normalizes_each_feed_format(feeds, tmp_path):
+    index = JobIndex(tmp_path / "jobs.db")
+    stats = ingest_feeds(feeds, index)
+    assert (stats.seen, stats.inserted, stats.invalid) == (4, 4, 1)
+
+    underwriter = index.search(title="underwriter")[0]
+    assert underwriter["job_type"] == "part_time" and underwriter["requirements"] == ["Excel", "SQL"]
+    assert underwriter["remote_option"] is False and underwriter["source"] == "agency"
+    claims = index.search(title="claims analyst")[0]
+    assert claims["description"] == "Review claims data and build dashboards for adjusters."
+    assert (claims["posted_date"], claims["remote_option"]) == ("2025-03-04", True)
+    assert index.search(title="pricing actuary")[0]["posted_date"] == "2025-03-01"
+
+
+def test_reingest_writes_only_deltas(feeds, tmp_path):
+    index = JobIndex(tmp_path / "jobs.db")
+    ingest_feeds(feeds, index)
+    stats = ingest_feeds(feeds, index)
+    assert (stats.written, stats.unchanged) == (0, 4)
+
+    feed = feeds / "board.jsonl"
+    feed.write_text(feed.read_text().replace("streaming pipelines", "batch pipelines"))
+    stats = ingest_feeds(feeds, index)
+    assert (stats.updated, stats.unchanged) == (1, 3)
+    assert "batch" in index.search(query="pipelines")[0]["description"]
+
+
+def test_reposts_are_dropped_as_near_duplicates(feeds, tmp_path):
+    index = JobIndex(tmp_path / "jobs.db")
+    ingest_feeds(feeds, index)
+    (feeds / "repost.jsonl").write_text("\n".join(json.dumps(p) for p in [
+        # Same role reposted under a new id with a lightly edited description
+        {"id": "9", "title": "Pricing Actuary", "company": "ACME", "location": "Austin, TX",
+         "description": DESCRIPTION.replace("ship rate changes", "ship new rate changes")},
+        {"id": "10", "title": "Pricing Actuary", "company": "Acme", "location": "Austin, TX", "description": DESCRIPTION},
+        # The same description for another city is a separate posting
+        {"id": "11", "title": "Pricing Actuary", "company": "Acme", "location": "Denver, CO", "description": DESCRIPTION},
+    ]) + "\n")
+    stats = ingest_feeds(feeds, index)
+    assert (stats.near_duplicates, stats.duplicates, stats.inserted) == (1, 1, 1)
+    assert sorted(job["location"] for job in index.search(title="pricing actuary")) == ["Austin, TX", "Denver, CO"]
+
+
+def test_minhash_similarity_tracks_overlap():
+    base = minhash_signature(DESCRIPTION)
+    assert similarity(base, minhash_signature(DESCRIPTION.upper())) == 1.0
+    assert similarity(base, minhash_signature(DESCRIPTION + " Hybrid schedule.")) >= 0.8
+    assert similarity(base, minhash_signature("Own the claims warehouse and streaming pipelines.")) < 0.3
+    assert minhash_signature("  ") is None
+    assert normalize_posting({"Title": "Engineer"}) is None
@@ -0,0 +1,78 @@
+"""
+Tests for the local SQLite JobIndex and JobSearchTool's use of it.
+"""
+
+import json
+
+import pytest
+
+from proximaai.tools.job_index import JobIndex
+from proximaai.tools.job_search import JobPosting, JobSearchTool
+
+POSTINGS = [
+    {"id": "1", "title": "Senior Data Scientist", "company": "Acme Insurance", "location": "Austin, TX",
+     "description": "Pricing models in Python", "job_type": "full_time", "remote_option": False, "posted_date": "2025-03-01"},
+    {"id": "2", "title": "Data Scientist", "company": "Globex", "location": "Remote",
+     "description": "Experimentation platform", "job_type": "full_time", "remote_option": True, "posted_date": "2025-03-05"},
+    {"id": "3", "title": "Data Scientist", "company": "Initech", "location": "Austin, TX",
+     "description": "Claims analytics", "job_type": "contract", "remote_option": True, "posted_date": "2025-02-01"},
+    {"id": "4", "title": "Software Engineer", "company": "Acme Insurance", "location": "New York, NY",
+     "description": "Work with data scientists on Python services", "job_type": "full_time", "remote_option": False,
+     "posted_date": "2025-03-10"},
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    feed = tmp_path / "feed.jsonl"
+    feed.write_text("\n".join(json.dumps(p) for p in POSTINGS) + "\n\nnot json\n")
+    index = JobIndex(tmp_path / "jobs.db")
+    assert index.ingest_jsonl(feed) == 4
+    return index
+
+
+def ids(results):
+    return [r["id"] for r in results]
+
+
+def test_title_search_ranks_by_title_then_recency(index):
+    assert ids(index.search(title="data scientist")) == ["2", "3", "1"]
+    assert ids(index.search(title="data scientist", remote_only=True, job_type="full_time")) == ["2"]
+    assert ids(index.search(title="data scientist", location="austin")) == ["3", "1"]
+    assert ids(index.search(title="data scientist", company="acme")) == ["1"]
+
+
+def test_selective_filter_plan_matches_title_walk(index, monkeypatch):
+    monkeypatch.setattr("proximaai.tools.job_index.SELECTIVE_FILTER_ROWS", 0)  # every filter is broad: walk titles
+    walked = ids(index.search(title="data scientist", location="austin", k=1, offset=1))
+    monkeypatch.setattr("proximaai.tools.job_index.SELECTIVE_FILTER_ROWS", 10**9)  # filter index drives the query
+    assert ids(index.search(title="data scientist", location="austin", k=1, offset=1)) == walked == ["1"]
+
+
+def test_free_text_query_and_paging(index):
+    assert set(ids(index.search(query="python"))) == {"1", "4"}
+    assert ids(index.search(query="python", company="Acme")) == ids(index.search(query="python"))
+    assert ids(index.search(k=2)) == ["4", "2"]
+    assert ids(index.search(k=2, offset=2)) == ["1", "3"]
+    assert ids(index.search(title="data scientist", k=1, offset=1)) == ["3"]
+    assert index.search(location="50%_") == []
+
+
+def test_reingest_updates_in_place(index):
+    index.index_postings([dict(POSTINGS[3], title="Staff Data Scientist")])
+    assert index.count() == 4
+    assert "4" in ids(index.search(title="data scientist"))
+    assert index.search(title="software engineer") == []
+
+
+def test_job_search_tool_uses_index(index):
+    posting = JobPosting(
+        title="Data Scientist", company="Hooli", location="Remote", description="Search ranking",
+        requirements=["SQL"], salary_range=None, job_type="full_time", remote_option=True,
+        application_url="https://hooli.example/jobs/9", posted_date="2025-04-01", source="test"
+    )
+    index.index_postings([posting])
+    tool = JobSearchTool(index=index)
+    jobs = json.loads(tool._run(json.dumps({"job_title": "data scientist", "remote_only": True, "limit": 2})))
+    assert [job["company"] for job in jobs] == ["Hooli", "Globex"]
+    assert jobs[0]["requirements"] == ["SQL"] and jobs[0]["remote_option"] is True
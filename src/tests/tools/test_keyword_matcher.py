@@ -0,0 +1,62 @@
+"""
+Tests for the shared one-pass keyword matcher and the analyzers built on it.
+"""
+
+from proximaai.tools.job_search import JobAnalyzerTool
+from proximaai.tools.keyword_matcher import KeywordMatcher, keyword_matcher
+from proximaai.tools.resume_tools import ResumeOptimizerTool, ResumeParserTool
+
+
+def keywords(text: str) -> list[str]:
+    return [hit.keyword for hit in keyword_matcher.find_all(text)]
+
+
+def test_respects_word_boundaries():
+    assert keywords("JavaScript developer") == ["javascript"]
+    assert keywords("Java and JavaScript") == ["java", "javascript"]
+    assert keywords("We use gitlab and legit tools") == []
+    assert keywords("Git, Python.") == ["git", "python"]
+
+
+def test_reports_offsets_for_every_occurrence():
+    text = "Python first; python   again and Node.js"
+    hits = keyword_matcher.find_all(text)
+    assert [(hit.keyword, text[hit.start:hit.end]) for hit in hits] == [
+        ("python", "Python"), ("python", "python"), ("node.js", "Node.js")
+    ]
+
+
+def test_multi_word_keywords_span_whitespace_and_overlap():
+    text = "Machine\n learning with a learning budget"
+    spans = [(hit.keyword, text[hit.start:hit.end]) for hit in keyword_matcher.find_all(text)]
+    assert ("machine learning", "Machine\n learning") in spans
+    assert spans.count(("learning", "learning")) == 2
+    assert ("learning budget", "learning budget") in spans
+
+
+def test_aliases_map_to_canonical_keywords():
+    hit, = keyword_matcher.find_all("Postgres")
+    assert (hit.keyword, hit.categories) == ("postgresql", ("technical_skills",))
+    assert keyword_matcher.categorize("work from home with stock options")["work_style"] == ["remote"]
+
+
+def test_categorize_keeps_taxonomy_order_without_duplicates():
+    matcher = KeywordMatcher({"a": ["beta", "alpha"], "b": ["alpha"]})
+    assert matcher.categorize("alpha beta alpha") == {"a": ["beta", "alpha"], "b": ["alpha"]}
+
+
+def test_job_analyzer_uses_matcher():
+    analysis = JobAnalyzerTool()._analyze_job_posting(
+        "JavaScript role, remote, stock options, rockstar wanted, work-life balance, dental"
+    )
+    assert analysis["required_skills"] == ["javascript"]
+    assert analysis["company_culture"]["work_style"] == ["remote-friendly"]
+    assert analysis["salary_indicators"]["equity"] is True
+    assert analysis["salary_indicators"]["benefits"] == ["dental"]
+    assert analysis["red_flags"] == ["Contains 'rockstar' - may indicate poor work-life balance"]
+    assert analysis["green_flags"] == ["Promotes 'work-life balance'"]
+
+
+def test_resume_tools_use_matcher():
+    assert ResumeParserTool()._extract_skills("JavaScript, SQL and leadership") == ["javascript", "sql", "leadership"]
+    assert ResumeOptimizerTool()._extract_keywords("nodejs, problem solving") == ["node.js", "problem solving"]
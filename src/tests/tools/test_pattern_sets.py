@@ -0,0 +1,63 @@
+"""
+Tests for PatternSet and the compiled pattern tables in the job and resume analyzers.
+"""
+
+from proximaai.tools.job_search import JobAnalyzerTool
+from proximaai.tools.pattern_sets import PatternSet
+from proximaai.tools.resume_tools import ResumeParserTool, ResumeSection
+
+
+def test_reports_which_category_matched_and_its_value():
+    patterns = PatternSet({"must": r"must have[:\s]+(?P<value>\w+)", "year": r"\b\d{4}\b"})
+    assert list(patterns.finditer("Must have: Python since 2019")) == [("must", "Python"), ("year", "2019")]
+    assert patterns.search("in 2020, must have: SQL") == ("year", "2020")
+    assert patterns.search("nothing here") is None
+
+
+def test_category_alternatives_and_overlapping_values():
+    patterns = PatternSet({
+        "education": ["education", "degree"],
+        "required": r"required[:\s]+(?=(?P<value>[^.\n]+))",
+        "qualifications": r"qualifications?[:\s]+(?=(?P<value>[^.\n]+))",
+    })
+    assert list(patterns.finditer("Degree required: Qualifications: BS")) == [
+        ("education", "Degree"), ("required", "Qualifications: BS"), ("qualifications", "BS")
+    ]
+
+
+def test_first_by_priority_prefers_earlier_alternatives():
+    patterns = PatternSet({"range": r"\$\d+-\$\d+", "salary": r"salary: (?P<value>\w+)"})
+    assert patterns.first_by_priority("Salary: competitive, $100-$150") == ("range", "$100-$150")
+    assert patterns.first_by_priority("Salary: competitive") == ("salary", "competitive")
+
+
+def test_job_analyzer_extracts_in_document_order():
+    tool = JobAnalyzerTool()
+    text = "Must have: Python\nRequirements: SQL\nNice to have: Go. Salary: $120,000 - $150,000"
+    assert tool._extract_requirements(text) == ["Python", "SQL"]
+    assert tool._extract_preferred_skills(text) == ["Go"]
+    assert tool._extract_salary_info(text)["salary_range"] == "$120,000 - $150,000"
+
+
+def test_resume_parser_sections_and_achievements():
+    tool = ResumeParserTool()
+    sections = tool._extract_sections("Jane Doe\nWork History\nAcme 2019-2023\nEducation\nBS Physics")
+    assert [(s.section_type, s.content) for s in sections] == [
+        ("general", "Jane Doe"), ("experience", "Work History\nAcme 2019-2023"), ("education", "Education\nBS Physics")
+    ]
+    achievements = tool._extract_achievements([
+        ResumeSection("experience", "Increased revenue by 20%\nLed a team of 5", 0.8),
+        ResumeSection("summary", "Improved efficiency", 0.8),
+    ])
+    assert achievements == ["Increased revenue by 20%", "Led a team of", "Improved efficiency"]
+
+
+def test_resume_parser_keeps_table_priority_and_overlapping_achievements():
+    tool = ResumeParserTool()
+    # "skills" appears first in the heading, but experience is listed first in the table
+    sections = tool._extract_sections("Skills and Experience\nPython, SQL")
+    assert [s.section_type for s in sections] == ["experience"]
+    achievements = tool._extract_achievements([
+        ResumeSection("experience", "Led a team that increased revenue by 30% of target", 0.8),
+    ])
+    assert achievements == ["increased revenue by 30%", "Led a team that increased revenue by 30% of"]
@@ -0,0 +1,91 @@
+"""
+Tests for the async Perplexity tool: retries with backoff and token-bucket rate limiting.
+"""
+
+import asyncio
+
+import httpx
+
+from proximaai.data.response_cache import ResponseCache
+from proximaai.tools import perplexity_search
+from proximaai.tools.perplexity_search import PerplexityWebSearchTool
+from proximaai.utils.rate_limit import TokenBucket
+
+
+def completion(content: str) -> dict:
+    return {"choices": [{"message": {"content": content}}], "citations": ["https://example.com/about"]}
+
+
+def test_arun_retries_throttled_requests(monkeypatch):
+    monkeypatch.setattr(perplexity_search, "backoff_delay", lambda attempt, retry_after=None: 0)
+    statuses = iter([429, 503, 200])
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = next(statuses)
+        seen.append(status)
+        if status != 200:
+            return httpx.Response(status, headers={"retry-after": "0"})
+        return httpx.Response(200, json=completion("Geico insures cars."))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            tool = PerplexityWebSearchTool(api_key="test", client=client, rate_limiter=TokenBucket(rate=0),
+                                           cache=ResponseCache(("test",)))
+            return await tool._arun("Geico about us")
+
+    result = asyncio.run(run())
+    assert seen == [429, 503, 200]
+    assert result.startswith("Geico insures cars.")
+    assert "[1] https://example.com/about" in result
+
+
+def test_arun_does_not_retry_client_errors():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(401, json={"error": "bad key"})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            tool = PerplexityWebSearchTool(api_key="test", client=client, rate_limiter=TokenBucket(rate=0),
+                                           cache=ResponseCache(("test",)))
+            return await tool._arun("anything")
+
+    assert asyncio.run(run()).startswith("Error calling Perplexity API")
+    assert len(calls) == 1
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0])
+    waits = [bucket.reserve() for _ in range(5)]
+    assert waits == [0.0, 0.0, 0.5, 1.0, 1.5]
+    now[0] = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_identical_queries_share_one_upstream_call():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=completion("Stripe builds payments infrastructure."))
+
+    async def run():
+        cache = ResponseCache(("test",))
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            tool = PerplexityWebSearchTool(api_key="test", client=client, rate_limiter=TokenBucket(rate=0), cache=cache)
+            # Concurrent and later repeats, differing only in case/whitespace/punctuation
+            first = await asyncio.gather(*[tool._arun("Stripe about us?"), tool._arun("stripe  ABOUT us")])
+            later = await tool._arun("  Stripe about us. ")
+            return first + [later], cache.metrics()
+
+    results, metrics = asyncio.run(run())
+    assert len(calls) == 1
+    assert len(set(results)) == 1
+    assert metrics["misses"] == 1 and metrics["coalesced"] == 1 and metrics["hits"] == 1
+    assert metrics["hit_ratio"] == round(2 / 3, 4)
+    assert metrics["saved_latency_seconds"] >= 0.1
@@ -0,0 +1,75 @@
+"""
+Tests for the pluggable search backends: local SQLite FTS5 index and HTTP provider adapter.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from proximaai.tools.search_backends import HTTPSearchBackend, SQLiteSearchBackend
+from proximaai.tools.web_search import CompanyResearchTool, WebSearchTool
+
+
+def test_index_directory_and_bm25_ranking(tmp_path):
+    pages = tmp_path / "crawl"
+    pages.mkdir()
+    (pages / "geico.html").write_text(
+        "<html><head><title>Geico Careers</title><link rel='canonical' href='https://geico.com/careers'>"
+        "<script>var tracking = 'insurance';</script></head>"
+        "<body><p>Join our data science team building insurance pricing models.</p></body></html>"
+    )
+    (pages / "blog.txt").write_text("Insurance industry trends\nA long post mentioning Geico once among many insurers.")
+    (pages / "ignored.bin").write_bytes(b"\x00\x01")
+
+    index = SQLiteSearchBackend(tmp_path / "index.db")
+    assert index.index_directory(pages) == 2
+
+    results = index.search("geico careers insurance")
+    assert results[0]["url"] == "https://geico.com/careers"
+    assert results[0]["source"] == "local_index"
+    # Script contents are not indexed
+    assert index.search("tracking") == []
+    # No page has every term: falls back to any-term matching
+    assert [r["url"] for r in index.search("geico spaceships")][0] == "https://geico.com/careers"
+
+
+def test_reindexing_a_url_replaces_it(tmp_path):
+    index = SQLiteSearchBackend(tmp_path / "index.db")
+    index.index_documents([{"url": "https://a.com", "title": "Old", "body": "legacy mainframe"}])
+    index.index_documents([{"url": "https://a.com", "title": "New", "body": "kubernetes platform"}])
+    assert index.count() == 1
+    assert index.search("mainframe") == []
+    assert index.search("kubernetes")[0]["title"] == "New"
+
+
+def test_web_search_tool_uses_backend(tmp_path):
+    index = SQLiteSearchBackend(tmp_path / "index.db")
+    index.index_documents([{"url": "https://stripe.com/jobs", "title": "Stripe Jobs", "body": "payments engineering roles"}])
+    tool = WebSearchTool(backend=index)
+    assert json.loads(tool._run("payments roles"))[0]["url"] == "https://stripe.com/jobs"
+    assert json.loads(asyncio.run(tool._arun("payments roles")))[0]["title"] == "Stripe Jobs"
+
+
+def test_company_research_uses_the_configured_backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("WEB_SEARCH_BACKEND", "sqlite")
+    monkeypatch.setenv("WEB_SEARCH_INDEX", str(tmp_path / "index.db"))
+    SQLiteSearchBackend(tmp_path / "index.db").index_documents(
+        [{"url": "https://stripe.com/newsroom", "title": "Stripe Newsroom", "body": "Stripe recent news and launches"}])
+    results = json.loads(CompanyResearchTool().invoke({"company_name": "Stripe", "facets": ["news"]}))
+    assert results["Stripe recent news"][0]["url"] == "https://stripe.com/newsroom"
+
+
+def test_http_backend_maps_provider_fields():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["q"] == "geico culture"
+        assert request.headers["X-Subscription-Token"] == "key"
+        return httpx.Response(200, json={"web": {"results": [
+            {"title": "Life at Geico", "url": "https://geico.com/life", "description": "Culture and values"}
+        ]}})
+
+    backend = HTTPSearchBackend("https://search.example/api", api_key="key")
+    backend._client = httpx.Client(transport=httpx.MockTransport(handler))
+    assert backend.search("geico culture", k=3) == [
+        {"title": "Life at Geico", "url": "https://geico.com/life", "snippet": "Culture and values", "source": "web_search"}
+    ]
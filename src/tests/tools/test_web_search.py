@@ -0,0 +1,68 @@
+"""
+Tests for CompanyResearchTool's concurrent facet searches.
+"""
+
+import asyncio
+import json
+import time
+
+from proximaai.tools.web_search import CompanyResearchTool
+
+
+class SlowResearchTool(CompanyResearchTool):
+    """Research tool whose searches sleep, fail or hang depending on the query."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._queries = []
+        self._running = 0
+        self._peak = 0
+
+    async def _aperform_search(self, query: str):
+        self._queries.append(query)
+        self._running += 1
+        self._peak = max(self._peak, self._running)
+        try:
+            if "financial" in query:
+                await asyncio.sleep(10)
+            if "news" in query:
+                raise RuntimeError("search backend unavailable")
+            await asyncio.sleep(0.1)
+            return [{"title": query}]
+        finally:
+            self._running -= 1
+
+
+def test_facets_run_concurrently_with_partial_results():
+    tool = SlowResearchTool(max_concurrency=4, query_timeout=0.3)
+    start = time.perf_counter()
+    results = json.loads(asyncio.run(tool._arun("Geico")))
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.6  # bounded by the timeout, not the sum of the searches
+    assert results["Geico company culture"] == [{"title": "Geico company culture"}]
+    assert results["Geico job opportunities"] == [{"title": "Geico job opportunities"}]
+    assert results["Geico recent news"] == {"error": "search backend unavailable"}
+    assert "timed out" in results["Geico financial performance"]["error"]
+
+
+def test_concurrency_cap_and_facet_selection():
+    tool = SlowResearchTool(max_concurrency=1, query_timeout=1)
+    results = json.loads(tool._run("Geico", facets=["culture", "jobs"]))
+    assert list(results) == ["Geico company culture", "Geico job opportunities"]
+    assert tool._peak == 1
+    assert len(tool._queries) == 2
+
+    assert tool._run("Geico", facets=["stock"]).startswith("Error researching company: unknown facets")
+
+
+def test_invoke_with_structured_input():
+    result = json.loads(CompanyResearchTool().invoke({"company_name": "Stripe", "facets": ["news"]}))
+    assert list(result) == ["Stripe recent news"]
+
+
+def test_sync_run_inside_a_running_event_loop():
+    async def caller():
+        return SlowResearchTool(query_timeout=1)._run("Geico", facets=["jobs"])
+
+    assert list(json.loads(asyncio.run(caller()))) == ["Geico job opportunities"]
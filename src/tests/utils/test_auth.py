@@ -0,0 +1,161 @@
+"""
+Tests for cached Supabase token verification, using a local stand-in for the Supabase auth endpoint.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import jwt as pyjwt
+import pytest
+
+from proximaai.utils import auth
+
+SECRET = "test-secret-with-at-least-32-bytes!!"
+
+
+def make_token(sub: str = "user-1", exp_in: int = 3600, secret: str = SECRET) -> str:
+    return pyjwt.encode({"sub": sub, "aud": "authenticated", "exp": int(time.time()) + exp_in}, secret, algorithm="HS256")
+
+
+class FakeSupabaseAuth(BaseHTTPRequestHandler):
+    calls = 0
+    valid_tokens: dict[str, str] = {}
+
+    def do_GET(self):
+        if not self.path.startswith("/auth/v1/user"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        type(self).calls += 1
+        token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+        user_id = self.valid_tokens.get(token)
+        if user_id is None:
+            body, code = {"code": 401, "msg": "invalid JWT"}, 401
+        else:
+            body, code = {
+                "id": user_id,
+                "aud": "authenticated",
+                "app_metadata": {},
+                "user_metadata": {},
+                "created_at": "2024-01-01T00:00:00Z",
+            }, 200
+        payload = json.dumps(body).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def supabase_stub(monkeypatch):
+    server = HTTPServer(("127.0.0.1", 0), FakeSupabaseAuth)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    FakeSupabaseAuth.calls = 0
+    FakeSupabaseAuth.valid_tokens = {}
+    monkeypatch.setattr(auth, "url", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(auth, "key", make_token(sub="service"))
+    monkeypatch.setattr(auth, "verify_mode", "remote")
+    monkeypatch.setattr(auth, "_supabase", None)
+    monkeypatch.setattr(auth, "token_cache", auth.TokenCache())
+    yield FakeSupabaseAuth
+    server.shutdown()
+
+
+def test_remote_verification_is_cached(supabase_stub):
+    token = make_token()
+    supabase_stub.valid_tokens[token] = "user-1"
+
+    async def run():
+        return [await auth.is_valid_key(f"Bearer {token}".encode()) for _ in range(5)]
+
+    results = asyncio.run(run())
+    assert results == [(True, "user-1")] * 5
+    assert supabase_stub.calls == 1
+    assert auth.token_cache.hits == 4
+
+
+def test_invalid_token_not_cached(supabase_stub):
+    token = make_token(sub="intruder")
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(auth.Auth.exceptions.HTTPException):
+                await auth.is_valid_key(f"Bearer {token}")
+
+    asyncio.run(run())
+    assert supabase_stub.calls == 2
+    assert len(auth.token_cache) == 0
+
+
+def test_cache_entry_capped_at_exp():
+    cache = auth.TokenCache(ttl=300)
+    cache.set("token", (True, "user-1"), exp=time.time() - 1)
+    assert cache.get("token") is None
+    cache.set("token", (True, "user-1"), exp=time.time() + 60)
+    assert cache.get("token") == (True, "user-1")
+
+
+def test_local_hs256_verification(monkeypatch):
+    monkeypatch.setattr(auth, "verify_mode", "local")
+    monkeypatch.setattr(auth, "jwt_secret", SECRET)
+    monkeypatch.setattr(auth, "token_cache", auth.TokenCache())
+
+    async def run():
+        assert await auth.is_valid_key(f"Bearer {make_token()}") == (True, "user-1")
+        with pytest.raises(auth.Auth.exceptions.HTTPException):
+            await auth.is_valid_key(f"Bearer {make_token(secret='another-secret-with-at-least-32-bytes')}")
+        with pytest.raises(auth.Auth.exceptions.HTTPException):
+            await auth.is_valid_key(f"Bearer {make_token(exp_in=-10)}")
+
+    asyncio.run(run())
+
+
+def hmac_token(alg: str, claims: dict) -> str:
+    """HS256-signed token whose header claims `alg`."""
+    segments = [pyjwt.utils.base64url_encode(json.dumps(part).encode()) for part in ({"alg": alg, "typ": "JWT"}, claims)]
+    signing_input = b".".join(segments)
+    signature = hmac.new(SECRET.encode(), signing_input, hashlib.sha256).digest()
+    return b".".join([signing_input, pyjwt.utils.base64url_encode(signature)]).decode()
+
+
+@pytest.mark.filterwarnings("ignore::jwt.warnings.InsecureKeyLengthWarning")
+def test_local_verification_pins_algorithms(monkeypatch):
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    monkeypatch.setattr(auth, "verify_mode", "local")
+    monkeypatch.setattr(auth, "jwt_secret", SECRET)
+    monkeypatch.setattr(auth, "token_cache", auth.TokenCache())
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = pyjwt.PyJWK(json.loads(pyjwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key())), algorithm="RS256")
+
+    class StubJWKS:
+        def get_signing_key_from_jwt(self, token):
+            return jwk
+
+    monkeypatch.setattr(auth, "_jwks_client", StubJWKS())
+    claims = {"sub": "user-1", "aud": "authenticated", "exp": int(time.time()) + 3600}
+
+    async def run():
+        assert await auth.is_valid_key(f"Bearer {pyjwt.encode(claims, private_key, algorithm='RS256')}") == (True, "user-1")
+        forged = [
+            pyjwt.encode(claims, SECRET, algorithm="HS512"),  # secret path only accepts HS256
+            hmac_token("RS256", claims),  # claims RS256 but is HMAC-signed
+            pyjwt.encode(claims, private_key, algorithm="PS256"),  # JWKS path uses the key's algorithm
+            pyjwt.encode(claims, None, algorithm="none"),
+        ]
+        for token in forged:
+            with pytest.raises(auth.Auth.exceptions.HTTPException) as raised:
+                await auth.is_valid_key(f"Bearer {token}")
+            assert raised.value.status_code == 401
+
+    asyncio.run(run())
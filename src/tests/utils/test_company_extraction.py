@@ -0,0 +1,53 @@
+"""
+Tests for company/role extraction and cache-key normalization.
+"""
+
+from proximaai.utils.company_extraction import CompanyTarget, canonical_company, extract_target
+
+
+def test_extracts_company_and_role():
+    target = extract_target("Please tailor my resume for the Senior Data Scientist role at Geico.")
+    assert target == CompanyTarget(company="Geico", role="Senior Data Scientist")
+    assert target.cache_key == "geico"
+
+    target = extract_target("Company: Goldman Sachs\nPosition: Quant Analyst\nWe are looking for...")
+    assert target.cache_key == "goldman-sachs"
+    assert CompanyTarget("GEICO Corp.", "Analyst").cache_key == CompanyTarget("Geico", "Actuary").cache_key
+
+
+def test_canonical_company_drops_case_punctuation_and_suffixes():
+    assert canonical_company("GEICO Corp.") == canonical_company("Geico") == "geico"
+    assert canonical_company("Acme, Inc.") == "acme"
+    assert canonical_company("Bank of America") == "bank-of-america"
+
+
+def test_no_company_returns_none():
+    assert extract_target("make my resume better") is None
+    assert extract_target("") is None
+
+
+def test_names_stop_at_sentence_boundaries():
+    demo = ("I want to apply for a job at Meta. I have a resume that I need to optimize for the job and understand "
+            "if I meet all qualifications.\nGoogle's job description is:ML Engineer with 3+ years of experience")
+    assert extract_target(demo).cache_key == "meta"
+
+    target = extract_target("tailor my resume to apply to Google. Job description: ML Engineer")
+    assert (target.company, target.role) == ("Google", "")
+    assert extract_target("I have 5 years at Amazon Web Services. Requirements: Python").company == "Amazon Web Services"
+    assert extract_target("At Stripe I built payments.").company == "Stripe"
+    assert extract_target("Company: Acme\nRole: Analyst").company == "Acme"
+
+
+def test_dotted_names_and_roles_without_an_article():
+    assert extract_target("Senior Data Scientist role at Netflix") == CompanyTarget(company="Netflix", role="Senior Data Scientist")
+    assert extract_target("Applying to Amazon.com as a Data Engineer") == CompanyTarget(company="Amazon.com", role="Data Engineer")
+
+
+def test_skills_numbers_and_past_employers_are_not_targets():
+    assert extract_target("looking for a Python developer with 5 years") is None
+    assert extract_target("I have experience with Python and AWS") is None
+    assert extract_target("tailor my resume for Google") is None  # bare "for" is left to the LLM fallback
+    assert extract_target("I have 6 years at Python shops") is None
+    target = extract_target("I worked at Amazon for 4 years, now I want to apply to Netflix as a Data Engineer")
+    assert target == CompanyTarget(company="Netflix", role="Data Engineer")
+    assert extract_target("I'd love to join Stripe as a Backend Engineer").company == "Stripe"
@@ -0,0 +1,96 @@
+"""
+Tests for prompt-prefix cache breakpoints and per-node cache usage accounting.
+"""
+
+from uuid import uuid4
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+from jinja2 import Template
+import pytest
+
+from proximaai.agents.constructor import TextConstructorAgent
+from proximaai.agents.designer import DesignerAgent
+from proximaai.prebuilt.prompt_templates import PromptTemplates, split_prompt
+from proximaai.utils.prompt_cache import CacheUsage, PromptCacheUsage, usage_from_message
+
+
+def cache_marks(message) -> list:
+    return [block.get("cache_control") is not None for block in message.content]
+
+
+def test_split_prompt_moves_the_variable_and_its_label_to_the_suffix():
+    template = Template("Rules:\n- be brief\n\nMarkdown Input:\n{{resume_markdown}}\n\nDo not add a preamble.")
+    prefix, suffix = split_prompt(template, "resume_markdown", "# Jane Doe")
+    assert prefix == "Rules:\n- be brief\n\n\nDo not add a preamble."
+    assert suffix == "Markdown Input:\n# Jane Doe"
+
+    first, request = PromptTemplates.split("LEAD_AGENT", "user_message", "Find ML jobs in Austin")
+    second, _ = PromptTemplates.split("LEAD_AGENT", "user_message", "Tailor my resume for Acme")
+    assert first == second and "Find ML jobs" not in first
+    assert request == "USER REQUEST: Find ML jobs in Austin"
+
+    # A template without the variable has no cacheable prefix
+    assert split_prompt(Template("Rules:\n{% if verbose %}{{resume_markdown}}{% endif %}"), "resume_markdown", "# Jane Doe") == (
+        "", "Rules:"
+    )
+
+
+def test_agents_put_the_stable_prefix_before_the_cache_breakpoint():
+    model = FakeListChatModel(responses=["unused"])
+    system, human = DesignerAgent(query="Target role: ML engineer", resume="Jane Doe - ML Engineer", model=model)._messages()
+    assert cache_marks(system) == [True]
+    assert cache_marks(human) == [True, False]  # resume cached, request after the breakpoint
+    assert "Jane Doe" in human.content[0]["text"] and human.content[1]["text"] == "Target role: ML engineer"
+
+    constructor = TextConstructorAgent(model=model)
+    system, human = constructor._format_prompt("# Jane Doe")
+    assert cache_marks(system) == [True] and "Jane Doe" not in system.text
+    assert system.text == constructor._format_prompt("# John Roe")[0].text
+    assert human.content == "Markdown Input:\n# Jane Doe"
+
+    system, human = TextConstructorAgent(model=model, prompt_caching=False)._format_prompt("# Jane Doe")
+    assert isinstance(system.content, str)
+
+
+def test_usage_is_recorded_per_node_with_cache_reads_and_writes():
+    now = [0.0]
+    usage = PromptCacheUsage(clock=lambda: now[0])
+
+    def call(node, input_tokens, read, write, seconds):
+        run_id = uuid4()
+        usage.on_chat_model_start({}, [[]], run_id=run_id, metadata={"langgraph_node": node})
+        now[0] += seconds
+        message = AIMessage(content="", usage_metadata={
+            "input_tokens": input_tokens, "output_tokens": 100, "total_tokens": input_tokens + 100,
+            "input_token_details": {"cache_read": read, "cache_creation": write},
+        })
+        usage.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id)
+
+    call("resume_designer", 3000, 0, 2500, 4.0)
+    call("resume_designer", 3100, 2500, 0, 3.0)
+    call("text_constructor_format", 1500, 0, 0, 2.0)
+
+    designer = usage.nodes["resume_designer"]
+    assert (designer.calls, designer.cache_read_tokens, designer.cache_write_tokens) == (2, 2500, 2500)
+    assert designer.latency_seconds == pytest.approx(7.0)
+    assert usage.metrics()["text_constructor_format"]["cache_hit_ratio"] == 0.0
+    assert usage.total().input_tokens == 7600
+    usage.reset()
+    assert usage.nodes == {}
+
+
+def test_cost_bills_cache_writes_at_a_premium_and_reads_at_a_tenth():
+    usage = CacheUsage(calls=2, input_tokens=2_000_000, cache_read_tokens=1_000_000, cache_write_tokens=500_000)
+    # 0.5M uncached + 0.5M * 1.25 + 1M * 0.1 = 1.225M billed input tokens at $3/MTok
+    assert usage.cost() == pytest.approx(3.675)
+    assert usage.uncached_cost() == pytest.approx(6.0)
+    assert usage.to_dict()["savings_usd"] == pytest.approx(2.325)
+
+    split_writes = AIMessage(content="", usage_metadata={
+        "input_tokens": 10, "output_tokens": 1, "total_tokens": 11,
+        "input_token_details": {"cache_creation": 0, "ephemeral_5m_input_tokens": 7},
+    })
+    assert usage_from_message(split_writes).cache_write_tokens == 7
+    assert usage_from_message(AIMessage(content="")) is None
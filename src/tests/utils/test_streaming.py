@@ -0,0 +1,28 @@
+"""
+Tests for incremental decoding of a JSON string field from streamed fragments.
+"""
+
+import json
+
+from proximaai.utils.streaming import JsonStringFieldStream
+
+
+def decode_in_pieces(text: str, field: str, size: int) -> str:
+    stream = JsonStringFieldStream(field)
+    return "".join(stream.feed(text[i:i + size]) for i in range(0, len(text), size))
+
+
+def test_decodes_the_field_across_any_fragment_boundaries():
+    value = 'Line "one"\n\t- naïve résumé \\ 🚀 done'
+    text = json.dumps({"other": "skip \"me\"", "text": value, "after": "ignored"}, ensure_ascii=False)
+    ascii_text = json.dumps({"text": value})  # \uXXXX escapes, including a surrogate pair
+    for size in (1, 2, 5, 64):
+        assert decode_in_pieces(text, "text", size) == value
+        assert decode_in_pieces(ascii_text, "text", size) == value
+
+
+def test_stops_at_the_closing_quote():
+    stream = JsonStringFieldStream("text")
+    assert stream.feed('{"text": "ab') == "ab"
+    assert stream.feed('c", "reasoning": "xyz"}') == "c"
+    assert stream.done and stream.feed("more") == ""
@@ -0,0 +1,33 @@
+"""
+Tests for chunked base64 decoding into spooled uploads.
+"""
+
+import base64
+import hashlib
+import os
+
+import pytest
+
+from proximaai.utils.uploads import UploadTooLarge, spool_base64
+
+
+def test_spool_base64_roundtrip_and_rollover():
+    payload = os.urandom(300_001)
+    encoded = base64.b64encode(payload).decode()
+    # Simulate MIME-style line wrapping in the payload
+    wrapped = "\n".join(encoded[i:i + 76] for i in range(0, len(encoded), 76))
+
+    upload = spool_base64(wrapped, max_bytes=1024 * 1024, spool_max_bytes=64 * 1024, chunk_chars=10_001)
+    try:
+        assert upload.read() == payload
+        assert upload.size == len(payload)
+        assert upload.digest == hashlib.sha256(payload).hexdigest()
+        assert upload.rolled_to_disk
+    finally:
+        upload.close()
+
+
+def test_spool_base64_rejects_oversized_before_decoding():
+    encoded = base64.b64encode(b"x" * 4096).decode()
+    with pytest.raises(UploadTooLarge):
+        spool_base64(encoded, max_bytes=1024)